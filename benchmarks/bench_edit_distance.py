@@ -0,0 +1,66 @@
+"""bench_edit_distance.py
+
+Measures the time taken by ``utils.get_similar_words()`` to find the
+keys of a large dict similar to a missing key, as done for a ``KeyError``,
+when comparing the missing key with every key, and when removing in bulk
+the keys which cannot be similar, with and without NumPy.
+
+Usage::
+
+    python benchmarks/bench_edit_distance.py [--keys 100000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from friendly_traceback import edit_distance, utils  # noqa: E402
+
+PARTS = ["feature", "flag", "enable", "timeout", "retry", "cache", "size", "user"]
+
+
+def make_keys(nb_keys, rng):
+    """Keys similar to those of configuration or feature-flag maps."""
+    keys = set()
+    while len(keys) < nb_keys:
+        keys.add("_".join(rng.sample(PARTS, 3)) + f"_{rng.randint(0, 9999)}")
+    return sorted(keys)
+
+
+def measure(typos, keys, min_bulk_size, use_numpy):
+    edit_distance.min_bulk_size = min_bulk_size
+    edit_distance.use_numpy = use_numpy
+    results = []
+    start = time.perf_counter()
+    for typo in typos:
+        results.append(utils.get_similar_words(typo, keys))
+    return (time.perf_counter() - start) * 1000 / len(typos), results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--keys", type=int, default=100_000)
+    parser.add_argument("--typos", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    keys = make_keys(args.keys, rng)
+    typos = [key[:3] + key[4:] for key in rng.sample(keys, args.typos)]
+
+    print(f"{args.keys:,} keys; time per KeyError, in milliseconds:")
+    reference_ms, expected = measure(typos, keys, 10**9, False)
+    print(f"    compared with every key: {reference_ms:9.1f}")
+    choices = [("bulk filter, pure Python", False)]
+    if edit_distance.numpy is not None:
+        choices.append(("bulk filter, NumPy", True))
+    for label, use_numpy in choices:
+        elapsed_ms, results = measure(typos, keys, 0, use_numpy)
+        assert results == expected
+        print(f"    {label + ':':<25}{elapsed_ms:9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""bench_records.py
+
+Compares the time taken to collect the traceback records of deep
+tracebacks by walking the stack once (``TracebackData.collect_records``)
+with the time taken by the previous approach, which walked the
+entire stack twice: once excluding files from Python's standard library
+and once including them.
+
+Usage::
+
+    python benchmarks/bench_records.py
+"""
+import os
+import sys
+import time
+from itertools import dropwhile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from stack_data import BlankLines, Options  # noqa: E402
+
+from friendly_traceback import tb_data  # noqa: E402
+from friendly_traceback.frame_info import FrameInfo  # noqa: E402
+from friendly_traceback.path_info import is_excluded_file  # noqa: E402
+
+DEPTHS = (100, 1_000, 10_000)
+REPEAT = 3
+
+
+def recurse(n):
+    if n <= 1:
+        raise ValueError("bottom")
+    return recurse(n - 1)
+
+
+def get_traceback(depth):
+    try:
+        recurse(depth)
+    except ValueError:
+        return sys.exc_info()
+
+
+def two_walks(tb):
+    """The approach used before records were collected with a single walk."""
+    result = []
+    for python_excluded in (True, False):
+        all_records = list(
+            FrameInfo.stack_data(
+                tb,
+                Options(blank_lines=BlankLines.SINGLE),
+                collapse_repeated_frames=False,
+            )
+        )
+
+        def excluded(record):
+            return is_excluded_file(record.filename, python_excluded=python_excluded)
+
+        records = list(dropwhile(excluded, all_records))
+        records.reverse()
+        records = list(dropwhile(excluded, records))
+        records.reverse()
+        result.append(records)
+    return result
+
+
+def best_time(func, *args):
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    sys.setrecursionlimit(max(DEPTHS) + 1000)
+    print(f"{'frames':>8} {'two walks (ms)':>16} {'single walk (ms)':>18} {'ratio':>7}")
+    for depth in DEPTHS:
+        etype, value, tb = get_traceback(depth)
+        data = tb_data.TracebackData.__new__(tb_data.TracebackData)
+        data.exception_type = etype
+        assert [len(r) for r in two_walks(tb)] == [
+            len(r) for r in data.collect_records(tb)
+        ]
+        old = best_time(two_walks, tb)
+        new = best_time(data.collect_records, tb)
+        print(f"{depth:>8} {old * 1000:>16.1f} {new * 1000:>18.1f} {old / new:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
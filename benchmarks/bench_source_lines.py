@@ -0,0 +1,79 @@
+"""bench_source_lines.py
+
+Compares the time taken, and memory allocated, by repeated calls to
+``linecache.getlines``, as monkeypatched by friendly_traceback, with
+the original ``linecache.getlines`` (``old_getlines``) and with the
+previous monkeypatched version, which returned a new list
+(``lines + ["\\n"]``) for each call.
+``cache.get_source_view()``, used by friendly_traceback itself, is
+included for comparison.
+
+Usage::
+
+    python benchmarks/bench_source_lines.py
+"""
+import linecache
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from friendly_traceback.source_cache import cache, old_getlines  # noqa: E402
+
+SIZES = (100, 1_000, 10_000)
+CALLS = 10_000
+
+
+def previous_get_source_lines(filename, module_globals=None):
+    """The implementation used before the lines were cached."""
+    lines = old_getlines(filename, module_globals=module_globals)
+    if not lines and filename in cache.local_cache:
+        lines = cache.local_cache[filename]
+    if not lines:
+        lines = []
+    return lines + ["\n"]
+
+
+FUNCTIONS = {
+    "old_getlines": old_getlines,
+    "previous": previous_get_source_lines,
+    "getlines": linecache.getlines,
+    "view": cache.get_source_view,
+}
+
+
+def measure(getlines, filename):
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        getlines(filename)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    for _ in range(100):
+        getlines(filename)
+    allocated = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed * 1e6 / CALLS, allocated / 1024
+
+
+def main():
+    print("Time per call (us) / peak memory allocated by 100 calls (KiB)")
+    print(f"{'lines':>7}", end="")
+    for name in FUNCTIONS:
+        print(f" {name:>20}", end="")
+    print()
+    for size in SIZES:
+        filename = f"<bench-source-lines-{size}>"
+        cache.add(filename, "".join(f"x_{n} = {n}\n" for n in range(size)))
+        assert linecache.getlines(filename) == previous_get_source_lines(filename)
+        print(f"{size:>7}", end="")
+        for getlines in FUNCTIONS.values():
+            elapsed, memory = measure(getlines, filename)
+            print(f" {elapsed:>9.2f} / {memory:>8.1f}", end="")
+        print()
+        cache.remove(filename)
+
+
+if __name__ == "__main__":
+    main()
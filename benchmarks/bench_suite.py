@@ -0,0 +1,283 @@
+"""bench_suite.py
+
+Replays the cases used for the tests and for the documentation
+(``tests/runtime/test_*.py``, which are also used by the ``trb_*.py``
+scripts, and the files of ``tests/syntax`` listed in
+``tests/syntax_errors_descriptions.py``) and reports, for each family
+of exceptions:
+
+* the latency of the exception hook (p50, p95, max), as well as
+  that of the first case of the family (``first``), which includes
+  the time needed to import the required parsers and analyzers;
+* the phases where the most time is spent, as measured using
+  ``friendly_traceback.set_instrumentation()``;
+* the peak memory allocated by the exception hook, as measured
+  by ``tracemalloc``.
+
+The time needed to import friendly_traceback is measured in a
+separate process.
+
+The results can be saved as a baseline and later runs compared to it;
+the latter exit with a non-zero status if the p50 or p95 latency
+of a family increases by more than the given tolerance (25% by default)
+and by more than ``--min-delta-ms``, which avoids reporting noise.
+
+Usage::
+
+    python benchmarks/bench_suite.py [--repeat 5] [--families name_error,...]
+    python benchmarks/bench_suite.py --save-baseline benchmarks/baseline.json
+    python benchmarks/bench_suite.py --compare benchmarks/baseline.json
+
+Baselines depend on the computer and Python version used: they should
+only be compared with results obtained on the same computer.
+"""
+import argparse
+import glob
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+TESTS = os.path.join(ROOT, "tests")
+sys.path.insert(0, ROOT)
+# Appended, so that files such as tests/turtle.py do not shadow the stdlib.
+sys.path.extend([TESTS, os.path.join(TESTS, "runtime"), os.path.join(TESTS, "syntax")])
+
+import friendly_traceback  # noqa: E402
+from friendly_traceback.config import session  # noqa: E402
+
+friendly_traceback.set_lang("en")
+
+
+def get_runtime_cases():
+    """Returns a dict whose keys are the families of exceptions (such as
+    ``name_error``) and whose values are lists of callables, each of which
+    calls explain_traceback() for a single case."""
+    families = {}
+    pattern = os.path.join(TESTS, "runtime", "test_*.py")
+    for path in sorted(glob.glob(pattern)):
+        module_name = os.path.basename(path)[:-3]
+        try:
+            module = __import__(module_name)
+        except Exception as e:  # noqa
+            print(f"Skipping {module_name}: {e!r}")
+            continue
+        cases = [
+            getattr(module, name)
+            for name in dir(module)
+            if name.startswith("test") and callable(getattr(module, name))
+        ]
+        families[module_name[len("test_") :]] = cases
+    return families
+
+
+def get_syntax_cases():
+    """Same as get_runtime_cases(), for the files raising a SyntaxError
+    or one of its subclasses."""
+    from syntax_errors_descriptions import descriptions
+
+    families = {}
+    for name in descriptions:
+        try:
+            __import__(name)
+        except SyntaxError as e:
+            family = type(e).__name__
+        except Exception:  # noqa
+            continue
+        else:  # pragma: no cover
+            continue
+
+        def case(name=name):
+            try:
+                __import__(name)
+            except Exception:  # noqa
+                friendly_traceback.explain_traceback(redirect="capture")
+
+        families.setdefault(family, []).append(case)
+    return families
+
+
+@contextmanager
+def measured_hook(latencies):
+    """Records the time taken by each call of the exception hook."""
+    original_hook = session.exception_hook
+
+    def exception_hook(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return original_hook(*args, **kwargs)
+        finally:
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    session.exception_hook = exception_hook
+    try:
+        yield
+    finally:
+        del session.exception_hook
+
+
+def run_case(case):
+    try:
+        case()
+    except KeyboardInterrupt:
+        raise
+    except BaseException:  # noqa  # failed assertions, pytest.skip(), etc.
+        pass
+    friendly_traceback.get_output()
+    # Prevents the records of previous cases from accumulating.
+    session.recorded_tracebacks.clear()
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile."""
+    values = sorted(values)
+    index = max(0, min(len(values) - 1, round(fraction * len(values)) - 1))
+    return values[index]
+
+
+def bench_family(cases, repeat, top_phases):
+    latencies = []
+    with measured_hook(latencies):
+        for case in cases:
+            run_case(case)
+        first = latencies[0] if latencies else 0.0
+        latencies.clear()
+        for _ in range(repeat):
+            for case in cases:
+                run_case(case)
+
+    friendly_traceback.get_instrumentation_stats(reset=True)
+    friendly_traceback.set_instrumentation(enabled=True)
+    for case in cases:
+        run_case(case)
+    friendly_traceback.set_instrumentation(enabled=False)
+    phases = friendly_traceback.get_instrumentation_stats(reset=True)
+
+    tracemalloc.start()
+    peak = 0
+    for case in cases:
+        if hasattr(tracemalloc, "reset_peak"):  # Python 3.9+
+            tracemalloc.reset_peak()
+        run_case(case)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+    tracemalloc.stop()
+
+    if not latencies:
+        return None
+    timed = {name: phase for name, phase in phases.items() if "total_ms" in phase}
+    slowest = sorted(timed.items(), key=lambda item: -item[1]["total_ms"])
+    return {
+        "cases": len(cases),
+        "calls": len(latencies),
+        "first_ms": first,
+        "p50_ms": percentile(latencies, 0.50),
+        "p95_ms": percentile(latencies, 0.95),
+        "max_ms": max(latencies),
+        "peak_kib": peak / 1024,
+        "phases": {
+            name: round(phase["total_ms"] / len(cases), 3)
+            for name, phase in slowest[:top_phases]
+        },
+    }
+
+
+def measure_import_time(repeat=5):
+    """Best wall time, in milliseconds, for importing friendly_traceback
+    in a new process, from which the time to start Python is subtracted."""
+
+    def best(code):
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, "-c", code], check=True, cwd=ROOT)
+            times.append(time.perf_counter() - start)
+        return min(times) * 1000
+
+    return best("import friendly_traceback") - best("pass")
+
+
+def compare(results, baseline, tolerance, min_delta_ms):
+    """Prints the families whose latency increased by more than
+    the tolerance (a fraction of the baseline value) and by more than
+    min_delta_ms, and returns True if there are any."""
+    regressions = []
+    for family, result in results["families"].items():
+        if family not in baseline["families"]:
+            continue
+        for key in ("p50_ms", "p95_ms"):
+            old = baseline["families"][family][key]
+            new = result[key]
+            if new > old * (1 + tolerance) and new - old > min_delta_ms:
+                regressions.append(f"{family}: {key} {old:.2f} -> {new:.2f}")
+    old_import = baseline.get("import_ms")
+    new_import = results.get("import_ms")
+    if old_import and new_import and new_import > old_import * (1 + tolerance):
+        regressions.append(f"import: {old_import:.1f} -> {new_import:.1f} ms")
+    if regressions:
+        print("\nRegressions compared with the baseline:")
+        for line in regressions:
+            print("   ", line)
+    else:
+        print("\nNo regression compared with the baseline.")
+    return bool(regressions)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--families", help="comma separated names to include")
+    parser.add_argument("--top-phases", type=int, default=3)
+    parser.add_argument("--save-baseline", metavar="PATH")
+    parser.add_argument("--compare", metavar="PATH")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--min-delta-ms", type=float, default=0.5)
+    args = parser.parse_args()
+
+    families = get_runtime_cases()
+    families.update(get_syntax_cases())
+    if args.families:
+        selected = set(args.families.split(","))
+        families = {name: cases for name, cases in families.items() if name in selected}
+
+    results = {
+        "python": sys.version.split()[0],
+        "import_ms": measure_import_time(),
+        "families": {},
+    }
+    print(f"Python {results['python']}")
+    print(f"import friendly_traceback: {results['import_ms']:.1f} ms\n")
+    header = (
+        f"{'family':<26}{'cases':>6}{'first':>9}{'p50':>8}{'p95':>8}"
+        f"{'max':>8}{'peak KiB':>10}  slowest phases (ms per case)"
+    )
+    print(header)
+    print("-" * len(header))
+    for family, cases in families.items():
+        result = bench_family(cases, args.repeat, args.top_phases)
+        if result is None:
+            continue
+        results["families"][family] = result
+        phases = ", ".join(f"{name} {ms}" for name, ms in result["phases"].items())
+        print(
+            f"{family:<26}{result['cases']:>6}{result['first_ms']:>9.2f}"
+            f"{result['p50_ms']:>8.2f}{result['p95_ms']:>8.2f}"
+            f"{result['max_ms']:>8.2f}{result['peak_kib']:>10.0f}  {phases}"
+        )
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nBaseline saved in {args.save_baseline}")
+    if args.compare:
+        with open(args.compare, encoding="utf8") as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.tolerance, args.min_delta_ms):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
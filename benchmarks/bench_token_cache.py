@@ -0,0 +1,87 @@
+"""bench_token_cache.py
+
+Counts how many times a source is tokenized while explaining each
+exception of the tests/syntax and tests/runtime corpora, and how many
+tokenizations are saved by token_utils.token_cache. The cache is cleared
+before each exception, so that only the savings within a single
+explanation are counted.
+
+Usage::
+
+    python benchmarks/bench_token_cache.py
+"""
+import glob
+import os
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+TESTS = os.path.join(ROOT, "tests")
+sys.path.insert(0, ROOT)
+sys.path.extend([TESTS, os.path.join(TESTS, "runtime"), os.path.join(TESTS, "syntax")])
+
+from syntax_errors_descriptions import descriptions  # noqa: E402
+
+import friendly_traceback  # noqa: E402
+from friendly_traceback.config import session  # noqa: E402
+from friendly_traceback.token_utils import token_cache  # noqa: E402
+
+friendly_traceback.set_lang("en")
+
+
+def syntax_cases():
+    for name in descriptions:
+
+        def case(name=name):
+            try:
+                __import__(name)
+            except SyntaxError:
+                friendly_traceback.explain_traceback(redirect="capture")
+
+        yield name, case
+
+
+def runtime_cases():
+    for path in sorted(glob.glob(os.path.join(TESTS, "runtime", "test_*.py"))):
+        module = __import__(os.path.basename(path)[:-3])
+        for name in dir(module):
+            if name.startswith("test") and callable(getattr(module, name)):
+                yield name, getattr(module, name)
+
+
+def count(title, cases):
+    requests = tokenizations = nb_cases = 0
+    most_saved = (0, "")
+    start = time.perf_counter()
+    for name, case in cases:
+        token_cache.clear()
+        try:
+            case()
+        except KeyboardInterrupt:
+            raise
+        except BaseException:  # noqa  # failed assertions, pytest.skip(), etc.
+            pass
+        friendly_traceback.get_output()
+        session.recorded_tracebacks.clear()
+        stats = token_cache.get_stats()
+        nb_cases += 1
+        requests += stats["requests"]
+        tokenizations += stats["tokenizations"]
+        most_saved = max(most_saved, (stats["saved"], name))
+    elapsed = time.perf_counter() - start
+
+    print(f"\n{title}: {nb_cases} cases in {elapsed:.2f} s")
+    print(f"    sources whose tokens were needed: {requests / nb_cases:.2f} per case")
+    print(f"    actual tokenizations: {tokenizations / nb_cases:.2f} per case")
+    saved = (requests - tokenizations) / nb_cases
+    print(f"    saved by the cache: {saved:.2f} per case")
+    print(f"    most saved for a single case: {most_saved[0]} ({most_saved[1]})")
+
+
+def main():
+    count("tests/syntax", syntax_cases())
+    count("tests/runtime", runtime_cases())
+
+
+if __name__ == "__main__":
+    main()
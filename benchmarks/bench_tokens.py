@@ -0,0 +1,106 @@
+"""bench_tokens.py
+
+Compares the time taken and the memory used to tokenize a 10,000 line
+file, and to compare the resulting tokens with string literals as done
+by the analyzers, using token_utils.Token (slotted, with interned strings)
+and a copy of the Token class as it was before these changes.
+
+Usage::
+
+    python benchmarks/bench_tokens.py
+"""
+import os
+import sys
+import time
+import tokenize as py_tokenize
+import tracemalloc
+from io import StringIO
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from friendly_traceback import token_utils  # noqa: E402
+
+NB_LINES = 10_000
+REPEAT = 3
+
+
+class PreviousToken:
+    """token_utils.Token before __slots__ and interned strings were used."""
+
+    def __init__(self, token):
+        self.type = token[0]
+        self.string = token[1]
+        self.start = self.start_row, self.start_col = token[2]
+        self.end = self.end_row, self.end_col = token[3]
+        self.line = token[4]
+
+    def __eq__(self, other):
+        return self.string == str(other)
+
+
+def make_source():
+    lines = []
+    for n in range(NB_LINES // 5):
+        lines.extend(
+            [
+                f"def function_{n}(argument, other=None):",
+                f"    result = [item * {n} for item in argument if item]",
+                "    if other is not None and len(result) > 2:",
+                "        return result[0] + other",
+                "    return {'key': result, 'value': (1, 2.5, 'text')}",
+            ]
+        )
+    return "\n".join(lines) + "\n"
+
+
+def make_tokens(token_class, source):
+    return [
+        token_class(tok)
+        for tok in py_tokenize.generate_tokens(StringIO(source).readline)
+    ]
+
+
+def compare(tokens):
+    nb = 0
+    for tok in tokens:
+        if tok == "(" or tok == "if" or tok == "return" or tok == ":":
+            nb += 1
+    return nb
+
+
+def best_time(func, *args):
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def memory(token_class, source):
+    raw_tokens = list(py_tokenize.generate_tokens(StringIO(source).readline))
+    tracemalloc.start()
+    tokens = [token_class(tok) for tok in raw_tokens]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return len(tokens), size / 1024 / 1024
+
+
+def main():
+    source = make_source()
+    print(f"{NB_LINES} lines")
+    print(f"{'':>10} {'tokenize (ms)':>14} {'compare (ms)':>13} {'tokens MiB':>11}")
+    for title, token_class in (
+        ("previous", PreviousToken),
+        ("slotted", token_utils.Token),
+    ):
+        tokenize_ms = best_time(make_tokens, token_class, source)
+        tokens = make_tokens(token_class, source)
+        compare_ms = best_time(compare, tokens)
+        nb_tokens, mib = memory(token_class, source)
+        print(f"{title:>10} {tokenize_ms:>14.1f} {compare_ms:>13.2f} {mib:>11.2f}")
+    print(f"({nb_tokens} tokens)")
+
+
+if __name__ == "__main__":
+    main()
@@ -38,10 +38,20 @@ __version__ = "0.7.47"
 import inspect
 from pathlib import Path
 
-from . import base_formatters, debug_helper, editors_helpers, info_variables, path_info
-from .about_warnings import enable_warnings  # noqa
-from .about_warnings import IGNORE_WARNINGS
-from .config import session
+# The modules used to analyze exceptions, as well as the third-party
+# packages they require, are only imported when they are first needed,
+# usually when an exception is explained.
+from . import (
+    base_formatters,
+    debug_helper,
+    editors_helpers,
+    explanation_cache,
+    instrumentation,
+    path_info,
+    preloading,
+    source_cache,
+)
+from .config import _UNCHANGED, session
 from .ft_gettext import current_lang
 from .source_cache import friendly_exec  # noqa
 from .typing_info import Formatter, InclusionChoice, StrPath, Writer
@@ -66,9 +76,25 @@ def add_ignored_warnings(do_not_show_warning: Callable) -> None:
     This is intended for third-party packages that might trigger warnings
     which should not be shown to a user of friendly_traceback.
     """
+    from .about_warnings import IGNORE_WARNINGS
+
     IGNORE_WARNINGS.add(do_not_show_warning)
 
 
+def enable_warnings(testing: bool = False) -> None:
+    """Used to enable all warnings, with 'always' being used as the
+    parameter for warnings.simplefilter.
+
+    While friendly_traceback, used by many third-party packages, does not
+    automatically handle warnings by default, friendly, which is meant to
+    be used by end-users instead of other packages/libraries, does call
+    enable_warnings by default.
+    """
+    from . import about_warnings
+
+    about_warnings.enable_warnings(testing=testing)
+
+
 def exclude_file_from_traceback(full_path: StrPath) -> None:
     """Exclude a file from appearing in a traceback generated by
     Friendly.
@@ -115,6 +141,8 @@ def hide_secrets(patterns: Union[List, None] = None) -> None:
 
         patterns: a list of regular expression patterns.
     """
+    from . import info_variables
+
     info_variables.confidential.hide_confidential_information(patterns=patterns)
 
 
@@ -135,6 +163,8 @@ def test_secrets(name: str = ""):
         )
         return
     obj = frame.f_locals[name]
+    from . import info_variables
+
     return info_variables.format_var_info(name, obj)
 
 
@@ -153,6 +183,9 @@ def install(
     lang: Optional[str] = None,
     redirect: Union[str, Writer, None] = None,
     include: InclusionChoice = "explain",
+    max_explained: Optional[int] = None,
+    sampling_window: Optional[float] = None,
+    max_explain_ms: Optional[float] = None,
     _debug: Optional[bool] = False,
 ) -> None:
     """
@@ -167,13 +200,52 @@ def install(
                   The default is ``sys.stderr``.
         include: controls the amount of information displayed.
                  See ``set_include()`` for details.
+        max_explained: if specified, maximum number of times identical
+                 exceptions are fully explained during a time window.
+                 See ``set_sampling()`` for details.
+        sampling_window: duration, in seconds, of the time window used
+                 with ``max_explained``; the default is 60 seconds.
+        max_explain_ms: if specified, time budget for each explanation.
+                 See ``set_max_explain_time()`` for details.
         _debug: optional argument that can be used to enable some debugging
                 features.
 
     """
     if _debug:  # Note that the debugging mode can be set via other methods
         debug_helper.DEBUG = _debug
-    session.install(lang=lang, redirect=redirect, include=include)
+    session.install(
+        lang=lang,
+        redirect=redirect,
+        include=include,
+        max_explained=max_explained,
+        sampling_window=sampling_window,
+        max_explain_ms=max_explain_ms,
+    )
+
+
+def warmup(
+    exception_types: Optional[Sequence[type]] = None,
+    langs: Optional[Sequence[str]] = None,
+    prefork: bool = False,
+) -> None:
+    """Loads ahead of time what is otherwise loaded when the first exception
+    of a given type is explained, so that this first explanation is not much
+    slower than the following ones.
+
+    Args:
+        exception_types: the exception (or warning) types whose parsers and
+            analyzers are loaded; by default, all the types for which
+            friendly_traceback has specific explanations.
+        langs: the languages whose translations are loaded; by default,
+            the current language.
+        prefork: if True, all the objects then existing are also excluded
+            from garbage collection using ``gc.freeze()``. This is meant to be
+            done right before forking worker processes, so that the memory
+            they use remains shared with the parent process.
+    """
+    preloading.preload(exception_types=exception_types, langs=langs)
+    if prefork:
+        preloading.freeze()
 
 
 def is_installed() -> bool:
@@ -377,6 +449,190 @@ def get_stream() -> Writer:
     return session.write_err
 
 
+def set_retention(
+    max_entries: Optional[int] = _UNCHANGED,
+    max_bytes: Optional[int] = _UNCHANGED,
+    detach: bool = _UNCHANGED,
+) -> None:
+    """Limits the information kept about previous exceptions and warnings,
+    which can be shown again using ``explain()``, ``where()``, etc.
+    Once a limit is exceeded, the oldest records are discarded.
+    Settings which are not specified are left unchanged; by default,
+    there is no limit and tracebacks are not detached.
+
+    Args:
+        max_entries: maximum number of records kept; ``None`` means no limit.
+        max_bytes: maximum estimated size, in bytes, of the information kept;
+            ``None`` means no limit. The most recent record is always kept.
+        detach: if ``True``, references to frames (and thus to the values
+            of all variables), tracebacks and exceptions are dropped as soon
+            as the information for the current ``include`` choice has been
+            obtained. Information that was not needed at that time
+            will not be available afterwards.
+    """
+    session.set_retention(max_entries=max_entries, max_bytes=max_bytes, detach=detach)
+
+
+def get_retention_footprint() -> Dict[str, Optional[int]]:
+    """Returns a dict describing the records kept about previous exceptions
+    and warnings: their number (``"entries"``), how many still keep
+    references to frames (``"attached"``), their estimated size in bytes
+    (``"estimated_bytes"``) as well as the limits set by ``set_retention()``.
+    """
+    return session.get_retention_footprint()
+
+
+def set_source_cache_limits(
+    max_entries: Optional[int] = None, max_bytes: Optional[int] = None
+) -> None:
+    """Limits the sources kept in friendly_traceback's own cache, which
+    contains the code run using ``friendly_exec()`` or entered in
+    the friendly console. Once a limit is exceeded, the least recently used
+    sources are removed, except for those needed to explain
+    the exceptions and warnings recorded (see ``set_retention()``).
+
+    Args:
+        max_entries: maximum number of sources; ``None`` means no limit.
+        max_bytes: maximum total size of the sources, measured as
+            a number of characters; ``None`` means no limit.
+    """
+    source_cache.cache.set_limits(max_entries=max_entries, max_bytes=max_bytes)
+
+
+def get_source_cache_stats() -> Dict[str, Optional[int]]:
+    """Returns a dict giving the number of sources (``"entries"``) in
+    friendly_traceback's own cache, their ``"total_size"``, the limits set
+    by ``set_source_cache_limits()`` and the number of ``"evictions"``.
+    """
+    return source_cache.cache.get_stats()
+
+
+def set_explanation_cache(max_size: int = 0) -> None:
+    """Sets the maximum number of explanations kept in a cache so that
+    they do not need to be found again when the same exception is raised
+    at the same location. A value of 0 (the default) disables the cache.
+
+    Note that the explanation of some exceptions may refer to values
+    of variables, for example the length of a list; when the cache is used,
+    these are the values from the first occurrence of the exception.
+    """
+    explanation_cache.explanation_cache.set_max_size(max_size)
+
+
+def get_explanation_cache_stats() -> Dict[str, int]:
+    """Returns a dict giving the number of ``"entries"`` in the explanation
+    cache, its ``"max_size"`` and the number of ``"hits"`` and ``"misses"``.
+    """
+    return explanation_cache.explanation_cache.get_stats()
+
+
+def set_max_explain_time(max_explain_ms: Optional[float] = None) -> None:
+    """Sets a time budget, in milliseconds, for finding the explanation
+    of an exception intercepted by the exception hook. Once it is exceeded,
+    the parts of the explanation which have not been found yet are not
+    included; a note indicating what was left out is written instead.
+    They can still be obtained afterwards, without time limit, using
+    ``what()``, ``why()``, ``where()``, etc.
+
+    ``None`` (the default) removes the time limit.
+    """
+    session.max_explain_ms = max_explain_ms
+
+
+def set_instrumentation(
+    enabled: bool = True,
+    callback: Optional[Callable[[str, float, Optional[bool]], None]] = None,
+) -> None:
+    """Enables (or disables) measuring the time spent in the various phases
+    of the analysis of an exception.
+
+    Args:
+        enabled: whether the measurements are taken.
+        callback: if specified, it is called after each measurement as
+            ``callback(name, elapsed_ms, matched)``, where ``name`` identifies
+            the phase and ``matched`` indicates, for a message parser or
+            a SyntaxError analyzer, if it found the cause of the exception;
+            ``matched`` is ``None`` for other phases.
+
+    Aggregated measurements are obtained using ``get_instrumentation_stats()``.
+    """
+    instrumentation.instrumentation.configure(enabled=enabled, callback=callback)
+
+
+def get_instrumentation_stats(reset: bool = False) -> Dict[str, Dict[str, Any]]:
+    """Returns a dict whose keys are the names of the phases which have been
+    measured, such as ``"tb_data.records"``, ``"section:cause"`` or
+    ``"message_parser:runtime_errors.name_error.name_not_defined"``,
+    and whose values are dicts giving the number of ``"calls"``, their
+    ``"total_ms"`` and ``"max_ms"`` durations and, for message parsers and
+    SyntaxError analyzers, the number of times they found the cause
+    (``"matches"``). If ``reset`` is True, the measurements are then removed.
+
+    Some numbers are also recorded for each exception, with the
+    ``"total"`` and ``"max"`` of their values instead of durations:
+    ``"message_analyzers:tried"`` is the number of SyntaxError message
+    analyzers called, and ``"message_analyzers:in_order"`` the number
+    which would have been called if they were all tried in order;
+    ``"statement_analyzers:tried"`` and ``"statement_analyzers:in_order"``
+    are the same for the analyzers of statements with an invalid syntax.
+    """
+    stats = instrumentation.instrumentation.get_stats()
+    if reset:
+        instrumentation.instrumentation.reset()
+    return stats
+
+
+def set_sampling(
+    max_explained: Optional[int] = None,
+    window: float = 60.0,
+    reduced_include: InclusionChoice = "python_tb",
+) -> None:
+    """Limits the number of times identical exceptions, raised at the same
+    location with the same message, are fully explained by the exception hook.
+
+    Args:
+        max_explained: number of occurrences fully explained during a time
+            window; ``None`` (the default) removes this limit.
+        window: duration of the time window, in seconds. When an exception
+            is raised after its window has ended, a new window begins and
+            the number of occurrences not fully explained is reported.
+            This number is only reported at that time: it is not shown
+            if the exception is not raised again.
+        reduced_include: what is shown for the other occurrences;
+            see ``set_include()`` for the possible values.
+    """
+    session.set_sampling(
+        max_explained=max_explained, window=window, reduced_include=reduced_include
+    )
+
+
+# Submodules, and names, which used to be imported with the package;
+# they are now imported when they are first used (PEP 562).
+_LAZY_SUBMODULES = {
+    "about_warnings",
+    "core",
+    "frame_info",
+    "info_generic",
+    "info_variables",
+    "message_parser",
+    "syntax_errors",
+    "tb_data",
+    "token_utils",
+    "utils",
+}
+_LAZY_NAMES = {"IGNORE_WARNINGS": "about_warnings"}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_NAMES.get(name, name)
+    if module_name not in _LAZY_SUBMODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Unlike importlib.import_module(), __import__() is seen by -X importtime.
+    __import__(f"{__name__}.{module_name}")
+    module = sys.modules[f"{__name__}.{module_name}"]
+    return module if module_name == name else getattr(module, name)
+
+
 del Any, Callable, Dict, Mapping, Optional, Sequence, Union
 del Formatter, InclusionChoice, StrPath, Writer
 del valid_version
@@ -38,8 +38,8 @@ def enable_warnings(testing: bool = False) -> None:
     be used by end-users instead of other packages/libraries, does call
     enable_warnings by default.
     """
-    # Note: enable_warnings is imported by friendly_traceback.__init__
-    # so that it is part of the public API.
+    # Note: friendly_traceback.__init__ has a function enable_warnings,
+    # part of the public API, which imports this module and calls this function.
     global _RUNNING_TESTS
     _RUNNING_TESTS = testing
     warnings.simplefilter("always")
@@ -52,6 +52,8 @@ class MyFormatter(Formatter):
 
 
 class WarningInfo:
+    detached = False
+
     def __init__(
         self, warning_instance, warning_type, filename, lineno, frame=None, lines=None
     ):
@@ -96,6 +98,13 @@ class WarningInfo:
 
         self.info.update(**get_warning_cause(self.warning_type, self.message, self))
 
+    def detach(self):
+        """Drops the references to the frame and the warning instance;
+        see FriendlyTraceback.detach()"""
+        self.frame = None
+        self.warning_instance = None
+        self.detached = True
+
     def format_source(self):
         nb_digits = len(str(self.lineno))
         lineno_fmt_string = "{:%d}| " % nb_digits  # noqa
@@ -199,6 +208,8 @@ def show_warning(
     message = str(warning_instance)
 
     if not _RUNNING_TESTS:
+        if session.detach_tracebacks:
+            warning_data.detach()
         session.recorded_tracebacks.append(warning_data)
     elif "cause" in warning_data.info:
         # We know how to explain this; we do not print while running tests
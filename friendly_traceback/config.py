@@ -4,14 +4,17 @@ Keep tabs of all settings.
 """
 import sys
 import types
-from typing import List, Optional, Type, Union
+from typing import Any, Dict, List, Optional, Type, Union
 
-from . import base_formatters, core, debug_helper
+from . import base_formatters, debug_helper, sampling, time_budget
 from .ft_gettext import current_lang
 from .typing_info import _E, Formatter, InclusionChoice, Info, Writer
 
 _ = current_lang.translate
 
+# Default value of parameters for settings which are left unchanged
+_UNCHANGED: Any = object()
+
 
 def _write_err(text: Optional[str]) -> None:  # pragma: no cover
     """Default writer"""
@@ -24,6 +27,63 @@ def _write_err(text: Optional[str]) -> None:  # pragma: no cover
     sys.stderr.write(text)
 
 
+def estimate_size(obj: Any) -> int:
+    """Estimates the memory used by the information recorded about an
+    exception or a warning. Only strings, and containers of strings, are
+    taken into account; they are what is kept once a traceback is detached.
+    """
+    if isinstance(obj, str):
+        return sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        # dict.values is used so that lazily computed items are not computed
+        return sys.getsizeof(obj) + sum(estimate_size(v) for v in dict.values(obj))
+    if isinstance(obj, (list, tuple)):
+        return sys.getsizeof(obj) + sum(estimate_size(item) for item in obj)
+    return 0
+
+
+class RecordedTracebacks(list):
+    """List of the recorded tracebacks and warnings, used as a ring buffer:
+    when one of the limits is exceeded, the oldest items are discarded.
+
+    The most recent item is always kept.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.max_entries: Optional[int] = None
+        self.max_bytes: Optional[int] = None
+
+    def append(self, item: Any) -> None:
+        super().append(item)
+        self.enforce_limits()
+
+    def enforce_limits(self) -> None:
+        """Discards the oldest items until the limits are satisfied."""
+        if self.max_entries is not None and len(self) > self.max_entries:
+            del self[: len(self) - max(self.max_entries, 1)]
+        if self.max_bytes is None:
+            return
+        sizes = [estimate_size(item.info) for item in self]
+        total = sum(sizes)
+        nb_removed = 0
+        while total > self.max_bytes and nb_removed < len(sizes) - 1:
+            total -= sizes[nb_removed]
+            nb_removed += 1
+        del self[:nb_removed]
+
+    def get_footprint(self) -> Dict[str, Optional[int]]:
+        """Returns information about the items currently retained."""
+        attached = [item for item in self if not getattr(item, "detached", False)]
+        return {
+            "entries": len(self),
+            "attached": len(attached),
+            "estimated_bytes": sum(estimate_size(item.info) for item in self),
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+        }
+
+
 class _State:
     """Keeping track of various parameters in a single object meant
     to be instantiated only once.
@@ -34,7 +94,12 @@ class _State:
         self.write_err: Writer = _write_err
         self.installed: bool = False
         self.formatter: Formatter = base_formatters.repl
-        self.recorded_tracebacks: List[core.FriendlyTraceback] = []
+        self.recorded_tracebacks = RecordedTracebacks()
+        # If True, references to frames, etc., are dropped once the
+        # information about a traceback has been computed.
+        self.detach_tracebacks: bool = False
+        self.sampler = sampling.Sampler()
+        self.max_explain_ms: Optional[float] = None
         self.include: InclusionChoice = "explain"
         self.lang: str = "en"
         self.install_gettext(self.lang)
@@ -125,6 +190,34 @@ class _State:
     def get_include(self) -> InclusionChoice:
         return self.include
 
+    def set_retention(
+        self,
+        max_entries: Optional[int] = _UNCHANGED,
+        max_bytes: Optional[int] = _UNCHANGED,
+        detach: bool = _UNCHANGED,
+    ) -> None:
+        """Sets the limits on the number of recorded tracebacks, and on their
+        estimated size in bytes; ``None`` means no limit.
+        ``detach`` determines if references to frames, tracebacks and
+        exceptions are dropped once the information has been computed
+        for the current ``include`` choice.
+        Settings which are not specified are left unchanged.
+        """
+        if max_entries is not _UNCHANGED:
+            self.recorded_tracebacks.max_entries = max_entries
+        if max_bytes is not _UNCHANGED:
+            self.recorded_tracebacks.max_bytes = max_bytes
+        if detach is not _UNCHANGED:
+            self.detach_tracebacks = detach
+        self.recorded_tracebacks.enforce_limits()
+
+    def get_retention_footprint(self) -> Dict[str, Optional[int]]:
+        """Returns the number of recorded tracebacks, how many of them
+        still keep references to frames, their estimated size in bytes,
+        and the current limits.
+        """
+        return self.recorded_tracebacks.get_footprint()
+
     def set_formatter(self, formatter: Union[str, None, Formatter] = None) -> None:
         """Sets the default formatter. If no argument is given, the default
         formatter is used.
@@ -139,11 +232,31 @@ class _State:
         else:
             self.formatter = formatter  # could be provided as a function
 
+    def set_sampling(
+        self,
+        max_explained: Optional[int] = None,
+        window: float = 60.0,
+        reduced_include: InclusionChoice = "python_tb",
+    ) -> None:
+        """Limits the number of times identical exceptions are fully explained
+        by the exception hook during a time window (in seconds); other
+        occurrences are shown using ``reduced_include``.
+        ``max_explained=None`` disables this limit.
+        """
+        if reduced_include not in base_formatters.items_groups:  # pragma: no cover
+            raise ValueError(f"{reduced_include} is not a valid value.")
+        self.sampler.configure(
+            max_explained=max_explained, window=window, reduced_include=reduced_include
+        )
+
     def install(
         self,
         lang: Optional[str] = None,
         redirect: Union[str, Writer, None] = None,
         include: InclusionChoice = None,
+        max_explained: Optional[int] = None,
+        sampling_window: Optional[float] = None,
+        max_explain_ms: Optional[float] = None,
     ) -> None:
         """Replaces sys.excepthook by friendly's own version."""
 
@@ -153,6 +266,14 @@ class _State:
             self.set_redirect(redirect=redirect)
         if include is not None:
             self.set_include(include)
+        if max_explained is not None or sampling_window is not None:
+            self.set_sampling(
+                max_explained=max_explained,
+                window=60.0 if sampling_window is None else sampling_window,
+                reduced_include=self.sampler.reduced_include,
+            )
+        if max_explain_ms is not None:
+            self.max_explain_ms = max_explain_ms
         if self.installed:
             return
 
@@ -236,13 +357,26 @@ class _State:
         if etype.__name__ == "KeyboardInterrupt":  # pragma: no cover
             raise KeyboardInterrupt(str(value))
 
-        info = self.get_traceback_info(etype, value, tb)
+        # Only a summary set by sampling this exception is shown.
+        self.sampler.summary = ""
+        with time_budget.limit(self.max_explain_ms):
+            info = self.get_traceback_info(etype, value, tb, sample=True)
         if not info:
             return
-        self.output_info(info, redirect=redirect)
+        friendly_tb = self.recorded_tracebacks[-1]
+        notes = friendly_tb.get_skipped_sections_note(self.max_explain_ms)
+        notes += self.sampler.summary
+        self.output_info(
+            info, redirect=redirect, include=friendly_tb.include, notes=notes
+        )
+        friendly_tb.restore_skipped_sections()
 
     def output_info(
-        self, info: dict, redirect: Union[str, Writer, None] = None
+        self,
+        info: dict,
+        redirect: Union[str, Writer, None] = None,
+        include: Optional[InclusionChoice] = None,
+        notes: str = "",
     ) -> None:
         """Outputs the information obtained from a traceback.
 
@@ -251,18 +385,24 @@ class _State:
            redirect = some_stream
         is specified, the output goes to that stream for this call,
         but the session settings is restored afterwards.
+        Similarly, ``include`` can be used to replace the session setting
+        for this call. Some ``notes`` can be written after the explanation.
         """
         saved_current_redirect = None
         if redirect is not None:
             saved_current_redirect = self.write_err
             self.set_redirect(redirect=redirect)
+        if include is None:
+            include = self.include
 
-        explanation = self.formatter(info, include=self.include)
+        explanation = self.formatter(info, include=include)
         self.write_err(explanation)
 
         # Ensures that we start on a new line; essential for the console
         if hasattr(explanation, "endswith") and not explanation.endswith("\n"):
             self.write_err("\n")
+        if notes:
+            self.write_err(notes)
 
         if saved_current_redirect is not None:
             self.set_redirect(redirect=saved_current_redirect)
@@ -272,6 +412,7 @@ class _State:
         etype: Type[_E],
         value: _E,
         tb: types.TracebackType,
+        sample: bool = False,
     ) -> Info:
         """Obtains the information available after a traceback has been raised.
 
@@ -279,12 +420,34 @@ class _State:
 
             etype, value, tb = sys.exc_info()
 
-        Returns a dict containing the available info.
+        Returns a dict containing the available info. Only the items
+        required by the current ``include`` choice are computed right away;
+        the other ones are computed when they are first looked up.
+
+        If ``sample`` is True, and sampling is enabled, identical exceptions
+        that have already been explained many times only have the
+        information for a reduced ``include`` choice computed;
+        the choice made is recorded as the ``include`` attribute
+        of the FriendlyTraceback instance.
         """
+        # core, and the many modules it uses, are only imported once
+        # an exception needs to be explained.
+        from . import core
+
         try:
             self.recorded_tracebacks.append(core.FriendlyTraceback(etype, value, tb))
-            self.recorded_tracebacks[-1].compile_info()
+            include = self.include
+            if sample and self.sampler.is_enabled():
+                include = self.sampler.get_include(
+                    self.recorded_tracebacks[-1].fingerprint, include
+                )
+            self.recorded_tracebacks[-1].include = include
+            self.recorded_tracebacks[-1].compile_info(include=include)
+            if self.detach_tracebacks:
+                self.recorded_tracebacks[-1].detach()
             info = self.recorded_tracebacks[-1].info
+            # The size of the info is only known once it has been computed.
+            self.recorded_tracebacks.enforce_limits()
         except Exception:  # pragma: no cover
             if not debug_helper.DEBUG:
                 print(
@@ -342,7 +342,7 @@ def _get_statement() -> Optional[Statement]:  # pragma: no cover
         print(_nothing_to_show())
         return None
     current_tb = session.recorded_tracebacks[-1]
-    if hasattr(current_tb, "tb_data"):
+    if getattr(current_tb, "tb_data", None) is not None:
         if isinstance(
             session.recorded_tracebacks[-1].tb_data.exception_instance, SyntaxError
         ):
@@ -11,15 +11,25 @@ please file an issue.
 import re
 import traceback
 import types
-from typing import List, Optional, Type
-
-from . import debug_helper, info_generic, info_variables, message_parser, tb_data
+from typing import Dict, List, Optional, Tuple, Type
+
+from . import (
+    base_formatters,
+    debug_helper,
+    info_generic,
+    info_variables,
+    message_parser,
+    tb_data,
+    time_budget,
+)
+from .explanation_cache import explanation_cache, get_fingerprint
 from .frame_info import FrameInfo
-from .ft_gettext import current_lang
+from .ft_gettext import can_render, current_lang, record_translations, render
+from .instrumentation import instrumentation
 from .path_info import path_utils
 from .source_cache import cache
 from .syntax_errors import analyze_syntax, indentation_error
-from .typing_info import _E, Info
+from .typing_info import _E, InclusionChoice, Info
 
 try:
     import executing  # noqa
@@ -74,6 +84,169 @@ _ = current_lang.translate
 # [6]
 # b: 2
 
+# Most items of the "info" dict are only computed when they are first
+# needed. Each group of items below is computed by a single method of
+# FriendlyTraceback; the items set in FriendlyTraceback.__init__
+# (header, message, tracebacks, notes) are always available.
+LAZY_SECTIONS = {
+    "generic": {"generic"},
+    "cause": {"cause", "suggest"},
+    "location": {
+        "parsing_error",
+        "parsing_error_source",
+        "last_call_header",
+        "last_call_source",
+        "last_call_variables",
+        "exception_raised_header",
+        "exception_raised_source",
+        "exception_raised_variables",
+        "additional_variable_warning",
+    },
+    "detailed_tb": {"detailed_tb"},
+}
+LAZY_ITEMS = {
+    item: section for section, items in LAZY_SECTIONS.items() for item in items
+}
+# Items which are never computed lazily for exceptions; looking for them
+# should not trigger any computation.
+NOT_LAZY_ITEMS = {
+    "header",
+    "lang",
+    "message",
+    "original_python_traceback",
+    "simulated_python_traceback",
+    "shortened_traceback",
+    "exception_notes_intro",
+    "exception_notes",
+    "warnings",
+    "warning_message",
+    "warning_location_header",
+    "warning_source",
+    "warning_variables",
+}
+
+
+class LazyInfo(dict):
+    """A dict containing the information about an exception, where
+    the value of many items is only computed when first requested.
+
+    Looking up an item which is not yet available (``info[item]``,
+    ``item in info``, ``info.get(item)``) computes the section of
+    ``LAZY_SECTIONS`` to which it belongs. Iterating over the dict
+    computes all the sections, so that it behaves like a normal dict
+    containing all the available information.
+
+    As was always the case, items for which no value is found
+    are not included.
+    """
+
+    def __init__(self, friendly_tb: "FriendlyTraceback") -> None:
+        super().__init__()
+        self._friendly_tb = friendly_tb
+        self._pending = set(LAZY_SECTIONS)
+
+    def _compute(self, key: object) -> None:
+        if not self._pending or key in NOT_LAZY_ITEMS:
+            return
+        if key in LAZY_ITEMS:
+            section = LAZY_ITEMS[key]  # type: ignore
+            if section in self._pending:
+                self._friendly_tb.compute_section(section)
+            return
+        # Unknown item: it could be set by a custom parser.
+        self.compute_all()
+
+    def compute_all(self) -> None:
+        """Computes all the sections not yet computed."""
+        for section in list(LAZY_SECTIONS):
+            if section in self._pending:
+                self._friendly_tb.compute_section(section)
+
+    def is_pending(self, section: str) -> bool:
+        """Returns True if a section has not been computed yet."""
+        return section in self._pending
+
+    def mark_computed(self, section: str) -> None:
+        """Records that a section has been computed, and removes null values."""
+        self._pending.discard(section)
+        to_remove = [key for key in dict.keys(self) if not dict.__getitem__(self, key)]
+        for key in to_remove:
+            dict.__delitem__(self, key)
+
+    def set_pending(self, section: str) -> None:
+        """Records that a section needs to be computed (again), if possible."""
+        if self._friendly_tb is not None:
+            self._pending.add(section)
+
+    def detach(self) -> None:
+        """Items not yet computed can no longer be computed; see
+        FriendlyTraceback.detach().
+        """
+        self._pending.clear()
+        self._friendly_tb = None
+
+    def reset(self) -> None:
+        """Removes all the lazily computed items so that they can be computed
+        again, for example after the language has been changed.
+        """
+        for item in LAZY_ITEMS:
+            dict.pop(self, item, None)
+        self._pending = set(LAZY_SECTIONS)
+
+    def __missing__(self, key: str) -> object:
+        self._compute(key)
+        if dict.__contains__(self, key):
+            return dict.__getitem__(self, key)
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        if not dict.__contains__(self, key):
+            self._compute(key)
+        return dict.__contains__(self, key)
+
+    def get(self, key: str, default: object = None) -> object:  # type: ignore
+        return self[key] if key in self else default
+
+    def __iter__(self):  # type: ignore
+        self.compute_all()
+        return dict.__iter__(self)
+
+    def __len__(self) -> int:
+        self.compute_all()
+        return dict.__len__(self)
+
+    def __bool__(self) -> bool:
+        # Does not require computing anything, unlike __len__.
+        return dict.__len__(self) > 0 or bool(self._pending)
+
+    def keys(self):  # type: ignore
+        self.compute_all()
+        return dict.keys(self)
+
+    def values(self):  # type: ignore
+        self.compute_all()
+        return dict.values(self)
+
+    def items(self):  # type: ignore
+        self.compute_all()
+        return dict.items(self)
+
+    def copy(self) -> dict:  # type: ignore
+        self.compute_all()
+        return dict(dict.items(self))
+
+    def __repr__(self) -> str:
+        self.compute_all()
+        return dict.__repr__(self)
+
+    def __eq__(self, other: object) -> bool:
+        self.compute_all()
+        return dict.__eq__(self, other)
+
+    def __reduce__(self):  # type: ignore
+        # Copies and pickles are plain dicts with all the information.
+        return dict, (self.copy(),)
+
 
 class FriendlyTraceback:
     """Main class for creating a friendly traceback.
@@ -82,9 +255,11 @@ class FriendlyTraceback:
     dict called "info". The various keys of that dict are documented
     in the docstrings of the relevant methods.
 
-    To get all possible attributes set up, one needs to call
-    compile_info() after initializing this class. This is done
-    to allow third-party users to selectively call only one of
+    Most of the keys of "info" are only computed when they are first
+    looked up; see ``LazyInfo``. Calling compile_info() computes them
+    ahead of time: all of them by default, or only those
+    needed to show a given ``include`` choice.
+    Third-party users can still selectively call only one of
 
     * assign_cause()
     * assign_generic()
@@ -103,6 +278,13 @@ class FriendlyTraceback:
     """
 
     info: Info
+    detached: bool = False
+    include: Optional[InclusionChoice] = None  # choice made when compiling info
+    skipped_sections: Tuple[str, ...] = ()  # not computed within the time budget
+    _fingerprint: Optional[str] = None
+    # section -> (items set when computing it, True if they can be rendered
+    #             in another language; see ft_gettext.can_render())
+    translated_sections: Dict[str, Tuple[Tuple[str, ...], bool]]
 
     def __init__(self, etype: Type[_E], value: _E, tb: types.TracebackType) -> None:
         """The basic argument are those generated after a traceback
@@ -114,7 +296,8 @@ class FriendlyTraceback:
         from .config import session
 
         try:
-            self.tb_data = tb_data.TracebackData(etype, value, tb)
+            with instrumentation.timed("tb_data"):
+                self.tb_data = tb_data.TracebackData(etype, value, tb)
         except Exception as e:  # pragma: no cover
             debug_helper.log("Uncaught exception in TracebackData:")
             if debug_helper.DEBUG:
@@ -123,10 +306,13 @@ class FriendlyTraceback:
             raise SystemExit
         self.tb = tb
         self.suppressed = ["       ... " + _("More lines not shown.") + " ..."]
-        self.info = {"header": _("Python exception:")}  # Used by HackInScience
+        self.translated_sections = {}
+        self.info = LazyInfo(self)  # type: ignore
+        self.info["header"] = _("Python exception:")  # Used by HackInScience
         self.info["lang"] = session.lang
         self.message = self.assign_message(etype, value)  # language independent
-        self.assign_tracebacks()
+        with instrumentation.timed("assign_tracebacks"):
+            self.assign_tracebacks()
         # include the value for debugging purpose in an interactive session ...
         self.tb_data.exception_instance = value
         # ... and for extracting the notes information
@@ -143,29 +329,233 @@ class FriendlyTraceback:
         self.info["message"] = f"{exc_name}: {message}\n"
         return self.info["message"]
 
-    def compile_info(self) -> None:
-        """Compile all info that was not set in __init__."""
-        self.assign_generic()
-        # For SyntaxError, assigning the cause may result in better location
-        # information; so we need to do this first.
-        self.assign_cause()
-        self.assign_location()
-        # removing null values; mypy cannot figure out the type correctly here
-        to_remove = [key for key in self.info if not self.info[key]]  # type: ignore
-        for key in to_remove:
-            del self.info[key]
+    def compile_info(self, include: Optional[InclusionChoice] = None) -> None:
+        """Compile the info that was not set in __init__.
+
+        If ``include`` is specified, only the items needed to show
+        that choice are computed; the others are computed
+        if and when they are looked up.
+        """
+        if include is None or include not in base_formatters.items_groups:
+            self.info.compute_all()  # type: ignore
+            return
+        for item in base_formatters.items_groups[include]:
+            self.info.get(item)
+
+    def compute_section(self, section: str) -> None:
+        """Computes the items of "info" belonging to a section
+        of LAZY_SECTIONS, using the explanation cache when possible.
+        """
+        sections = self.get_cacheable_sections(section)
+        if not explanation_cache.max_size or not sections:
+            self._compute_section(section)
+            return
+
+        key = (self.fingerprint, self.info["lang"], sections)
+        items = explanation_cache.get(key)
+        if items is not None:
+            self.info.update(items)
+            for name in sections:
+                self.info.mark_computed(name)  # type: ignore
+            return
+
+        complete = all(self.info.is_pending(name) for name in sections)  # type: ignore
+        before = dict(dict.items(self.info))
+        for name in sections:
+            if self.info.is_pending(name):  # type: ignore
+                self._compute_section(name)
+        if complete and not any(name in self.skipped_sections for name in sections):
+            explanation_cache.add(
+                key,
+                {
+                    item: value
+                    for item, value in dict.items(self.info)
+                    if item not in before or before[item] is not value
+                },
+            )
+
+    def get_cacheable_sections(self, section: str) -> Tuple[str, ...]:
+        """Returns the sections, computed together with ``section``,
+        whose result only depend on the fingerprint of the exception and
+        can be cached; returns an empty tuple if ``section`` cannot be cached.
+        """
+        if section == "generic":
+            return ("generic",)
+        if issubclass(self.tb_data.exception_type, SyntaxError):
+            # Finding the cause of a SyntaxError changes the information
+            # used to show its location.
+            if section in ("cause", "location"):
+                return ("cause", "location")
+        elif section == "cause":
+            return ("cause",)
+        return ()
+
+    @property
+    def fingerprint(self) -> str:
+        """Identifies identical exceptions; see explanation_cache.get_fingerprint()"""
+        if self._fingerprint is None:
+            self._fingerprint = get_fingerprint(self.tb_data)
+        return self._fingerprint
+
+    def _compute_section(self, section: str) -> None:
+        # Marking the section as computed first prevents infinite
+        # recursion should the info be looked up while it is computed.
+        self.info.mark_computed(section)  # type: ignore
+        before = dict(dict.items(self.info))
+        with record_translations() as translations:
+            try:
+                time_budget.check()
+                with instrumentation.timed(f"section:{section}"):
+                    if section == "generic":
+                        self.assign_generic()
+                    elif section == "cause":
+                        self.assign_cause()
+                    elif section == "location":
+                        # For SyntaxError, assigning the cause may result in
+                        # better location information; so we need to do this first.
+                        if issubclass(self.tb_data.exception_type, SyntaxError):
+                            self.info.get("cause")
+                        self.assign_location()
+                    elif section == "detailed_tb":
+                        self.assign_detailed_tb()
+            except time_budget.TimeBudgetExceeded:
+                self.skipped_sections += (section,)
+            except Exception:  # pragma: no cover
+                debug_helper.log(f"Exception raised while computing {section}.")
+                if debug_helper.DEBUG:
+                    raise
+        # removing null values
+        self.info.mark_computed(section)  # type: ignore
+        items = tuple(
+            item
+            for item, value in dict.items(self.info)
+            if item not in before or before[item] is not value
+        )
+        renderable = all(
+            can_render(dict.__getitem__(self.info, item), translations)
+            for item in items
+        )
+        self.translated_sections[section] = (items, renderable)
+
+    def restore_skipped_sections(self) -> None:
+        """Sections which were not computed within the time budget are
+        computed, without time limit, if and when they are next looked up.
+        """
+        if not self.detached:
+            for section in self.skipped_sections:
+                self.info.set_pending(section)  # type: ignore
+        self.skipped_sections = ()
+
+    def get_skipped_sections_note(self, max_ms: Optional[float]) -> str:
+        """Returns a note indicating what was not included in the
+        explanation since the time budget was exceeded, or an empty string.
+        The functions which can be used to obtain this information are only
+        mentioned if the traceback has not been detached.
+        """
+        if not self.skipped_sections:
+            return ""
+        if self.detached:
+            return _(
+                "The explanation took more than {max_ms} ms.\n"
+                "Some information was not included, and can no longer"
+                " be obtained.\n"
+            ).format(max_ms=max_ms)
+        functions = {
+            "generic": "what()",
+            "cause": "why()",
+            "location": "where()",
+            "detailed_tb": "where(more=True)",
+        }
+        return _(
+            "The explanation took more than {max_ms} ms.\n"
+            "The following information was not included: {functions}.\n"
+        ).format(
+            max_ms=max_ms,
+            functions=", ".join(
+                f"`{function}`"
+                for section, function in functions.items()
+                if section in self.skipped_sections
+            ),
+        )
 
     def recompile_info(self) -> None:
         """This is useful if we need to redisplay some information in a
         different language than what was originally used.
+
+        The analysis of an exception does not depend on the language:
+        the translated text it produces (see ft_gettext.TranslatedText)
+        records the message ids and the parameters used, and is simply
+        rendered again in the current language.
+        The few sections which contain translated text which cannot be
+        rendered in this way are discarded, and will be computed again,
+        using the current language, when they are next looked up;
+        this cannot be done once the traceback has been detached.
         """
         from .config import session
 
-        self.info["header"] = _("Python exception:")
         self.info["lang"] = session.lang
-        self.add_exception_note()
-        self.assign_tracebacks()
-        self.compile_info()
+        for item in ("header", "exception_notes_intro"):
+            if dict.__contains__(self.info, item):
+                self.info[item] = render(dict.__getitem__(self.info, item))
+        suppressed = [render(self.suppressed[0])]
+        for item in (
+            "original_python_traceback",
+            "simulated_python_traceback",
+            "shortened_traceback",
+        ):
+            if dict.__contains__(self.info, item):
+                self.info[item] = dict.__getitem__(self.info, item).replace(
+                    self.suppressed[0], suppressed[0]
+                )
+        self.suppressed = suppressed
+
+        for section in LAZY_SECTIONS:
+            if self.info.is_pending(section):  # type: ignore
+                continue
+            items, renderable = self.translated_sections.get(section, ((), False))
+            if renderable:
+                for item in items:
+                    if not dict.__contains__(self.info, item):
+                        continue
+                    value = dict.__getitem__(self.info, item)
+                    dict.__setitem__(self.info, item, render(value))
+            elif not self.detached:
+                # For example, a section found in the explanation cache.
+                for item in items or LAZY_SECTIONS[section]:
+                    dict.pop(self.info, item, None)
+                self.translated_sections.pop(section, None)
+                self.info.set_pending(section)  # type: ignore
+        self.skipped_sections = ()
+
+    def detach(self) -> None:
+        """Drops all references to the traceback, frames, exception and other
+        objects, so that they (and the local variables of each frame) can
+        be garbage collected. Only the information already computed,
+        and a small summary (see get_summary()) are kept.
+
+        Information which has not been computed, as well as translations
+        in other languages, will not be available afterwards.
+        """
+        if self.detached:
+            return
+        self.summary = self.get_summary()
+        self.info.detach()  # type: ignore
+        self.tb = None
+        self.tb_data = None  # type: ignore
+        self.detached = True
+
+    def get_summary(self) -> dict:
+        """Returns a summary of the exception, using only strings and integers"""
+        return {
+            "fingerprint": self.fingerprint,
+            "exception_name": self.tb_data.exception_name,
+            "message": self.tb_data.message,
+            "filename": self.tb_data.filename,
+            "frames": [
+                (record.filename, record.frame.f_code.co_name, record.lineno)
+                for record in self.tb_data.records
+            ],
+        }
 
     def add_exception_note(self):
         """Adding information from exception notes; new to Python 3.11"""
@@ -304,10 +694,20 @@ class FriendlyTraceback:
         if len(records) < 2:
             return
 
-        self.info["detailed_tb"] = self.get_detailed_stack_info()
-        _ignore, partial_source, var_info = self.info["detailed_tb"][0]
+        if self.tb_data.filename == "<stdin>":
+            return
+        _ignore, partial_source, var_info = self.get_frame_details(records[0])
         self.locate_last_call(records[0], partial_source, var_info)
 
+    def assign_detailed_tb(self) -> None:
+        """Sets the value of the following attribute, used by ``where(more=True)``:
+
+        * detailed_tb
+        """
+        if len(self.tb_data.records) < 2:
+            return
+        self.info["detailed_tb"] = self.get_detailed_stack_info()
+
     def locate_exception_raised(self, record: FrameInfo) -> None:
         """Sets the values of the following attributes which are
         part of a friendly
@@ -362,7 +762,8 @@ class FriendlyTraceback:
         else:  # This almost never happens
             line = record.problem_line()
 
-        var_info = info_variables.get_var_info(line, record.frame)
+        with instrumentation.timed("info_variables.get_var_info"):
+            var_info = info_variables.get_var_info(line, record.frame)
         self.info["exception_raised_variables"] = var_info["var_info"]
         if "additional_variable_warning" in var_info:
             self.info["additional_variable_warning"] = var_info[
@@ -396,26 +797,30 @@ class FriendlyTraceback:
         if self.tb_data.filename == "<stdin>":
             return []
 
-        detailed_tb = []
-        for record in self.tb_data.records:
-            filename = path_utils.shorten_path(record.filename)
-            lineno = record.lineno
-            if record.node_info:
-                _node, _ignore, line = record.node_info
-            else:
-                line = record.problem_line()
-            partial_source = record.partial_source_with_node_range
+        return [self.get_frame_details(record) for record in self.tb_data.records]
+
+    def get_frame_details(self, record: FrameInfo) -> Tuple[str, str, str]:
+        """Returns the location, partial source and variable information
+        for a single frame.
+        """
+        filename = path_utils.shorten_path(record.filename)
+        lineno = record.lineno
+        if record.node_info:
+            _node, _ignore, line = record.node_info
+        else:
+            line = record.problem_line()
+        partial_source = record.partial_source_with_node_range
+        with instrumentation.timed("info_variables.get_var_info"):
             var_info = info_variables.get_var_info(line, record.frame)
-            if "[" in filename:
-                location = _("Code block {filename}, line `{line}`").format(
-                    filename=filename, line=lineno
-                )
-            else:
-                location = _("File '{filename}', line `{line}`").format(
-                    filename=filename, line=lineno
-                )
-            detailed_tb.append((location, partial_source, var_info["var_info"]))
-        return detailed_tb
+        if "[" in filename:
+            location = _("Code block {filename}, line `{line}`").format(
+                filename=filename, line=lineno
+            )
+        else:
+            location = _("File '{filename}', line `{line}`").format(
+                filename=filename, line=lineno
+            )
+        return location, partial_source, var_info["var_info"]
 
     def locate_parsing_error(self) -> None:
         """Sets the values of the attributes:
@@ -595,7 +1000,7 @@ class FriendlyTraceback:
             value = self.tb_data.value
             offset = value.offset
             filename = value.filename
-            lines = cache.get_source_lines(filename)
+            lines = cache.get_source_view(filename)
             result.append(f'  File "{filename}", line {value.lineno}')
             _line = value.text
             if _line is None:
@@ -604,7 +1009,7 @@ class FriendlyTraceback:
                 except Exception:  # noqa
                     pass
             if _line is not None:
-                if filename == "<fstring>" and lines == ["\n"]:
+                if filename == "<fstring>" and len(lines) == 1:
                     # Before Python 3.9, the traceback included a fake
                     # file for f-strings which only included parts of
                     # the f-string content.
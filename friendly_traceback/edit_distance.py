@@ -0,0 +1,152 @@
+"""edit_distance.py
+
+Finding similar words, as done by ``utils.get_similar_words()``, requires
+computing the distance between a word with a typo and every candidate,
+using the pure-Python function ``utils._leven()``. This can take seconds
+when there are hundreds of thousands of candidates, such as the
+keys of a large dict for a ``KeyError``.
+
+This module finds, in bulk, the few candidates which can possibly be
+within a given distance of the word with a typo; only those are then
+compared using ``_leven()``. It uses cheap lower bounds of the distance
+first: the difference in length, and the difference between the
+histograms of the characters. When NumPy is available, the
+Damerau-Levenshtein distance (optimal string alignment) of the
+remaining candidates is then computed for all of them at once;
+since ``_leven()`` never gives a smaller distance, no similar word is missed.
+"""
+from collections import Counter
+from typing import List, Sequence
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+use_numpy = numpy is not None
+min_bulk_size = 500  # fewer candidates are compared directly
+max_candidates = 200_000  # words beyond this number are ignored
+NB_BINS = 64  # number of bins used for the histograms of characters
+
+
+def filter_candidates(word: str, candidates: Sequence[str], max_dist: int) -> List[str]:
+    """Returns the candidates, in their original order, which might be within
+    max_dist of word, removing many which cannot be."""
+    candidates = [
+        candidate
+        for candidate in candidates
+        if abs(len(candidate) - len(word)) <= max_dist
+    ]
+    if use_numpy:
+        return _numpy_filter(word, candidates, max_dist)
+    return _histogram_filter(word, candidates, max_dist)
+
+
+def _histogram_filter(word: str, candidates: List[str], max_dist: int) -> List[str]:
+    """Pure-Python filter based on the characters used.
+
+    An insertion or a deletion changes the number of one character by one,
+    a substitution changes the number of two characters, and
+    a transposition does not change them: the sum of the differences between
+    the numbers of each character is at most twice the distance.
+    """
+    word_counts = Counter(word)
+    result = []
+    for candidate in candidates:
+        counts = Counter(candidate)
+        counts.subtract(word_counts)
+        if sum(map(abs, counts.values())) <= 2 * max_dist:
+            result.append(candidate)
+    return result
+
+
+def _numpy_filter(word: str, candidates: List[str], max_dist: int) -> List[str]:
+    """Keeps the candidates whose optimal string alignment distance
+    from word is at most max_dist, computed for all candidates
+    of the same length at once."""
+    by_length: dict = {}
+    for position, candidate in enumerate(candidates):
+        by_length.setdefault(len(candidate), []).append(position)
+
+    word_codes = _to_codes(word, 1, len(word))[0]
+    word_histogram = numpy.bincount(word_codes % NB_BINS, minlength=NB_BINS)
+    kept = []
+    for length, positions in by_length.items():
+        if length == 0:
+            continue
+        codes = _to_codes(
+            "".join(candidates[position] for position in positions),
+            len(positions),
+            length,
+        )
+        positions = numpy.array(positions)
+        # Same lower bound as in _histogram_filter, with characters
+        # grouped in bins.
+        histograms = numpy.zeros((len(positions), NB_BINS), dtype=numpy.int32)
+        rows = numpy.arange(len(positions))
+        for column in range(length):
+            histograms[rows, codes[:, column] % NB_BINS] += 1
+        difference = numpy.abs(histograms - word_histogram).sum(axis=1)
+        selected = difference <= 2 * max_dist
+        codes, positions = codes[selected], positions[selected]
+        if len(positions):
+            distances = bounded_distances(word_codes, codes, max_dist)
+            kept.extend(positions[distances <= max_dist].tolist())
+    kept.sort()
+    return [candidates[position] for position in kept]
+
+
+def _to_codes(text: str, nb_rows: int, length: int) -> "numpy.ndarray":
+    """Converts the concatenation of nb_rows strings of the same length
+    into an array of character codes, with one row per string."""
+    codes = numpy.frombuffer(text.encode("utf-32-le"), dtype="<u4")
+    return codes.astype(numpy.int64).reshape(nb_rows, length)
+
+
+def bounded_distances(
+    word_codes: "numpy.ndarray", codes: "numpy.ndarray", max_dist: int
+) -> "numpy.ndarray":
+    """Returns the optimal string alignment distances between a word and
+    candidates of the same length, given as arrays of character codes;
+    distances larger than max_dist are replaced by max_dist + 1.
+
+    The rows of the usual matrix are computed for all candidates at once,
+    one character of word at a time. The cost of insertions, which depends
+    on the previous column of the same row, is obtained using a cumulative
+    minimum: row[j] = min over k <= j of (value[k] + j - k).
+    """
+    nb_candidates, length = codes.shape
+    cap = max_dist + 1
+    columns = numpy.arange(length + 1)
+    remaining = numpy.arange(nb_candidates)
+    distances = numpy.full(nb_candidates, cap)
+    before_previous = None
+    previous = numpy.tile(numpy.minimum(columns, cap), (nb_candidates, 1))
+    for i in range(1, len(word_codes) + 1):
+        char = word_codes[i - 1]
+        row = numpy.empty_like(previous)
+        row[:, 0] = min(i, cap)
+        row[:, 1:] = numpy.minimum(
+            previous[:, :-1] + (codes != char), previous[:, 1:] + 1
+        )
+        if before_previous is not None and length > 1:
+            transposed = (codes[:, :-1] == char) & (codes[:, 1:] == word_codes[i - 2])
+            row[:, 2:] = numpy.where(
+                transposed,
+                numpy.minimum(row[:, 2:], before_previous[:, :-2] + 1),
+                row[:, 2:],
+            )
+        row = numpy.minimum.accumulate(row - columns, axis=1) + columns
+        numpy.minimum(row, cap, out=row)
+
+        # Candidates for which every value of the last two rows is larger
+        # than max_dist cannot be within max_dist of word.
+        possible = (row.min(axis=1) <= max_dist) | (previous.min(axis=1) <= max_dist)
+        if not possible.all():
+            row, previous, codes = row[possible], previous[possible], codes[possible]
+            remaining = remaining[possible]
+            if not len(remaining):
+                return distances
+        before_previous, previous = previous, row
+    distances[remaining] = previous[:, -1]
+    return distances
@@ -0,0 +1,114 @@
+"""explanation_cache.py
+
+When the same exception is raised repeatedly at the same location,
+with the same message, the analysis done to find its cause normally
+gives the same result. To avoid repeating this analysis, its result
+can be kept in a cache, whose key is a "fingerprint" of the exception.
+
+Only the information which does not depend on the values of variables
+at the time the exception was raised is meant to be cached; the
+variables shown by ``where()`` are always obtained again.
+However, some explanations of the cause do mention such values
+(for example, the length of a list for an IndexError);
+this is why the cache is disabled by default.
+"""
+import re
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+if TYPE_CHECKING:
+    from .tb_data import TracebackData
+
+# Memory addresses, as in "<object at 0x000001B1C4A0F400>"
+ADDRESS_PATTERN = re.compile(r"0x[0-9a-fA-F]+")
+
+
+def normalize_message(message: str) -> str:
+    """Removes parts of a message which differ for each occurrence
+    of otherwise identical exceptions."""
+    return ADDRESS_PATTERN.sub("0x...", message)
+
+
+def get_fingerprint(tb_data: "TracebackData") -> str:
+    """Returns a string identifying an exception, which is the same
+    for all occurrences of this exception at the same location,
+    including in different processes.
+
+    It is based on the exception type, the normalized message, the
+    (filename, code name, lineno) of each frame, and the line of code
+    where the exception was raised.
+    """
+    etype = tb_data.exception_type
+    parts = [
+        f"{etype.__module__}.{etype.__qualname__}",
+        normalize_message(tb_data.message),
+        tb_data.original_bad_line,
+    ]
+    if issubclass(etype, SyntaxError):
+        value = tb_data.value
+        parts.append(repr((value.filename, value.lineno, value.offset)))
+    parts.extend(
+        repr((record.filename, record.frame.f_code.co_name, record.lineno))
+        for record in tb_data.records
+    )
+    import hashlib  # not imported with friendly_traceback, as it is slow
+
+    text = "\n".join(parts).encode("utf-8", errors="backslashreplace")
+    return hashlib.sha1(text).hexdigest()
+
+
+class ExplanationCache:
+    """Least recently used cache for the results of the analysis
+    of exceptions, whose keys include the fingerprint of an exception.
+    """
+
+    def __init__(self, max_size: int = 0) -> None:
+        self.max_size = max_size  # 0 means that the cache is not used
+        self.entries: "OrderedDict[Any, Dict[str, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Any) -> Optional[Dict[str, Any]]:
+        """Returns a copy of the items cached for a given key, or None."""
+        if not self.max_size:
+            return None
+        if key not in self.entries:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return dict(self.entries[key])
+
+    def add(self, key: Any, items: Dict[str, Any]) -> None:
+        """Adds the items for a given key, discarding the least recently
+        used entries if the cache is full."""
+        if not self.max_size:
+            return
+        self.entries[key] = dict(items)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def set_max_size(self, max_size: int) -> None:
+        """Sets the maximum number of entries; 0 disables the cache."""
+        self.max_size = max(max_size, 0)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes all entries and resets the counters."""
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """Returns the number of entries, hits and misses."""
+        return {
+            "entries": len(self.entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+explanation_cache = ExplanationCache()
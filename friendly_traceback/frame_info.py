@@ -91,7 +91,7 @@ class FrameInfo(stack_data.FrameInfo):
             # protecting against https://github.com/alexmojaki/stack_data/issues/13
             try:
                 lineno = self.lineno
-                s_lines = cache.get_source_lines(self.filename)
+                s_lines = cache.get_source_view(self.filename)
                 self.lines = []  # noqa
                 with_node_range = False
                 linenumber = max(lineno - 2, 0)
@@ -219,8 +219,9 @@ class FrameInfo(stack_data.FrameInfo):
             if not node_text:
                 # Highlight the entire line
                 try:
-                    tokens = token_utils.tokenize(self.current_line.text)
-                    tokens = token_utils.remove_meaningless_tokens(tokens)
+                    tokens = token_utils.cached_significant_tokens(
+                        self.current_line.text
+                    )
                     return (
                         None,
                         (tokens[0].start_col, tokens[-1].end_col),
@@ -21,62 +21,216 @@ gettext.translation() is the class-based API for gettext.
 """
 
 import gettext
+import itertools
 import os
-from typing import Optional
+import re
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from . import debug_helper
 from .typing_info import Translator
 
+LOCALEDIR = os.path.normpath(os.path.join(os.path.dirname(__file__), "locales"))
+
+
+# Translation objects, loaded at most once per process, so that changing
+# the language does not require looking for the translation files again.
+# lang -> (language whose translations are used, translation object)
+_translations: Dict[str, Tuple[str, gettext.NullTranslations]] = {}
+
+
+def get_translation(lang: str) -> Tuple[str, gettext.NullTranslations]:
+    """Returns the language whose translations are used for lang, and the
+    gettext translation object for that language."""
+    if lang not in _translations:
+        _translations[lang] = _load_translation(lang)
+    return _translations[lang]
+
+
+def _load_translation(lang: str) -> Tuple[str, gettext.NullTranslations]:
+    try:
+        # We first look for the exact language requested.
+        translation = gettext.translation(
+            "friendly_tb_" + lang,
+            localedir=LOCALEDIR,
+            languages=[lang],
+            fallback=False,
+        )
+    except FileNotFoundError:
+        # If it is not available, we make it possible to replace a
+        # language specific to a region, as in fr_CA, by a more
+        # generic version, such as fr, defined by a two-letter code.
+        lang = lang[:2]
+        translation = gettext.translation(
+            "friendly_tb_" + lang,
+            localedir=LOCALEDIR,
+            languages=[lang],
+            fallback=True,  # This means that the hard-coded strings in
+            # the source file will be used if the requested language
+            # is not available.
+        )
+    return lang, translation
+
+
+class TranslatedText(str):
+    """A string obtained using ``translate()`` which remembers how it was
+    obtained: the message id (the original English text), as well as the
+    parameters given to ``format()`` and the strings concatenated to it.
+
+    The explanations of exceptions are made of such strings; since this
+    description of how they were obtained does not depend on the language,
+    ``render()`` can use it to obtain the same explanation in another
+    language without analyzing the exception again.
+
+    Only simple values (strings, numbers, None) are kept as parameters;
+    formatting with other values gives a normal string.
+    """
+
+    recipe: tuple
+
+    def format(self, *args: Any, **kwargs: Any) -> str:  # type: ignore
+        text = str.format(self, *args, **kwargs)
+        try:
+            args = tuple(_as_parameter(value) for value in args)
+            kwargs = {name: _as_parameter(value) for name, value in kwargs.items()}
+        except TypeError:
+            return text
+        return make_translated_text(text, ("format", self, args, kwargs))
+
+    def __add__(self, other: str) -> str:
+        if not isinstance(other, str):
+            return NotImplemented
+        return make_translated_text(str.__add__(self, other), ("+", self, other))
+
+    def __radd__(self, other: str) -> str:
+        # Used for plain_string + translated_text
+        if not isinstance(other, str):
+            return NotImplemented
+        return make_translated_text(str.__add__(other, self), ("+", other, self))
+
+
+RENDERABLE_TYPES = (str, int, float)
+PLACEHOLDER = re.compile(r"\{[^{}]*\}")
+
+
+def _as_parameter(value: Any) -> Any:
+    """Returns a value to be kept as a parameter of format(); objects
+    which are formatted as str(value), such as tokens, are replaced by
+    this string. TypeError is raised for other values."""
+    if value is None or isinstance(value, RENDERABLE_TYPES):
+        return value
+    if type(value).__format__ is object.__format__:
+        return str(value)
+    raise TypeError
+
+
+def make_translated_text(text: str, recipe: tuple) -> TranslatedText:
+    result = TranslatedText(text)
+    result.recipe = recipe
+    return result
+
+
+def render(text: Any) -> Any:
+    """Returns a text, possibly obtained using another language, in the
+    current language; strings which are not TranslatedText, and other values
+    are returned unchanged; the items of lists and tuples are rendered."""
+    if isinstance(text, (list, tuple)):
+        return type(text)(render(item) for item in text)
+    if not isinstance(text, TranslatedText):
+        return text
+    recipe = text.recipe
+    if recipe[0] == "translate":
+        return current_lang.translate(recipe[1])
+    if recipe[0] == "format":
+        _kind, template, args, kwargs = recipe
+        return render(template).format(
+            *[render(arg) for arg in args],
+            **{name: render(value) for name, value in kwargs.items()},
+        )
+    return render(recipe[1]) + render(recipe[2])
+
+
+def can_render(value: Any, translations: List[str]) -> bool:
+    """Returns True if render() gives the complete translation of a value
+    into the current language, given the translations done while obtaining
+    this value: this is not the case when a normal string contains one of
+    them, for example when translations have been joined together.
+    """
+    if isinstance(value, TranslatedText):
+        if value.recipe[0] == "translate":
+            return True
+        if value.recipe[0] == "format":
+            _kind, template, args, kwargs = value.recipe
+            return all(
+                can_render(part, translations)
+                for part in itertools.chain(args, kwargs.values())
+            )
+        return can_render(value.recipe[1], translations) and can_render(
+            value.recipe[2], translations
+        )
+    if isinstance(value, str):
+        # A translation may have been formatted before being included:
+        # its parts between the placeholders are looked for.
+        return not any(
+            part in value for text in translations for part in _literal_parts(text)
+        )
+    if isinstance(value, (list, tuple)):
+        return all(can_render(item, translations) for item in value)
+    return True
+
+
+def _literal_parts(text: str) -> List[str]:
+    """Parts of a translation which are left unchanged by format();
+    very short parts, which could be found by chance, are ignored."""
+    parts = [part.strip() for part in PLACEHOLDER.split(text)]
+    return [part for part in parts if len(part) >= 3] or [
+        part for part in [text.strip()] if part
+    ]
+
 
 class LangState:
     def __init__(self) -> None:
         self._translate: Translator = lambda text: text
         self.lang = "en"
+        # Translations done inside a record_translations() block
+        self.translations: Optional[List[str]] = None
 
     def install(self, lang: Optional[str] = None) -> None:
         """Sets the language to be used for translations"""
         if lang is None:
             lang = "en"
-        try:
-            # We first look for the exact language requested.
-            _lang = gettext.translation(
-                "friendly_tb_" + lang,
-                localedir=os.path.normpath(
-                    os.path.join(os.path.dirname(__file__), "locales")
-                ),
-                languages=[lang],
-                fallback=False,
-            )
-        except FileNotFoundError:
-            # If it is not available, we make it possible to replace a
-            # language specific to a region, as in fr_CA, by a more
-            # generic version, such as fr, defined by a two-letter code.
-            lang = lang[:2]
-            _lang = gettext.translation(
-                "friendly_tb_" + lang,
-                localedir=os.path.normpath(
-                    os.path.join(os.path.dirname(__file__), "locales")
-                ),
-                languages=[lang],
-                fallback=True,  # This means that the hard-coded strings in
-                # the source file will be used if the requested language
-                # is not available.
-            )
-        self.lang = lang
-        self._translate = _lang.gettext
+        self.lang, translation = get_translation(lang)
+        self._translate = translation.gettext
 
     def translate(self, text: str) -> str:
+        text = str(text)
         translation = self._translate(text)
         if translation == text and self.lang == "fr":  # pragma: no cover
             debug_helper.log(f"Potentially untranslated text for {self.lang}:")
             debug_helper.log(text)
-        return translation
+        if self.translations is not None:
+            self.translations.append(translation)
+        return make_translated_text(translation, ("translate", text))
 
 
 current_lang = LangState()  # noqa
 _ = current_lang.translate
 
 
+@contextmanager
+def record_translations() -> Iterator[List[str]]:
+    """Records the translations done inside a ``with`` block,
+    to be used with can_render(). Blocks can be nested."""
+    saved = current_lang.translations
+    current_lang.translations = translations = []
+    try:
+        yield translations
+    finally:
+        current_lang.translations = saved
+        if saved is not None:
+            saved.extend(translations)
+
+
 def please_report() -> str:
     return _(
         "Please report this example to\n"
@@ -11,7 +11,7 @@ import sys
 import types
 from typing import Any, Dict, List, Tuple, Union
 
-from . import debug_helper, token_utils, utils
+from . import debug_helper, time_budget, token_utils, utils
 from .ft_gettext import current_lang
 from .path_info import path_utils
 from .typing_info import ObjectsInfo, ScopeKind, SimilarNamesInfo
@@ -119,7 +119,7 @@ def find_identifiers(
         ("locals", frame.f_locals),  # always have locals before globals
         ("globals", frame.f_globals),
     )
-    tokens = token_utils.get_significant_tokens(line)
+    tokens = token_utils.cached_significant_tokens(line)
     if not tokens:
         return objects, names
     for tok in tokens:
@@ -181,6 +181,7 @@ def find_expressions(
             for nodes, obj in group_expressions(
                 pair for pair in evaluator.find_expressions(atok.tree)
             ):
+                time_budget.check()
                 name = atok.get_text(nodes[0])
                 if not name or name in names:
                     continue
@@ -308,21 +309,25 @@ def get_var_info(line: str, frame: types.FrameType) -> dict:
 
     objects["locals"].sort()
     for name, obj in objects["locals"]:
+        time_budget.check()
         result = format_var_info(name, obj)
         names_info.append(result)
 
     objects["globals"].sort()
     for name, obj in objects["globals"]:
+        time_budget.check()
         result = format_var_info(name, obj, "globals")
         names_info.append(result)
 
     objects["builtins"].sort()
     for name, obj in objects["builtins"]:
+        time_budget.check()
         result = format_var_info(name, obj)
         names_info.append(result)
 
     objects["expressions"].sort()
     for name, obj in objects["expressions"]:
+        time_budget.check()
         result = format_var_info(name, obj)
         names_info.append(result)
 
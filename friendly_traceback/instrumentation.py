@@ -0,0 +1,118 @@
+"""instrumentation.py
+
+Optional measurements of the time spent in the various phases
+of the analysis of an exception: obtaining the traceback data,
+formatting the tracebacks, trying each message parser or
+SyntaxError analyzer, finding the values of variables, etc.
+
+Measurements are only taken once enabled, using
+``friendly_traceback.set_instrumentation()``; they are aggregated by
+phase name and can also be sent, as they are taken, to a user callback.
+Some numbers, such as how many analyzers were tried for an exception,
+are also recorded.
+"""
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+Callback = Callable[[str, float, Optional[bool]], None]
+
+
+def get_function_name(function: Callable[..., Any]) -> str:
+    """Returns the qualified name of a function, without the name
+    of this package as a prefix."""
+    module = function.__module__ or ""
+    if module.startswith("friendly_traceback."):
+        module = module[len("friendly_traceback.") :]
+    return f"{module}.{function.__qualname__}"
+
+
+class Instrumentation:
+    """Aggregates the time measurements, in milliseconds, by phase name."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.callback: Optional[Callback] = None
+        self.phases: Dict[str, Dict[str, Any]] = {}
+
+    def configure(
+        self, enabled: bool = True, callback: Optional[Callback] = None
+    ) -> None:
+        """Enables or disables the measurements; if ``callback`` is
+        specified, it is called as ``callback(name, elapsed_ms, matched)``
+        after each measurement.
+        """
+        self.enabled = enabled
+        self.callback = callback
+
+    def record(
+        self, name: str, elapsed_ms: float, matched: Optional[bool] = None
+    ) -> None:
+        """Adds a measurement. ``matched`` is only specified for parsers and
+        analyzers, to indicate if they found the cause of an exception."""
+        if name not in self.phases:
+            self.phases[name] = {"calls": 0, "total_ms": 0.0, "max_ms": 0.0}
+            if matched is not None:
+                self.phases[name]["matches"] = 0
+        phase = self.phases[name]
+        phase["calls"] += 1
+        phase["total_ms"] += elapsed_ms
+        phase["max_ms"] = max(phase["max_ms"], elapsed_ms)
+        if matched:
+            phase["matches"] += 1
+        if self.callback is not None:
+            self.callback(name, elapsed_ms, matched)
+
+    def count(self, name: str, value: int) -> None:
+        """Records a number, such as the number of analyzers tried for
+        an exception; the aggregated values are its ``"calls"``,
+        its ``"total"`` and its ``"max"``."""
+        if not self.enabled:
+            return
+        if name not in self.phases:
+            self.phases[name] = {"calls": 0, "total": 0, "max": 0}
+        phase = self.phases[name]
+        phase["calls"] += 1
+        phase["total"] += value
+        phase["max"] = max(phase["max"], value)
+
+    @contextmanager
+    def timed(self, name: str) -> Iterator[None]:
+        """Measures the time taken by the code inside a ``with`` block."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - start) * 1000)
+
+    def call(self, kind: str, function: Callable[..., T], *args: Any) -> T:
+        """Calls a parser or an analyzer, recording the time it took
+        and whether it returned a result; calls which raise an exception,
+        such as time_budget.TimeBudgetExceeded, are recorded as not
+        having returned a result."""
+        if not self.enabled:
+            return function(*args)
+        result = None
+        start = time.perf_counter()
+        try:
+            result = function(*args)
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            name = f"{kind}:{get_function_name(function)}"
+            self.record(name, elapsed_ms, bool(result))
+        return result
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Returns a copy of the measurements aggregated by phase name."""
+        return {name: dict(phase) for name, phase in self.phases.items()}
+
+    def reset(self) -> None:
+        """Removes all measurements."""
+        self.phases.clear()
+
+
+instrumentation = Instrumentation()
@@ -8,11 +8,14 @@ imported from this module instead of simply from ``friendly_traceback``.
 """
 
 
+from functools import partial
 from importlib import import_module
-from typing import List, Type, TypeVar
+from typing import Any, List, Optional, Type, TypeVar
 
-from . import debug_helper
+from . import debug_helper, time_budget
 from .ft_gettext import internal_error, no_information, unknown_case
+from .instrumentation import instrumentation
+from .message_signatures import MessageSignatures
 from .tb_data import TracebackData  # for type checking only
 from .typing_info import _E, CauseInfo, Parser
 
@@ -37,23 +40,37 @@ RUNTIME_MESSAGE_PARSERS = {}
 
 
 class RuntimeMessageParser:
-    """This class is used to create objects that collect message parsers."""
+    """This class is used to create objects that collect message parsers.
+
+    Parsers can be given a message signature, such as a substring which must
+    be included in the message of the exception, so that only the parsers
+    which can possibly find the cause of an exception are called, in their
+    usual order; see message_signatures.py.
+    """
 
     def __init__(self) -> None:
         self.parsers: List[Parser] = []
         self.core_parsers: List[Parser] = []
         self.custom_parsers: List[Parser] = []
+        self.signatures = MessageSignatures()
 
-    def _add(self, func: _P) -> _P:
+    def _add(self, func: Optional[_P] = None, **signature: Any) -> Any:
         """This method is meant to be used only within friendly-traceback.
         It is used as a decorator to add a message parser to a list that is
-        automatically updated.
+        automatically updated, optionally with a message signature::
+
+            @parser._add(contains="object is not callable")
+            def x_is_not_callable(message, traceback_data):
+                ....
         """
+        if func is None:
+            return partial(self._add, **signature)
+        self.signatures.add(func, **signature)
         self.parsers.append(func)
         self.core_parsers.append(func)
         return func
 
-    def add(self, func: _P) -> _P:
+    def add(self, func: Optional[_P] = None, **signature: Any) -> Any:
         """This method is meant to be used by projects that extend
         friendly-traceback. It is used as a decorator to add a message parser
         to a list that is automatically updated::
@@ -61,11 +78,34 @@ class RuntimeMessageParser:
             @instance.add
             def some_message_parser(message, traceback_data):
                 ....
+
+        Custom parsers are called before those included in friendly-traceback.
+        A message signature can be given so that a parser is not called
+        for messages it cannot handle::
+
+            @instance.add(prefix="some message")
+            def some_message_parser(message, traceback_data):
+                ....
+
+        The signature can be given using the following keyword arguments:
+        ``message``, the exact message (or a tuple of messages) handled;
+        ``prefix``, the beginning of the message; ``contains``, a substring
+        of the message (or a tuple of alternatives for either of them);
+        ``pattern``, a regular expression, without backreferences,
+        to be found in the message.
         """
+        if func is None:
+            return partial(self.add, **signature)
+        self.signatures.add(func, **signature)
         self.custom_parsers.append(func)
         self.parsers = self.custom_parsers + self.core_parsers
         return func
 
+    def get_parsers(self, message: str) -> List[Parser]:
+        """Returns the parsers, in order, which can possibly find
+        the cause of an exception with the given message."""
+        return self.signatures.select(self.parsers, str(message))
+
 
 def get_parser(exception_type: Type[_E]) -> RuntimeMessageParser:
     """Gets a 'parser' to find the cause for a given exception.
@@ -115,9 +155,10 @@ def get_cause(
     looking for one that can find a cause of the exception."""
     message_parser = get_parser(exception_type)
 
-    for parser in message_parser.parsers:
+    for parser in message_parser.get_parsers(message):
+        time_budget.check()
         # This could be simpler if we could use the walrus operator
-        cause = parser(message, tb_data)
+        cause = instrumentation.call("message_parser", parser, message, tb_data)
         if cause:
             return cause
 
@@ -127,7 +168,7 @@ def get_cause(
         if issubclass(exception_type, OSError):
             os_error_parser = get_parser(OSError)
             for parser in os_error_parser.parsers:
-                cause = parser(message, tb_data)
+                cause = instrumentation.call("message_parser", parser, message, tb_data)
                 if cause:
                     return cause
                 else:
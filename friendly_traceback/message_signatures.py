@@ -0,0 +1,113 @@
+"""message_signatures.py
+
+The message parsers of runtime exceptions and the analyzers of SyntaxError
+messages are tried in order until one of them finds the cause of an
+exception; most of them only handle a single message, or a family
+of messages, and give up immediately for all others.
+
+Such functions can be given a message signature: the exact message(s)
+they handle, or a prefix, a substring or a regular expression which must
+be found in the message. The signatures are indexed so that, for a given
+message, the functions which can possibly handle it are found at once:
+exact messages are looked up in a dict, and the other signatures are
+combined into a single regular expression. Functions without a signature
+are always selected.
+"""
+import re
+from typing import Any, Dict, List, Optional, Pattern, Sequence, Tuple, Union
+
+Strings = Union[str, Tuple[str, ...], None]
+
+
+def _any_of(strings: Union[str, Tuple[str, ...]]) -> str:
+    if isinstance(strings, str):
+        strings = (strings,)
+    return "|".join(re.escape(string) for string in strings)
+
+
+def get_signature(
+    prefix: Strings = None,
+    contains: Strings = None,
+    pattern: Optional[str] = None,
+) -> Optional[str]:
+    """Returns a regular expression, to be used at the beginning of a message,
+    which matches if the message begins with ``prefix``, includes the substring
+    ``contains``, and includes a match for the regular expression ``pattern``;
+    ``prefix`` and ``contains`` can be tuples of alternatives.
+    Returns None if none of them is given.
+    """
+    conditions = []
+    if prefix is not None:
+        conditions.append(f"(?=(?:{_any_of(prefix)}))")
+    if contains is not None:
+        conditions.append(f"(?=.*?(?:{_any_of(contains)}))")
+    if pattern is not None:
+        conditions.append(f"(?=.*?(?:{pattern}))")
+    return "".join(conditions) if conditions else None
+
+
+class MessageSignatures:
+    """Message signatures of functions, indexed for a given sequence
+    of these functions."""
+
+    def __init__(self) -> None:
+        self.messages: Dict[Any, Tuple[str, ...]] = {}
+        self.patterns: Dict[Any, str] = {}
+        self._functions: List[Any] = []
+        self._index: Optional[Tuple[Dict[str, List[int]], Pattern[str], list]] = None
+
+    def add(
+        self,
+        function: Any,
+        message: Strings = None,
+        prefix: Strings = None,
+        contains: Strings = None,
+        pattern: Optional[str] = None,
+    ) -> None:
+        """Sets the signature of a function: either the exact ``message``,
+        or tuple of messages, that it handles, or the conditions
+        described in get_signature()."""
+        signature = get_signature(prefix, contains, pattern)
+        if message is not None:
+            if signature is not None:
+                raise ValueError("An exact message cannot be combined with others.")
+            self.messages[function] = (
+                (message,) if isinstance(message, str) else tuple(message)
+            )
+        elif signature is not None:
+            self.patterns[function] = signature
+        self._index = None
+
+    def select(self, functions: Sequence[Any], message: str) -> List[Any]:
+        """Returns the functions, in their original order, which can
+        possibly handle the message."""
+        if self._index is None or self._functions != functions:
+            self._functions = list(functions)
+            self._index = self._make_index(self._functions)
+        messages, matcher, groups = self._index
+        match = matcher.match(message)
+        selected = set(messages.get(message, ()))
+        selected.update(
+            position
+            for position, group in groups
+            if group is None or match[group] is not None  # type: ignore
+        )
+        return [functions[position] for position in sorted(selected)]
+
+    def _make_index(
+        self, functions: List[Any]
+    ) -> Tuple[Dict[str, List[int]], Pattern[str], list]:
+        messages: Dict[str, List[int]] = {}
+        alternatives = []
+        groups: List[Tuple[int, Optional[str]]] = []
+        for position, function in enumerate(functions):
+            if function in self.messages:
+                for message in self.messages[function]:
+                    messages.setdefault(message, []).append(position)
+            elif function in self.patterns:
+                group = f"_f{position}"
+                alternatives.append(f"(?:{self.patterns[function]}(?P<{group}>))?")
+                groups.append((position, group))
+            else:
+                groups.append((position, None))
+        return messages, re.compile("".join(alternatives), re.DOTALL), groups
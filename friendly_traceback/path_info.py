@@ -5,19 +5,31 @@ thus restricting tracebacks to code written by the users.
 
 If Friendly-traceback is used by some other program,
 it might be desirable to exclude additional files.
+
+Since the exclusion of a file is checked for every frame of a traceback,
+the excluded directories are indexed in a tree of path components,
+and the result of the check is cached for each file name; the cache
+is cleared whenever the excluded files or directories are changed using
+the functions of this module. EXCLUDED_FILE_PATH and EXCLUDED_DIR_NAMES
+must not be modified directly; code which does so anyway must then call
+``exclusions.clear()``.
 """
 import os
 import sys
-from typing import Set, TypeVar
-
-import asttokens  # Only use it as a representative to find site-packages
+from importlib.util import find_spec
+from typing import Any, Dict, Set, TypeVar
 
 from .ft_gettext import current_lang
 from .typing_info import StrPath
 
+# Only modified by the functions below; see the docstring of this module.
 EXCLUDED_FILE_PATH: Set[str] = set()
 EXCLUDED_DIR_NAMES: Set[str] = set()
-SITE_PACKAGES = os.path.abspath(os.path.join(os.path.dirname(asttokens.__file__), ".."))
+# asttokens is only used as a representative to find site-packages;
+# find_spec() locates it without importing it.
+SITE_PACKAGES = os.path.abspath(
+    os.path.join(os.path.dirname(find_spec("asttokens").origin), "..")
+)
 PYTHON_LIB = os.path.abspath(os.path.dirname(os.__file__))
 FRIENDLY = os.path.abspath(os.path.dirname(__file__))
 TESTS = os.path.abspath(os.path.join(FRIENDLY, "..", "tests"))
@@ -33,6 +45,7 @@ def exclude_file_from_traceback(full_path: StrPath) -> None:
     if full_path.startswith("<"):
         # https://github.com/friendly-traceback/friendly-traceback/issues/107
         EXCLUDED_FILE_PATH.add(full_path)
+        exclusions.clear()
         return
     # full_path could be a relative path; see issue #81
     full_path = os.path.abspath(full_path)
@@ -41,6 +54,7 @@ def exclude_file_from_traceback(full_path: StrPath) -> None:
             f"{full_path} is not a valid file path; it cannot be excluded."
         )
     EXCLUDED_FILE_PATH.add(full_path)
+    exclusions.clear()
 
 
 def exclude_directory_from_traceback(dir_name: StrPath) -> None:
@@ -60,34 +74,112 @@ def exclude_directory_from_traceback(dir_name: StrPath) -> None:
     if dir_name[-1] != os.path.sep:
         dir_name += os.path.sep
     EXCLUDED_DIR_NAMES.add(dir_name)
-
+    exclusions.clear()
+
+
+# Possible values returned by get_exclusion_kind()
+INCLUDED = 0
+EXCLUDED_PYTHON_LIB = 1  # excluded only when python_excluded is True
+EXCLUDED = 2
+
+
+class Exclusions:
+    """Index of the excluded directories, and cache of the kind
+    of exclusion of files."""
+
+    def __init__(self, max_size: int = 1024) -> None:
+        self.max_size = max_size  # number of file names whose kind is cached
+        self.kinds: Dict[str, int] = {}
+        self.tree: Dict[str, Any] = {}
+        self.indexed = False
+
+    def clear(self) -> None:
+        """To be called when EXCLUDED_FILE_PATH or EXCLUDED_DIR_NAMES
+        are changed."""
+        self.kinds.clear()
+        self.indexed = False
+
+    def get_kind(self, full_path: str) -> int:
+        """Returns the kind of exclusion of a file, see get_exclusion_kind()."""
+        kind = self.kinds.get(full_path)
+        if kind is not None:
+            return kind
+        kind = self.find_kind(full_path)
+        # A relative path is resolved using the current working directory,
+        # which could change: its kind is not cached.
+        if full_path.startswith("<") or os.path.isabs(full_path):
+            if len(self.kinds) >= self.max_size:
+                del self.kinds[next(iter(self.kinds))]  # oldest entry
+            self.kinds[full_path] = kind
+        return kind
+
+    def find_kind(self, full_path: str) -> int:
+        if full_path.startswith("<") and full_path in EXCLUDED_FILE_PATH:
+            return EXCLUDED
+        if full_path.startswith("<frozen "):
+            return EXCLUDED
+
+        full_path = os.path.abspath(full_path)
+        if self.in_excluded_directory(full_path):
+            return EXCLUDED
+        if full_path in EXCLUDED_FILE_PATH:
+            return EXCLUDED
+        # Design choice: we exclude all files from the Python standard library
+        # but not those that have been installed by the user
+        # if python_excluded is True.
+        if full_path.startswith(PYTHON_LIB) and not full_path.startswith(SITE_PACKAGES):
+            return EXCLUDED_PYTHON_LIB
+        return INCLUDED
+
+    def in_excluded_directory(self, full_path: str) -> bool:
+        """Returns True if full_path starts with one of EXCLUDED_DIR_NAMES,
+        which all end with os.path.sep.
+
+        The excluded directories are stored in a tree, where each node is
+        a dict whose keys are path components; a node containing the
+        key None corresponds to an excluded directory.
+        """
+        if not self.indexed:
+            self.tree = {}
+            for dir_name in EXCLUDED_DIR_NAMES:
+                node = self.tree
+                for part in dir_name.split(os.path.sep)[:-1]:
+                    node = node.setdefault(part, {})
+                node[None] = True
+            self.indexed = True
+
+        node = self.tree
+        # The last component is the name of the file itself.
+        for part in full_path.split(os.path.sep)[:-1]:
+            node = node.get(part)  # type: ignore
+            if node is None:
+                return False
+            if None in node:
+                return True
+        return False
+
+
+exclusions = Exclusions()
 
 dirname = os.path.abspath(os.path.dirname(__file__))
 exclude_directory_from_traceback(dirname)
 
 
-def is_excluded_file(full_path: StrPath, python_excluded: bool = True) -> bool:
-    """Determines if the file belongs to the group that is excluded from tracebacks."""
+def get_exclusion_kind(full_path: StrPath) -> int:
+    """Classifies a file according to the way it is excluded from tracebacks,
+    so that a single check can be used both for tracebacks excluding
+    files from the Python standard library and for those that do not.
+    """
     # full_path could be a pathlib.Path instance
-    full_path = str(full_path)
-    if full_path.startswith("<") and full_path in EXCLUDED_FILE_PATH:
-        return True
-    if full_path.startswith("<frozen "):
-        return True
+    return exclusions.get_kind(str(full_path))
 
-    full_path = os.path.abspath(full_path)
-    for dirs in EXCLUDED_DIR_NAMES:
-        if full_path.startswith(dirs):
-            return True
-    # Design choice: we exclude all files from the Python standard library
-    # but not those that have been installed by the user if python_excluded is True.
-    if (
-        full_path.startswith(PYTHON_LIB)
-        and not full_path.startswith(SITE_PACKAGES)
-        and python_excluded
-    ):
-        return True
-    return full_path in EXCLUDED_FILE_PATH
+
+def is_excluded_file(full_path: StrPath, python_excluded: bool = True) -> bool:
+    """Determines if the file belongs to the group that is excluded from tracebacks."""
+    kind = get_exclusion_kind(full_path)
+    if kind == EXCLUDED_PYTHON_LIB:
+        return python_excluded
+    return kind == EXCLUDED
 
 
 def include_file_in_traceback(full_path: str) -> None:
@@ -115,6 +207,7 @@ def include_file_in_traceback(full_path: str) -> None:
     full_path = str(full_path)
     full_path = os.path.abspath(full_path)
     EXCLUDED_FILE_PATH.discard(full_path)
+    exclusions.clear()
 
 
 class PathUtil:
@@ -178,7 +271,7 @@ def shorten_jupyter_kernel(path: str) -> str:  # pragma: no cover
     else:
         return ""
 
-    lines = cache.get_source_lines(path)
+    lines = cache.get_source_view(path)
     source = "".join(lines)
     source = source.strip().replace("\r", "")
     if not source:
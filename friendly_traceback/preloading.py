@@ -0,0 +1,61 @@
+"""preloading.py
+
+To keep ``import friendly_traceback`` fast, most of what is needed to
+explain exceptions is only loaded when first needed: the modules
+analyzing a given exception type are imported when this type is first
+seen, the translations are loaded when a language is first selected,
+and some tables of names are only read or indexed when first used.
+As a result, the first exception of each type takes much longer
+to explain than the following ones.
+
+``preload()``, used by ``friendly_traceback.warmup()``, loads all of
+these ahead of time, for example when a server starts.
+"""
+import gc
+from typing import Iterable, Optional, Type
+
+from .ft_gettext import current_lang, get_translation
+
+
+def preload(
+    exception_types: Optional[Iterable[Type[BaseException]]] = None,
+    langs: Optional[Iterable[str]] = None,
+) -> None:
+    """Imports the parsers and analyzers for the given exception types
+    (and warning types), and loads the translations for the given languages.
+
+    By default, this is done for all the exception types having
+    specific parsers, and for the current language.
+    """
+    # core imports the SyntaxError analyzers, as well as
+    # the third-party packages used to analyze all exceptions.
+    from . import core, message_parser, utils  # noqa
+    from .runtime_errors import modules_attributes, stdlib_modules
+
+    if exception_types is None:
+        exception_types = [*message_parser.INCLUDED_PARSERS, SyntaxError]
+    for exception_type in exception_types:
+        if issubclass(exception_type, Warning):
+            from .about_warnings import get_warning_parser
+
+            get_warning_parser(exception_type)
+        elif not issubclass(exception_type, SyntaxError):
+            message_parser.get_parser(exception_type)
+
+    for lang in [current_lang.lang] if langs is None else langs:
+        get_translation(lang)
+
+    modules_attributes.modules_attributes.load()
+    utils.similarity_indexes.preload(stdlib_modules.names)
+
+
+def freeze() -> None:
+    """Moves all objects currently tracked by the garbage collector to
+    a permanent generation, which it ignores. Done just before forking
+    worker processes, this prevents the garbage collector from writing to
+    the memory pages containing these objects, which thus remain shared
+    between the processes instead of being copied for each of them.
+    """
+    gc.collect()
+    if hasattr(gc, "freeze"):  # Python 3.7+
+        gc.freeze()
@@ -2,18 +2,22 @@
 
 This is not meant to be imported anywhere.
 
-The output is shown in the console. It should be saved in
-modules_attributes.py located in this directory.
+It should be run with each version of Python supported; the result
+is saved in modules_attributes_X.Y.txt located in this directory,
+where X.Y is the version of Python used. Each line of this file
+contains the name of an attribute followed by the names of the modules
+where it is found, separated by spaces; the lines are sorted so that
+modules_attributes.py can find a name using a binary search.
 """
+import os
 import sys
-from pprint import pprint
 
 from stdlib_modules import names
 
 all_attributes = {}
-for mod_name in names:
+for mod_name in sorted(names):
     # List compiled with Python 3.9
-    if mod_name in [
+    if mod_name.startswith("_") or mod_name in [
         "antigravity",  # has side-effects
         "binhex",  # deprecated
         "formatter",  # deprecated
@@ -37,7 +41,12 @@ for mod_name in names:
         else:
             all_attributes[attr_name] = [mod_name]
 
-with open("modules_attributes.py", "w") as f:
-    f.write(f"# Created with {sys.version_info}\n")
-    f.write("attribute_names = ")
-    pprint(all_attributes, stream=f, indent=4)
+version = "{}.{}".format(*sys.version_info)
+filename = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), f"modules_attributes_{version}.txt"
+)
+with open(filename, "w", encoding="utf-8", newline="\n") as f:
+    f.write(f"# Created with Python {sys.version.split()[0]} on {sys.platform}\n")
+    for attr_name in sorted(all_attributes, key=lambda name: name.encode("utf-8")):
+        f.write(" ".join([attr_name] + all_attributes[attr_name]) + "\n")
+print(f"{len(all_attributes)} names saved in {filename}")
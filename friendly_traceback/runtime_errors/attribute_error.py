@@ -20,7 +20,7 @@ parser = get_parser(AttributeError)
 _ = current_lang.translate
 
 
-@parser._add
+@parser._add(contains="partially initialized module '")
 def circular_import(message: str, _tb_data: TracebackData) -> CauseInfo:
     pattern = re.compile(r"partially initialized module '(.*)' has")
     match = re.search(pattern, message)
@@ -55,7 +55,7 @@ def circular_import(message: str, _tb_data: TracebackData) -> CauseInfo:
 # ======= Attribute error in module =========
 
 
-@parser._add
+@parser._add(pattern=r"module '.*' has no attribute '")
 def attribute_error_in_module(message: str, tb_data: TracebackData) -> CauseInfo:
     """Attempts to find if a module attribute or module name might have been misspelled"""
     pattern = re.compile(r"module '(.*)' has no attribute '(.*)'")
@@ -162,7 +162,7 @@ def attribute_error_in_module(message: str, tb_data: TracebackData) -> CauseInfo
     return {"cause": cause}
 
 
-@parser._add
+@parser._add(pattern=r"type object '.*' has no attribute '")
 def type_object_has_no_attribute(message: str, tb_data: TracebackData) -> CauseInfo:
     """Attempts to find if a module attribute or module name might have been misspelled"""
     pattern = re.compile(r"type object '(.*)' has no attribute '(.*)'")
@@ -184,7 +184,7 @@ def _invalid_add_note(exc_name, frame):
     return {}
 
 
-@parser._add
+@parser._add(contains="' object has no attribute '")
 def attribute_error_in_object(message: str, tb_data: TracebackData) -> CauseInfo:
     pattern = re.compile(r"'(.*)' object has no attribute '(.*)'")
     match = re.search(pattern, message)
@@ -207,7 +207,7 @@ def attribute_error_in_object(message: str, tb_data: TracebackData) -> CauseInfo
     return _attribute_error_in_object(match[1], match[2], tb_data, frame)
 
 
-@parser._add
+@parser._add(contains="' is read-only")
 def object_attribute_is_read_only(message: str, tb_data: TracebackData) -> CauseInfo:
     pattern = r"'(.*)' object attribute '(.*)' is read-only"
     match = re.search(pattern, message)
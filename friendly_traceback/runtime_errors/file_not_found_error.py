@@ -11,7 +11,7 @@ parser = get_parser(FileNotFoundError)
 _ = current_lang.translate
 
 
-@parser._add
+@parser._add(contains="No such file or directory: '")
 def no_such_file_or_directory(
     value: FileNotFoundError, _tb_data: TracebackData
 ) -> CauseInfo:
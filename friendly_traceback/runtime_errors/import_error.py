@@ -16,7 +16,7 @@ parser = get_parser(ImportError)
 _ = current_lang.translate
 
 
-@parser._add
+@parser._add(contains="' from partially initialized module '")
 def partially_initialized_module(message: str, tb_data: TracebackData) -> CauseInfo:
     # Python 3.8+
     pattern = re.compile(
@@ -34,7 +34,7 @@ def partially_initialized_module(message: str, tb_data: TracebackData) -> CauseI
     return cannot_import_name_from(match[1], match[2], tb_data)  # pragma: no cover
 
 
-@parser._add
+@parser._add(pattern=r"cannot import name '.*' from '")
 def _cannot_import_name_from(message: str, tb_data: TracebackData) -> CauseInfo:
     # Python 3.7+
     pattern = re.compile(r"cannot import name '(.*)' from '(.*)'")
@@ -44,7 +44,7 @@ def _cannot_import_name_from(message: str, tb_data: TracebackData) -> CauseInfo:
     return cannot_import_name_from(match[1], match[2], tb_data)
 
 
-@parser._add
+@parser._add(contains="cannot import name '")
 def _cannot_import_name(message: str, tb_data: TracebackData) -> CauseInfo:
     # Python 3.6 does not give us more information
     pattern = re.compile(r"cannot import name '(.*)'")
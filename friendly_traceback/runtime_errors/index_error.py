@@ -16,7 +16,7 @@ parser = get_parser(IndexError)
 _ = current_lang.translate
 
 
-@parser._add
+@parser._add(contains="assignment index out of range")
 def object_assignment_out_of_range(message: str, tb_data: TracebackData) -> CauseInfo:
     pattern = re.compile(r"(.*) assignment index out of range")
     match = re.search(pattern, message)
@@ -85,7 +85,7 @@ def cannot_identify_object(obj_type: str, bad_line: str) -> Dict:
     return {"cause": cause}
 
 
-@parser._add
+@parser._add(contains="index out of range")
 def index_out_of_range(message: str, tb_data: TracebackData) -> CauseInfo:
     pattern = re.compile(r"(.*) index out of range")
     match = re.search(pattern, message)
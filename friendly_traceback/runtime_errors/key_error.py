@@ -12,7 +12,7 @@ parser = get_parser(KeyError)
 _ = current_lang.translate
 
 
-@parser._add
+@parser._add(contains="popitem(): dictionary is empty")
 def popitem_from_empty_dict(message: str, tb_data: TracebackData) -> CauseInfo:
     if "popitem(): dictionary is empty" not in message:
         return {}
@@ -33,7 +33,7 @@ def popitem_from_empty_dict(message: str, tb_data: TracebackData) -> CauseInfo:
     return {"cause": cause, "suggest": hint}
 
 
-@parser._add
+@parser._add(contains="No keys found in the first mapping.")
 def popitem_from_empty_chain_map(message: str, tb_data: TracebackData) -> CauseInfo:
     if "No keys found in the first mapping." not in message:
         return {}
@@ -59,7 +59,7 @@ def popitem_from_empty_chain_map(message: str, tb_data: TracebackData) -> CauseI
     return {"cause": cause, "suggest": hint}
 
 
-@parser._add
+@parser._add(contains="Key not found in the first mapping: ")
 def missing_key_in_chain_map(message: str, tb_data: TracebackData) -> CauseInfo:
     """Missing keys in collections.ChainMap from using pop()
     can trigger a secondary exception with a different message.
@@ -180,7 +180,9 @@ def key_is_a_string(key: str, dict_name: str, obj: Any) -> CauseInfo:
         hint = _("Did you convert `{key}` into a string by mistake?\n").format(key=key)
         return {"cause": additional, "suggest": hint}
 
-    string_keys = [k for k in obj.keys() if isinstance(k, str)]
+    # A generator: for very large dicts, get_similar_words only
+    # considers a limited number of keys.
+    string_keys = (k for k in obj.keys() if isinstance(k, str))
     similar = utils.get_similar_words(key, string_keys)
     similar = [repr(k) for k in similar]
     if len(similar) == 1:
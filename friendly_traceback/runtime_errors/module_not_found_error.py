@@ -15,7 +15,7 @@ parser = get_parser(ModuleNotFoundError)
 _ = current_lang.translate
 
 
-@parser._add
+@parser._add(contains="' is not a package")
 def is_not_a_package(message: str, _tb_data: TracebackData) -> CauseInfo:
     pattern = re.compile(r"No module named '(.*)'; '(.*)' is not a package")
     match = re.search(pattern, message)
@@ -101,7 +101,7 @@ def curses_no_found() -> CauseInfo:
     return {"cause": cause + hint, "suggest": hint}
 
 
-@parser._add
+@parser._add(contains="No module named '")
 def no_module_named(message: str, _tb_data: TracebackData) -> CauseInfo:
     pattern = re.compile(r"No module named '(.*)'$")
     match = re.search(pattern, message)
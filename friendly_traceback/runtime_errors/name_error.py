@@ -8,8 +8,7 @@ from ..message_parser import get_parser
 from ..tb_data import TracebackData  # for type checking only
 from ..typing_info import CauseInfo, SimilarNamesInfo  # for type checking only
 from ..utils import list_to_string
-from . import stdlib_modules
-from .modules_attributes import attribute_names
+from . import modules_attributes, stdlib_modules
 
 parser = get_parser(NameError)
 _ = current_lang.translate
@@ -27,9 +26,9 @@ CUSTOM_NAMES = {"python": using_python, "python3": using_python}
 
 
 def is_module_attribute(name):
-    if name not in attribute_names:
+    names = modules_attributes.get_modules(name)
+    if not names:
         return ""
-    names = attribute_names[name]
     if len(names) == 1:
         return _(
             "`{name}` is a name found in module `{mod}`.\n"
@@ -42,7 +41,7 @@ def is_module_attribute(name):
     ).format(name=name, modules=list_to_string(names))
 
 
-@parser._add
+@parser._add(contains="free variable '")
 def free_variable_referenced(message: str, _tb_data: TracebackData) -> CauseInfo:
     pattern = re.compile(
         r"free variable '(.*)' referenced before assignment in enclosing scope"
@@ -66,7 +65,7 @@ def free_variable_referenced(message: str, _tb_data: TracebackData) -> CauseInfo
     return {"cause": cause}
 
 
-@parser._add
+@parser._add(contains="' is not defined")
 def name_not_defined(message: str, tb_data: TracebackData) -> CauseInfo:
     pattern = re.compile(r"name '(.*)' is not defined")
     match = re.search(pattern, message)
@@ -160,7 +159,7 @@ def perhaps_special_keyword(word_with_typo: str, bad_line: str) -> CauseInfo:
     For 'break' and 'continue', it verifies that it would be used on an indented line since
     not doing so would definitely result in a SyntaxError.
     """
-    tokens = token_utils.get_significant_tokens(bad_line)
+    tokens = token_utils.cached_significant_tokens(bad_line)
     if len(tokens) != 1:
         return {}
     token = tokens[0]
@@ -271,7 +270,7 @@ def missing_self(
     message = ""
     try:
         bad_statement = utils.get_bad_statement(tb_data)
-        tokens = token_utils.get_significant_tokens(bad_statement)
+        tokens = token_utils.cached_significant_tokens(bad_statement)
     except Exception:  # noqa  # pragma: no cover
         debug_helper.log(
             "Exception raised in missing_self() while trying to get tokens"
@@ -26,7 +26,7 @@ def handle_connection_error(_message: OSError, tb_data: TracebackData) -> CauseI
     return {}
 
 
-@parser._add
+@parser._add(contains="Invalid argument:")
 def invalid_argument(message: str, tb_data: TracebackData) -> CauseInfo:
     if "Invalid argument:" not in message:
         return {}
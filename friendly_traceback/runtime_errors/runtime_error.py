@@ -10,7 +10,7 @@ parser = get_parser(RuntimeError)
 _ = current_lang.translate
 
 
-@parser._add
+@parser._add(contains="changed size during iteration")
 def container_changed_size_during_iteration(
     message: str, tb_data: TracebackData
 ) -> CauseInfo:
@@ -35,7 +35,7 @@ def container_changed_size_during_iteration(
         if isinstance(obj, obj_type):
             names.append(name)
 
-    tokens = token_utils.tokenize(tb_data.bad_line)
+    tokens = token_utils.cached_tokenize(tb_data.bad_line)
     loop_keywords = []
     for tok in tokens:
         if tok.string in {"for", "while"}:
@@ -62,7 +62,7 @@ def _convert_str_to_number(
     return cause, hint
 
 
-@parser._add
+@parser._add(contains="can't take floor or mod of complex number.")
 def cant_take_floor_or_mod_of_complex_number(
     message: str, tb_data: TracebackData
 ) -> CauseInfo:
@@ -82,7 +82,7 @@ def cant_take_floor_or_mod_of_complex_number(
     return {"cause": cause}
 
 
-@parser._add
+@parser._add(contains="unsupported operand type(s) for divmod()")
 def unsupported_type_for_divmod(message: str, _tb_data: TracebackData) -> CauseInfo:
     # TODO: try with string arguments
     if "unsupported operand type(s) for divmod()" not in message:
@@ -95,7 +95,7 @@ def unsupported_type_for_divmod(message: str, _tb_data: TracebackData) -> CauseI
     return {"cause": cause}
 
 
-@parser._add
+@parser._add(contains="attribute name must be string")
 def getattr_or_hasattr_attribute_name_must_be_string(
     message: str, tb_data: TracebackData
 ) -> CauseInfo:
@@ -123,7 +123,7 @@ def getattr_or_hasattr_attribute_name_must_be_string(
     return {"cause": cause}
 
 
-@parser._add
+@parser._add(contains="can only concatenate ")
 def parse_can_only_concatenate(message: str, tb_data: TracebackData) -> CauseInfo:
     # example: can only concatenate str (not "int") to str
     pattern = re.compile(
@@ -150,7 +150,7 @@ def parse_can_only_concatenate(message: str, tb_data: TracebackData) -> CauseInf
     return {"cause": cause}
 
 
-@parser._add
+@parser._add(contains="must be str, not ")
 def parse_must_be_str(message: str, tb_data: TracebackData) -> CauseInfo:
     # python 3.6 version: must be str, not int
     # example: can only concatenate str (not "int") to str
@@ -173,7 +173,7 @@ def parse_must_be_str(message: str, tb_data: TracebackData) -> CauseInfo:
     return {"cause": cause}
 
 
-@parser._add
+@parser._add(contains="unsupported operand type(s) for ")
 def parse_unsupported_operand_type(message: str, tb_data: TracebackData) -> CauseInfo:
     more_cause = possible_hint = hint = None
     # example: unsupported operand type(s) for +: 'int' and 'str'
@@ -286,7 +286,7 @@ def parse_unsupported_operand_type(message: str, tb_data: TracebackData) -> Caus
     return cause
 
 
-@parser._add
+@parser._add(contains=" not supported between instances of ")
 def parse_order_comparison(message: str, tb_data: TracebackData) -> CauseInfo:
     # example: '<' not supported between instances of 'int' and 'str'
     pattern = re.compile(
@@ -344,7 +344,7 @@ def parse_order_comparison(message: str, tb_data: TracebackData) -> CauseInfo:
     return {"cause": cause}
 
 
-@parser._add
+@parser._add(contains="bad operand type for unary ")
 def bad_operand_type_for_unary(message: str, tb_data: TracebackData) -> CauseInfo:
     # example: bad operand type for unary +: 'str'
     pattern = re.compile(r"bad operand type for unary (.+): [\'\"](\w+)[\'\"]")
@@ -360,7 +360,7 @@ def bad_operand_type_for_unary(message: str, tb_data: TracebackData) -> CauseInf
         tb_data.original_bad_line, tb_data.bad_line
     )
     if index > 0:
-        tokens = token_utils.get_significant_tokens(tb_data.original_bad_line)
+        tokens = token_utils.cached_significant_tokens(tb_data.original_bad_line)
         if (
             tokens[index - 1] == "="
             and tokens[index - 1].end_col == tokens[index].start_col
@@ -383,7 +383,7 @@ def bad_operand_type_for_unary(message: str, tb_data: TracebackData) -> CauseInf
     return cause
 
 
-@parser._add
+@parser._add(contains=" object does not support item assignment")
 def does_not_support_item_assignment(
     message: str, _tb_data: TracebackData
 ) -> CauseInfo:
@@ -410,7 +410,7 @@ def does_not_support_item_assignment(
     return cause
 
 
-@parser._add
+@parser._add(contains="exceptions must derive from BaseException")
 def exception_derived_from_base_exception(
     message: str, _tb_data: TracebackData
 ) -> CauseInfo:
@@ -421,7 +421,7 @@ def exception_derived_from_base_exception(
     return {}
 
 
-@parser._add
+@parser._add(pattern=r" takes \d+ positional argument")
 def incorrect_nb_positional_arguments(
     message: str, tb_data: TracebackData
 ) -> CauseInfo:
@@ -444,7 +444,7 @@ def incorrect_nb_positional_arguments(
         if "." in fn_name:
             missing_self = True
         else:
-            tokens = token_utils.get_significant_tokens(tb_data.bad_line)
+            tokens = token_utils.cached_significant_tokens(tb_data.bad_line)
             prev_token = tokens[0]
             missing_self = False
             for token in tokens:
@@ -468,7 +468,7 @@ def incorrect_nb_positional_arguments(
     return cause
 
 
-@parser._add
+@parser._add(pattern=r" missing \d+ required positional argument")
 def missing_positional_arguments(message: str, _tb_data: TracebackData) -> CauseInfo:
     # example: my_function() missing 1 required positional argument
     pattern = re.compile(r"(.*) missing (\d+) required positional argument")
@@ -485,7 +485,7 @@ def missing_positional_arguments(message: str, _tb_data: TracebackData) -> Cause
     }
 
 
-@parser._add
+@parser._add(contains="' object is not callable")
 def x_is_not_callable(message: str, tb_data: TracebackData) -> CauseInfo:
     pattern = re.compile(r"'(.*)' object is not callable")
     match = re.search(pattern, message)
@@ -597,7 +597,7 @@ def forgot_to_convert_name_to_int(name: str) -> Tuple[str, str]:
     return additional_cause, hint
 
 
-@parser._add
+@parser._add(contains="can't multiply sequence by non-int of type 'str'")
 def cannot_multiply_by_str(message: str, tb_data: TracebackData) -> CauseInfo:
     if "can't multiply sequence by non-int of type 'str'" not in message:
         return {}
@@ -609,7 +609,7 @@ def cannot_multiply_by_str(message: str, tb_data: TracebackData) -> CauseInfo:
     )
     names = find_possible_integers(str, frame, tb_data.bad_line)
     if names:
-        tokens = token_utils.get_significant_tokens(tb_data.bad_line)
+        tokens = token_utils.cached_significant_tokens(tb_data.bad_line)
         int_vars = []
         for prev_token, token in zip(tokens, tokens[1:]):
             if prev_token.string in ("*", "*=") and token.string in names:
@@ -652,7 +652,7 @@ def find_possible_integers(
     return names
 
 
-@parser._add
+@parser._add(contains="' object cannot be interpreted as an integer")
 def object_cannot_be_interpreted_as_an_integer(
     message: str, tb_data: TracebackData
 ) -> CauseInfo:
@@ -698,7 +698,7 @@ def object_cannot_be_interpreted_as_an_integer(
     return cause
 
 
-@parser._add
+@parser._add(contains=" indices must be integers or slices, not ")
 def indices_must_be_integers_or_slices(
     message: str, tb_data: TracebackData
 ) -> CauseInfo:
@@ -825,7 +825,7 @@ def indices_must_be_integers_or_slices(
     return {"cause": cause}
 
 
-@parser._add
+@parser._add(prefix="slice indices must be integers or None")
 def slice_indices_must_be_integers_or_none(
     message: str, _tb_data: TracebackData
 ) -> CauseInfo:
@@ -844,7 +844,7 @@ def slice_indices_must_be_integers_or_none(
     return {"cause": cause}
 
 
-@parser._add
+@parser._add(contains="unhashable type: '")
 def unhashable_type(message: str, _tb_data: TracebackData) -> CauseInfo:
     pattern = re.compile(r"unhashable type: '(.*)'")
     match = re.search(pattern, message)
@@ -871,7 +871,7 @@ def unhashable_type(message: str, _tb_data: TracebackData) -> CauseInfo:
     return {"cause": cause}
 
 
-@parser._add
+@parser._add(contains="' object is not subscriptable")
 def object_is_not_subscriptable(message: str, tb_data: TracebackData) -> CauseInfo:
     pattern = re.compile(r"'(.*)' object is not subscriptable")
     match = re.search(pattern, message)
@@ -927,7 +927,7 @@ def object_is_not_subscriptable(message: str, tb_data: TracebackData) -> CauseIn
     return {"cause": cause + none_type}
 
 
-@parser._add
+@parser._add(contains="argument of type '")
 def argument_of_object_is_not_iterable(
     message: str, tb_data: TracebackData
 ) -> CauseInfo:
@@ -961,7 +961,7 @@ def argument_of_object_is_not_iterable(
     return {"cause": cause}
 
 
-@parser._add
+@parser._add(contains="' object is not iterable")
 def object_is_not_iterable(message: str, _tb_data: TracebackData) -> CauseInfo:
     pattern = re.compile(r"'(.*)' object is not iterable")
     match = re.search(pattern, message)
@@ -976,7 +976,7 @@ def object_is_not_iterable(message: str, _tb_data: TracebackData) -> CauseInfo:
     return {"cause": cause}
 
 
-@parser._add
+@parser._add(contains="cannot unpack non-iterable ")
 def cannot_unpack_non_iterable(message: str, _tb_data: TracebackData) -> CauseInfo:
     pattern = re.compile(r"cannot unpack non-iterable (.*) object")
     match = re.search(pattern, message)
@@ -995,7 +995,7 @@ def cannot_unpack_non_iterable(message: str, _tb_data: TracebackData) -> CauseIn
     return {"cause": cause}
 
 
-@parser._add
+@parser._add(contains="cannot convert dictionary update sequence element")
 def cannot_convert_dictionary_update_sequence(
     message: str, tb_data: TracebackData
 ) -> CauseInfo:
@@ -1030,7 +1030,7 @@ def cannot_convert_dictionary_update_sequence(
     return {"cause": cause, "suggest": hint}
 
 
-@parser._add
+@parser._add(prefix="object of type 'builtin_function_or_method' has no len()")
 def builtin_callable_has_no_len(message: str, tb_data: TracebackData) -> CauseInfo:
     if message != "object of type 'builtin_function_or_method' has no len()":
         return {}
@@ -1054,7 +1054,7 @@ def builtin_callable_has_no_len(message: str, tb_data: TracebackData) -> CauseIn
     return {"cause": cause, "suggest": hint}
 
 
-@parser._add
+@parser._add(prefix="object of type 'function' has no len()")
 def function_has_no_len(message: str, tb_data: TracebackData) -> CauseInfo:
     if message != "object of type 'function' has no len()":
         return {}
@@ -1078,7 +1078,7 @@ def function_has_no_len(message: str, tb_data: TracebackData) -> CauseInfo:
     return {"cause": cause, "suggest": hint}
 
 
-@parser._add
+@parser._add(prefix="vars() argument must have __dict__ attribute")
 def vars_arg_must_have_dict(message: str, tb_data: TracebackData) -> CauseInfo:
     if message != "vars() argument must have __dict__ attribute":
         return {}
@@ -1104,7 +1104,7 @@ def vars_arg_must_have_dict(message: str, tb_data: TracebackData) -> CauseInfo:
     return {"cause": cause}
 
 
-@parser._add
+@parser._add(pattern=r"\(\) got multiple values for argument '")
 def function_got_multiple_argument(message: str, tb_data: TracebackData) -> CauseInfo:
     pattern = r"(.*)\(\) got multiple values for argument '(.*)'"
     match = re.search(pattern, message)
@@ -1149,7 +1149,7 @@ def function_got_multiple_argument(message: str, tb_data: TracebackData) -> Caus
     return {"cause": cause}
 
 
-@parser._add
+@parser._add(prefix="object of type 'generator' has no len()")
 def generator_has_no_len(message: str, tb_data: TracebackData) -> CauseInfo:
     if message != "object of type 'generator' has no len()":
         return {}
@@ -13,7 +13,7 @@ parser = get_parser(UnboundLocalError)
 _ = current_lang.translate
 
 
-@parser._add
+@parser._add(contains="local variable '")
 def local_variable_referenced(message: str, tb_data: TracebackData) -> CauseInfo:
     pattern = re.compile(r"local variable '(.*)' referenced before assignment")
     pattern3_11 = re.compile(
@@ -52,7 +52,7 @@ def get_iterable(code: str, frame: FrameType) -> Tuple[Any, Optional[str]]:
     return obj, iterable
 
 
-@parser._add
+@parser._add(contains="not enough values to unpack (")
 def not_enough_values_to_unpack(message: str, tb_data: TracebackData) -> CauseInfo:
     pattern1 = re.compile(r"not enough values to unpack \(expected (\d+), got (\d+)\)")
     match1 = re.search(pattern1, message)
@@ -91,7 +91,7 @@ def not_enough_values_to_unpack(message: str, tb_data: TracebackData) -> CauseIn
     return {"cause": cause}
 
 
-@parser._add
+@parser._add(contains="too many values to unpack (")
 def too_many_values_to_unpack(message: str, tb_data: TracebackData) -> CauseInfo:
     pattern = re.compile(r"too many values to unpack \(expected (\d+)\)")
     match = re.search(pattern, message)
@@ -125,7 +125,7 @@ def too_many_values_to_unpack(message: str, tb_data: TracebackData) -> CauseInfo
     return {"cause": cause}
 
 
-@parser._add
+@parser._add(contains="invalid literal for int() with base ")
 def invalid_literal_for_int(message: str, _tb_data: TracebackData) -> CauseInfo:
     pattern = re.compile(r"invalid literal for int\(\) with base (\d+): '(.*)'")
     match = re.search(pattern, message)
@@ -211,7 +211,7 @@ def _convert_to_float(value: Any) -> CauseInfo:
     return {"cause": cause, "suggest": hint}
 
 
-@parser._add
+@parser._add(prefix="int() base must be")
 def base_for_int(message: str, tb_data: TracebackData) -> CauseInfo:
     if message != "int() base must be >= 2 and <= 36, or 0":
         return {}
@@ -228,7 +228,7 @@ def base_for_int(message: str, tb_data: TracebackData) -> CauseInfo:
     return {"cause": cause}
 
 
-@parser._add
+@parser._add(prefix="month must be in 1..12")
 def date_month_must_be_between_1_and_12(
     message: str, _tb_data: TracebackData
 ) -> CauseInfo:
@@ -243,7 +243,7 @@ def date_month_must_be_between_1_and_12(
     return {"cause": cause, "suggest": hint}
 
 
-@parser._add
+@parser._add(prefix="could not convert string to float: ")
 def could_not_convert_to_float(message: str, _tb_data: TracebackData) -> CauseInfo:
     if not message.startswith("could not convert string to float: "):
         return {}
@@ -259,7 +259,7 @@ def could_not_convert_to_float(message: str, _tb_data: TracebackData) -> CauseIn
     return {"cause": cause}
 
 
-@parser._add
+@parser._add(contains="' in __slots__ conflicts with class variable")
 def slots_conflicts_with_class_variable(
     message: str, _tb_data: TracebackData
 ) -> CauseInfo:
@@ -276,7 +276,7 @@ def slots_conflicts_with_class_variable(
     return {"cause": cause}
 
 
-@parser._add
+@parser._add(prefix="pow() 3rd argument cannot be 0")
 def pow_third_arg_cannot_be_zero(message: str, _tb_data: TracebackData) -> CauseInfo:
     if message != "pow() 3rd argument cannot be 0":
         return {}
@@ -304,7 +304,7 @@ def unrecognized_message(_message: str, tb_data: TracebackData) -> CauseInfo:
         if not callables:
             return {}
 
-        tokens = token_utils.get_significant_tokens(tb_data.bad_line)
+        tokens = token_utils.cached_significant_tokens(tb_data.bad_line)
         name, fn_obj = callables[0]
         if name != tokens[0]:
             return {}
@@ -323,7 +323,7 @@ def unrecognized_message(_message: str, tb_data: TracebackData) -> CauseInfo:
     return {"cause": cause}
 
 
-@parser._add
+@parser._add(pattern=r"time data '.*' does not match format '")
 def time_strftime_incorrect_format(message: str, _tb_data: TracebackData) -> CauseInfo:
     pattern = r"time data '(.*)' does not match format '(.*)'"
     match = re.search(pattern, message)
@@ -341,7 +341,7 @@ def time_strftime_incorrect_format(message: str, _tb_data: TracebackData) -> Cau
     return {"cause": cause}
 
 
-@parser._add
+@parser._add(prefix="list.remove(x): x not in list")
 def list_remove_x_not_in_list(message: str, tb_data: TracebackData) -> CauseInfo:
     if message != "list.remove(x): x not in list":
         return {}
@@ -380,7 +380,7 @@ def list_remove_x_not_in_list(message: str, tb_data: TracebackData) -> CauseInfo
     return {"cause": cause} if cause else {}
 
 
-@parser._add
+@parser._add(contains="` means already exists:")
 def generic_explanation_already_exist(
     message: str, _tb_data: TracebackData
 ) -> CauseInfo:
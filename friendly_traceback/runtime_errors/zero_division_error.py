@@ -24,7 +24,7 @@ def expression_is_zero(
     debug_helper.log("New case to consider for expression_is_zero")  # pragma: no cover
 
 
-@parser._add
+@parser._add(contains="division by zero")
 def division_by_zero(message: str, tb_data: TracebackData) -> CauseInfo:
     if message not in (
         "division by zero",
@@ -57,7 +57,7 @@ def expression_includes_division_by_zero(expression):
     ).format(expression=expression)
 
 
-@parser._add
+@parser._add(prefix="integer ")
 def integer_division_or_modulo(message: str, tb_data: TracebackData) -> CauseInfo:
     if message not in ["integer division or modulo by zero", "integer modulo by zero"]:
         return {}
@@ -97,7 +97,7 @@ def integer_division_or_modulo(message: str, tb_data: TracebackData) -> CauseInf
     return {"cause": cause}
 
 
-@parser._add
+@parser._add(prefix="0.0 cannot be raised to a negative power")
 def zero_negative_power(message: str, _tb_data: TracebackData) -> CauseInfo:
     if message != "0.0 cannot be raised to a negative power":
         return {}
@@ -108,7 +108,7 @@ def zero_negative_power(message: str, _tb_data: TracebackData) -> CauseInfo:
     return {"cause": cause}
 
 
-@parser._add
+@parser._add(prefix="float modulo")
 def float_modulo(message: str, tb_data: TracebackData) -> CauseInfo:
     if message != "float modulo":
         return {}
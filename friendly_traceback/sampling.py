@@ -0,0 +1,100 @@
+"""sampling.py
+
+When the same exception is raised over and over again, for example in
+a crash loop, explaining every occurrence can use a lot of resources
+without giving any new information.
+
+A Sampler limits the number of times identical exceptions, as identified
+by their fingerprint, are fully explained during a given time window;
+other occurrences only show a cheaper subset of the information,
+by default the Python traceback.
+
+The number of occurrences not fully explained during a time window is
+only reported when the same exception occurs again after this window
+has ended; nothing is reported for the last occurrences of a burst
+which is not followed by another one.
+"""
+import time
+from collections import OrderedDict
+from typing import List, Optional
+
+from .ft_gettext import current_lang
+from .typing_info import InclusionChoice
+
+_ = current_lang.translate
+
+
+class Sampler:
+    """Decides which exceptions are fully explained, based on
+    the number of times they have been seen recently.
+    """
+
+    def __init__(self) -> None:
+        self.max_explained: Optional[int] = None  # None: sampling is disabled
+        self.window = 60.0  # seconds
+        self.reduced_include: InclusionChoice = "python_tb"
+        self.max_fingerprints = 1000
+        # fingerprint -> [start of window, number of occurrences in window]
+        self.occurrences: "OrderedDict[str, List[float]]" = OrderedDict()
+        self.summary = ""
+
+    def configure(
+        self,
+        max_explained: Optional[int] = None,
+        window: float = 60.0,
+        reduced_include: InclusionChoice = "python_tb",
+    ) -> None:
+        """Sets the maximum number of times identical exceptions are fully
+        explained during a time window (in seconds), and what is
+        included for the other occurrences. ``None`` disables sampling.
+        """
+        self.max_explained = max_explained
+        self.window = window
+        self.reduced_include = reduced_include
+        self.occurrences.clear()
+        self.summary = ""
+
+    def is_enabled(self) -> bool:
+        return self.max_explained is not None
+
+    def get_include(
+        self,
+        fingerprint: str,
+        include: InclusionChoice,
+        now: Optional[float] = None,
+    ) -> InclusionChoice:
+        """Records an occurrence of an exception and returns what should be
+        included when showing it: either ``include`` or the reduced choice.
+
+        Sets ``self.summary`` to a message reporting the number of
+        occurrences of this exception that were not fully explained
+        in its time window, if this window has ended, and to an empty
+        string otherwise.
+        """
+        self.summary = ""
+        if self.max_explained is None:
+            return include
+        if now is None:
+            now = time.monotonic()
+
+        if fingerprint in self.occurrences:
+            self.occurrences.move_to_end(fingerprint)
+        else:
+            self.occurrences[fingerprint] = [now, 0]
+            while len(self.occurrences) > self.max_fingerprints:
+                self.occurrences.popitem(last=False)
+        record = self.occurrences[fingerprint]
+
+        if now - record[0] >= self.window:
+            nb_not_explained = int(record[1]) - self.max_explained
+            if nb_not_explained > 0:
+                self.summary = _(
+                    "This exception occurred {number:,} more times"
+                    " without being fully explained.\n"
+                ).format(number=nb_not_explained)
+            record[0] = now
+            record[1] = 0
+        record[1] += 1
+        if record[1] > self.max_explained:
+            return self.reduced_include
+        return include
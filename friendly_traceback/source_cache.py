@@ -7,19 +7,62 @@ Note that we monkeypatch Python's linecache.getlines.
 """
 import inspect
 import linecache
+import sys
 import time
-from typing import Any, Dict, Generator, List, Optional
-
-import stack_data
+from collections import OrderedDict
+from typing import Any, Dict, Generator, List, Optional, Set
 
 old_getlines = linecache.getlines  # To be monkeypatched.
 
 
+class SourceLines(tuple):
+    """Immutable sequence of the lines of a source, each ending with a newline
+    character, followed by an extra "\n" which is required when dealing
+    with EOF errors.
+
+    Since it is immutable, the same instance can be returned each time
+    friendly_traceback needs the lines of a given source, instead of a new
+    list. Slicing it, or adding it to another sequence, gives a list.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, index):  # type: ignore
+        if isinstance(index, slice):
+            return list(tuple.__getitem__(self, index))
+        return tuple.__getitem__(self, index)
+
+    def __add__(self, other):  # type: ignore
+        return list(self) + list(other)
+
+    def __radd__(self, other):  # type: ignore
+        return list(other) + list(self)
+
+
+NO_SOURCE = SourceLines(["\n"])
+
+
 class Cache:
-    """Class used to store source of files and similar objects"""
+    """Class used to store source of files and similar objects.
+
+    The number of sources added, and their total size, can be limited;
+    once a limit is exceeded, the least recently used sources are removed,
+    except for those needed to explain recorded tracebacks.
+    """
 
     def __init__(self) -> None:
-        self.local_cache: Dict[str, List[str]] = {}
+        self.local_cache: "OrderedDict[str, List[str]]" = OrderedDict()
+        self.sizes: Dict[str, int] = {}  # length of each source added
+        self.total_size = 0
+        self.max_entries: Optional[int] = None  # None means no limit
+        self.max_bytes: Optional[int] = None
+        self.evictions = 0
+        # filename -> [list of lines from linecache or our own cache,
+        #              same lines followed by "\n", SourceLines view or None];
+        # since it keeps a reference to lists which might have been removed
+        # from linecache.cache, only the most recently used entries are kept.
+        self.views: "OrderedDict[str, List[Any]]" = OrderedDict()
+        self.max_views = 32
         self.context = 4
 
     def add(self, filename: str, source: str) -> None:
@@ -40,15 +83,60 @@ class Cache:
         # mypy cannot get the type information from linecache in stdlib
         linecache.cache[filename] = entry
         self.local_cache[filename] = lines
+        self.sizes[filename] = len(source)
+        self.total_size += len(source)
+        self.enforce_limits()
 
     def remove(self, filename: str) -> None:
         """Removes an entry from the cache if it can be found."""
         if filename in self.local_cache:
             del self.local_cache[filename]
+            self.total_size -= self.sizes.pop(filename)
+        self.views.pop(filename, None)
         if filename in linecache.cache:
             del linecache.cache[filename]
         # clear stack_data cache so it pulls fresh lines from linecache
-        stack_data.Source._class_local("__source_cache", {}).pop(filename, None)
+        stack_data = sys.modules.get("stack_data")
+        if stack_data is not None:  # otherwise, there is nothing to clear
+            stack_data.Source._class_local("__source_cache", {}).pop(filename, None)
+
+    def set_limits(
+        self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None
+    ) -> None:
+        """Sets the maximum number of sources added to the cache, and their
+        maximum total size (number of characters); None means no limit."""
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.enforce_limits()
+
+    def is_over_limits(self) -> bool:
+        return (
+            self.max_entries is not None and len(self.local_cache) > self.max_entries
+        ) or (self.max_bytes is not None and self.total_size > self.max_bytes)
+
+    def enforce_limits(self) -> None:
+        """Removes the least recently used sources until the limits are
+        respected, or only sources needed by recorded tracebacks remain."""
+        if not self.is_over_limits():
+            return
+        pinned = get_pinned_filenames()
+        for filename in list(self.local_cache):
+            if not self.is_over_limits():
+                break
+            if filename not in pinned:
+                self.remove(filename)
+                self.evictions += 1
+
+    def get_stats(self) -> Dict[str, Optional[int]]:
+        """Returns the number of sources added to the cache, their total
+        size, the limits set and the number of sources evicted."""
+        return {
+            "entries": len(self.local_cache),
+            "total_size": self.total_size,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+        }
 
     def get_source_lines(
         self, filename: str, module_globals: Optional[Dict[str, Any]] = None
@@ -60,17 +148,79 @@ class Cache:
         it was modified differs from the recorded value, a fresh copy
         is retrieved.
 
-        The contents is stored as a string and returned as a list of lines,
-        each line ending with a newline character.
+        The contents is returned as a list of lines, each line ending
+        with a newline character, and including an extra "\n" at the end,
+        which is required when dealing with EOF errors.
+        This method replaces linecache.getlines(). Like the original
+        function, which returns the list stored in linecache.cache,
+        it returns the same list for as long as the source is unchanged;
+        this list must not be modified.
+        """
+        entry = self.get_entry(filename, module_globals)
+        if entry is None:  # can happen for f-strings and frozen modules
+            return ["\n"]
+        return entry[1]
+
+    def get_source_view(
+        self, filename: str, module_globals: Optional[Dict[str, Any]] = None
+    ) -> SourceLines:
+        """Same as get_source_lines(), but the contents is returned as
+        an immutable SourceLines instance, used by friendly_traceback itself.
+        It is created only once for a given list of lines obtained from
+        linecache, or from our own cache.
+        """
+        entry = self.get_entry(filename, module_globals)
+        if entry is None:
+            return NO_SOURCE
+        if entry[2] is None:
+            entry[2] = SourceLines(entry[1])
+        return entry[2]
+
+    def get_entry(
+        self, filename: str, module_globals: Optional[Dict[str, Any]] = None
+    ) -> Optional[List[Any]]:
+        """Returns [lines, lines + ["\n"], view or None] for a given filename,
+        where lines is the list obtained from linecache, or from our own
+        cache, or None if no source can be found.
         """
         lines = old_getlines(filename, module_globals=module_globals)
-        if not lines and filename in self.local_cache:
-            lines = self.local_cache[filename]
-        if not lines:  # can happen for f-strings and frozen modules
-            lines = []
-        # Adding ["\n"] is required when dealing with EOF errors
-        # Do not use append; see #174.
-        return lines + ["\n"]
+        if filename in self.local_cache:
+            self.local_cache.move_to_end(filename)
+            if not lines:
+                lines = self.local_cache[filename]
+        if not lines:
+            return None
+        entry = self.views.get(filename)
+        if entry is not None and entry[0] is lines:
+            self.views.move_to_end(filename)
+            return entry
+        # Do not modify the list of lines; see #174.
+        entry = [lines, lines + ["\n"], None]
+        self.views[filename] = entry
+        self.views.move_to_end(filename)
+        while len(self.views) > self.max_views:
+            self.views.popitem(last=False)
+        return entry
+
+
+def get_pinned_filenames() -> Set[str]:
+    """Returns the names of the files whose source might be needed to
+    explain the tracebacks, and warnings, recorded by the session."""
+    from .config import session
+
+    pinned = set()
+    for recorded in session.recorded_tracebacks:
+        if recorded.detached:
+            continue
+        data = getattr(recorded, "tb_data", None)
+        if data is None:  # WarningInfo
+            pinned.add(recorded.filename)
+            continue
+        pinned.add(data.filename)
+        pinned.update(record.filename for record in data.records)
+        if isinstance(data.value, SyntaxError):
+            pinned.add(data.value.filename)
+    return pinned
 
 
 cache = Cache()
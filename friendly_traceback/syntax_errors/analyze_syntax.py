@@ -20,7 +20,7 @@ incorrect information.
 from friendly_traceback.ft_gettext import current_lang, internal_error, unknown_case
 
 from .. import debug_helper
-from . import message_analyzer, statement_analyzer
+from . import fixers, message_analyzer, statement_analyzer
 
 _ = current_lang.translate
 
@@ -45,7 +45,11 @@ def set_cause_syntax(value, tb_data):
     specific to a given exception.
     """
     try:
-        return find_syntax_error_cause(value, tb_data)
+        with fixers.new_search():
+            return find_syntax_error_cause(value, tb_data)
+    except fixers.TooManyCandidates:
+        debug_helper.log("Too many candidate fixes; the search was abandoned.")
+        return {"cause": unknown_cause(), "suggest": unknown_case()}
     except Exception as e:  # pragma: no cover
         debug_helper.log_error(e)
         return {"cause": internal_error(e)}
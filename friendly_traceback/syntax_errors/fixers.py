@@ -1,9 +1,103 @@
 # type: ignore
-"""Various functions used to find fixes to SyntaxErrors"""
+"""Various functions used to find fixes to SyntaxErrors.
+
+Candidate fixes are obtained by replacing the strings of one or two tokens
+in a statement, and are then compiled by check_statement(). While the cause
+of a given SyntaxError is looked for, within a ``with new_search():`` block,
+the source of each list of tokens, as well as the position of each token
+in it, is only computed once, so that candidates are obtained by simply
+splicing strings. The result of check_statement() is also remembered for
+each candidate, so that none is compiled more than once, and the number of
+candidates compiled is limited to ``max_candidates``; once this limit is
+reached, the search for the cause is abandoned.
+"""
 
 import warnings
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .. import debug_helper, time_budget, token_utils
+from ..instrumentation import instrumentation
+
+MAX_CANDIDATES = 200  # compiled for a single SyntaxError
+
+
+class TooManyCandidates(BaseException):
+    """Raised by check_statement() once max_candidates have been compiled,
+    so that an analyzer does not conclude that a candidate fix is invalid
+    when it has not been compiled.
+
+    Like time_budget.TimeBudgetExceeded, it is derived from BaseException
+    so that it is not silenced by the ``except Exception`` clauses used
+    in the analysis code.
+    """
 
-from .. import debug_helper, token_utils
+
+class FixSearch:
+    """Candidate fixes examined while looking for the cause of a SyntaxError."""
+
+    def __init__(self, max_candidates: Optional[int] = None) -> None:
+        if max_candidates is None:
+            max_candidates = MAX_CANDIDATES
+        self.max_candidates = max_candidates
+        self.results: Dict[str, bool] = {}  # candidate -> check_statement()
+        self.nb_checked = 0
+        self.nb_compiled = 0
+        # id(tokens) -> (tokens, strings, source, offsets)
+        self.sources: Dict[int, tuple] = {}
+
+
+current_search: Optional[FixSearch] = None
+
+
+@contextmanager
+def new_search(max_candidates: Optional[int] = None) -> Iterator[FixSearch]:
+    """Remembers the candidate fixes examined inside a ``with`` block,
+    used when looking for the cause of a single SyntaxError."""
+    global current_search
+    saved = current_search
+    current_search = search = FixSearch(max_candidates)
+    try:
+        yield search
+    finally:
+        current_search = saved
+        instrumentation.count("fix_candidates:checked", search.nb_checked)
+        instrumentation.count("fix_candidates:compiled", search.nb_compiled)
+
+
+def get_source(tokens) -> Tuple[str, List[str], List[int]]:
+    """Returns the source obtained by untokenizing a list of tokens,
+    the strings of these tokens, and their position in the source."""
+    search = current_search
+    strings = [tok.string for tok in tokens]
+    if search is not None:
+        cached = search.sources.get(id(tokens))
+        # Tokens are mutable: the cached source is used only if it still
+        # corresponds to the same list of tokens, with the same strings.
+        if cached is not None and cached[0] is tokens and cached[1] == strings:
+            return cached[2], strings, cached[3]
+
+    offsets: List[int] = []
+    source = token_utils.untokenize(tokens, offsets)
+    if search is not None:
+        search.sources[id(tokens)] = (tokens, strings, source, offsets)
+    return source, strings, offsets
+
+
+def splice(tokens, replacements: Dict[int, str]) -> str:
+    """Returns the source obtained by untokenizing a list of tokens after
+    replacing the strings of some tokens, given by their id, stripped of
+    leading and ending spaces."""
+    source, strings, offsets = get_source(tokens)
+    parts = []
+    end = 0
+    for tok, string, offset in zip(tokens, strings, offsets):
+        if id(tok) in replacements:
+            parts.append(source[end:offset])
+            parts.append(replacements[id(tok)])
+            end = offset + len(string)
+    parts.append(source[end:])
+    return "".join(parts).strip()
 
 
 def replace_token(tokens, original_token, new_token_string=" "):
@@ -14,8 +108,8 @@ def replace_token(tokens, original_token, new_token_string=" "):
         * original_token: single token to be replaced
         * replace: new string to replace original_token.string
 
-    It creates a new list of tokens with the replacement having been done,
-    untokenize it to produce a modified source which is stripped of
+    It creates a new source with the replacement having been done,
+    as if the list of tokens had been untokenized, which is stripped of
     leading and ending spaces so that it could be inserted in a
     code sample at the beginning of a line with no indentation.
     """
@@ -32,16 +126,7 @@ def replace_token(tokens, original_token, new_token_string=" "):
         return "?"
 
     try:
-        new_tokens = []
-        for tok in tokens:
-            if tok is original_token:
-                new_token = original_token.copy()
-                new_token.string = new_token_string
-                new_tokens.append(new_token)
-            else:
-                new_tokens.append(tok)
-        source = token_utils.untokenize(new_tokens)
-        return source.strip()
+        return splice(tokens, {id(original_token): new_token_string})
     except Exception as e:  # pragma: no cover
         debug_helper.log("Problem in fixers._modify_source().")
         debug_helper.log_error(e)
@@ -57,21 +142,9 @@ def replace_two_tokens(
         debug_helper.log("second_token should not be None")
         return token_utils.untokenize(tokens)
     try:
-        new_tokens = []
-        for tok in tokens:
-            if tok is first_token:
-                new_token = first_token.copy()
-                new_token.string = first_string
-                new_tokens.append(new_token)
-            elif tok is second_token:
-                new_token = second_token.copy()
-                new_token.string = second_string
-                new_tokens.append(new_token)
-            else:
-                new_tokens.append(tok)
-
-        source = token_utils.untokenize(new_tokens)
-        return source.strip()
+        replacements = {id(second_token): second_string}
+        replacements[id(first_token)] = first_string
+        return splice(tokens, replacements)
     except Exception as e:  # pragma: no cover
         debug_helper.log("Problem in fixers.replace_two_tokens().")
         debug_helper.log_error(e)
@@ -86,10 +159,27 @@ def check_statement(statement):
     'environment' and compiled to see if it raises any SyntaxErrors.
 
     Returns True if no SyntaxError is raised, False otherwise.
+    Within a ``with new_search():`` block, raises TooManyCandidates if
+    max_candidates have already been compiled.
     """
     if not statement:  # If an empty string has been the result of modifying the code.
         return False
 
+    search = current_search
+    if search is None:
+        return _check_statement(statement)
+    search.nb_checked += 1
+    if statement in search.results:
+        return search.results[statement]
+    if search.nb_compiled >= search.max_candidates:
+        raise TooManyCandidates
+    search.nb_compiled += 1
+    result = search.results[statement] = _check_statement(statement)
+    return result
+
+
+def _check_statement(statement):
+    time_budget.check()
     statement = token_utils.strip_comment(statement)
     try:
         if statement.rstrip().endswith(":"):
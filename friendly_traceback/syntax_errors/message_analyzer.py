@@ -6,15 +6,19 @@ return relevant information to users.
 import __future__
 
 import ast
+import functools
 import re
 import sys
 
-from .. import debug_helper, token_utils, utils
+from .. import debug_helper, time_budget, token_utils, utils
 from ..ft_gettext import current_lang, please_report
+from ..instrumentation import instrumentation
+from ..message_signatures import MessageSignatures
 from . import error_in_def, fixers, statement_analyzer
 from . import syntax_utils as su
 
 MESSAGE_ANALYZERS = []
+SIGNATURES = MessageSignatures()
 _ = current_lang.translate
 
 
@@ -98,11 +102,23 @@ def _proper_decimal_or_octal_number(prev_str, bad_str):
     return {}  # pragma: no cover
 
 
-def add_python_message(func):
+def add_python_message(func=None, **signature):
     """A simple decorator that adds a function the list of functions
     that process a message given by Python.
+
+    The messages handled by the function can be specified, so that it is
+    only called for these; see message_signatures.py::
+
+        @add_python_message(message="'return' outside function")
+        def return_outside_function(message="", statement=None):
+            ...
+
+    Functions without such a signature are called for all messages.
     """
+    if func is None:
+        return functools.partial(add_python_message, **signature)
     MESSAGE_ANALYZERS.append(func)
+    SIGNATURES.add(func, **signature)
 
     # The following is not normally needed; however, for debugging purpose
     # we might wish to access the decorated function.
@@ -113,14 +129,25 @@ def add_python_message(func):
 
 
 def analyze_message(message: str = "", statement=None):
-    for case in MESSAGE_ANALYZERS:
-        cause = case(message, statement)
+    analyzers = SIGNATURES.select(MESSAGE_ANALYZERS, message)
+    for tried, case in enumerate(analyzers, start=1):
+        time_budget.check()
+        cause = instrumentation.call("message_analyzer", case, message, statement)
         if cause:
+            _count_analyzers(tried, MESSAGE_ANALYZERS.index(case) + 1)
             return cause
+    _count_analyzers(len(analyzers), len(MESSAGE_ANALYZERS))
     return {}
 
 
-@add_python_message
+def _count_analyzers(tried, in_order):
+    """Records the number of analyzers called, and the number which would
+    have been called if they had all been tried in order."""
+    instrumentation.count("message_analyzers:tried", tried)
+    instrumentation.count("message_analyzers:in_order", in_order)
+
+
+@add_python_message(prefix=("can't assign to", "cannot assign to"))
 def assign_to_conditional_expression(message: str = "", statement=None):
     if message not in (
         "can't assign to conditional expression",  # Python 3.6, 3.7
@@ -162,7 +189,7 @@ def assign_to_conditional_expression(message: str = "", statement=None):
     }
 
 
-@add_python_message
+@add_python_message(message="cannot assign to expression")
 def assign_to_expression(message: str = "", _statement=None):
     if message != "cannot assign to expression":  # Python 3.10
         return {}
@@ -177,7 +204,9 @@ def assign_to_expression(message: str = "", _statement=None):
     }
 
 
-@add_python_message
+@add_python_message(
+    contains=("can't assign to function call", "cannot assign to function call")
+)
 def assign_to_function_call(message: str = "", statement=None):
     if (
         message != "can't assign to function call"  # Python 3.6, 3.7
@@ -217,7 +246,7 @@ def assign_to_function_call(message: str = "", statement=None):
     return {"cause": cause + hint, "suggest": hint}
 
 
-@add_python_message
+@add_python_message(prefix=("can't assign to", "cannot assign to"))
 def assign_to_generator_expression(message: str = "", statement=None):
     if message not in (
         "can't assign to generator expression",  # Python 3.6, 3.7
@@ -240,7 +269,7 @@ def assign_to_generator_expression(message: str = "", statement=None):
     return {"cause": cause + hint, "suggest": hint}
 
 
-@add_python_message
+@add_python_message(contains="cannot assign to f-string expression")
 def assign_to_f_expression(message: str = "", statement=None):
     if "cannot assign to f-string expression" in message:
         cause = _(
@@ -254,7 +283,15 @@ def assign_to_f_expression(message: str = "", statement=None):
     return {}
 
 
-@add_python_message
+@add_python_message(
+    prefix=(
+        "can't assign to",
+        "assignment to keyword",
+        "cannot assign to",
+        "cannot use named assignment with",
+        "cannot use assignment expressions with",
+    )
+)
 def assign_to_keyword(message: str = "", statement=None):
     if message not in (
         "can't assign to keyword",  # Python 3.6, 3.7
@@ -334,7 +371,7 @@ def _assign_to_literal_in_for_loop(statement):
     return {}
 
 
-@add_python_message
+@add_python_message(prefix=("can't assign to", "cannot assign to"))
 def assign_to_literal(message: str = "", statement=None):
     if message not in (
         "can't assign to literal",  # Python 3.6, 3.7
@@ -425,7 +462,7 @@ def assign_to_literal(message: str = "", statement=None):
     return {"cause": cause, "suggest": hint}
 
 
-@add_python_message
+@add_python_message(prefix=("can't assign to", "cannot assign to"))
 def assign_to_operator(message: str = "", statement=None):
     bad_line = statement.bad_line.rstrip()
     if message not in (
@@ -466,7 +503,7 @@ def assign_to_operator(message: str = "", statement=None):
     return {"cause": cause, "suggest": hint}
 
 
-@add_python_message
+@add_python_message(prefix=("can't assign to", "cannot assign to"))
 def assign_to_yield_expression(message: str = "", _statement=None):
     if message not in (
         "can't assign to yield expression",
@@ -484,7 +521,7 @@ def assign_to_yield_expression(message: str = "", _statement=None):
     return {"cause": cause, "suggest": _assign_to_identifiers_only()}
 
 
-@add_python_message
+@add_python_message(contains="cannot rebind comprehension iteration variable")
 def assignment_cannot_rebind_inside_comprehension(message: str = "", _statement=None):
     if (
         "assignment expression cannot rebind comprehension iteration variable"
@@ -504,7 +541,7 @@ def assignment_cannot_rebind_inside_comprehension(message: str = "", _statement=
     return {"cause": cause}
 
 
-@add_python_message
+@add_python_message(contains="comprehension inner loop cannot rebind")
 def assignment_cannot_rebind_inside_comprehension_inner_loop(
     message: str = "", _statement=None
 ):
@@ -526,7 +563,7 @@ def assignment_cannot_rebind_inside_comprehension_inner_loop(
     return {"cause": cause}
 
 
-@add_python_message
+@add_python_message(pattern=r"annotated name '.*' can't be global")
 def annotated_name_cannot_be_global(message: str = "", statement=None):
     pattern1 = re.compile(r"annotated name '(.*)' can't be global")
     match = re.search(pattern1, message)
@@ -542,7 +579,7 @@ def annotated_name_cannot_be_global(message: str = "", statement=None):
     return {"cause": cause}
 
 
-@add_python_message
+@add_python_message(message="cannot use assignment expressions with literal")
 def augmented_assignment_with_literal(message: str = "", statement=None):
     if message != "cannot use assignment expressions with literal":
         return {}
@@ -555,7 +592,7 @@ def augmented_assignment_with_literal(message: str = "", statement=None):
     return {"cause": cause, "suggest": _assign_to_identifiers_only()}
 
 
-@add_python_message
+@add_python_message(contains="is nonlocal and global")
 def both_nonlocal_and_global(message: str = "", statement=None):
     if "is nonlocal and global" in message:
         cause = _(
@@ -566,7 +603,7 @@ def both_nonlocal_and_global(message: str = "", statement=None):
     return {}
 
 
-@add_python_message
+@add_python_message(contains="' was never closed")
 def bracket_was_expected(message: str = "", statement=None):
     pattern = re.compile("'(.*)' was never closed")  # new in Python 3.10
     match = re.search(pattern, message)
@@ -585,7 +622,7 @@ def bracket_was_expected(message: str = "", statement=None):
     return {"cause": cause, "suggest": hint}
 
 
-@add_python_message
+@add_python_message(contains="'break' outside loop")
 def break_outside_loop(message: str = "", _statement=None):
     if "'break' outside loop" in message:
         cause = _(
@@ -596,7 +633,7 @@ def break_outside_loop(message: str = "", _statement=None):
     return {}
 
 
-@add_python_message
+@add_python_message(contains="cannot assign to attribute here")
 def cannot_assign_to_attribute(message: str = "", statement=None):
     if "cannot assign to attribute here" not in message:  # new in Python 3.10
         return {}
@@ -617,7 +654,7 @@ def cannot_assign_to_attribute(message: str = "", statement=None):
     return {"cause": cause, "suggest": hint}
 
 
-@add_python_message
+@add_python_message(prefix=("can't delete", "cannot delete"))
 def cannot_delete_constant(message: str = "", statement=None):
     if message not in (
         "can't delete keyword",  # Python 3.6, 3.7
@@ -637,7 +674,7 @@ def cannot_delete_constant(message: str = "", statement=None):
     return {"cause": cause}
 
 
-@add_python_message
+@add_python_message(prefix=("can't delete", "cannot delete"))
 def cannot_delete_expression(message: str = "", statement=None):
     if message not in (
         "can't delete operator",  # Python 3.6
@@ -659,7 +696,7 @@ def cannot_delete_expression(message: str = "", statement=None):
     return {"cause": cause + _can_only_delete(), "suggest": hint}
 
 
-@add_python_message
+@add_python_message(prefix=("can't delete", "cannot delete"))
 def cannot_delete_function_call(message: str = "", statement=None):
     if message not in (
         "can't delete function call",  # Python 3.6, 3.7
@@ -678,7 +715,7 @@ def cannot_delete_function_call(message: str = "", statement=None):
     return {"cause": cause}
 
 
-@add_python_message
+@add_python_message(prefix=("can't delete", "cannot delete"))
 def cannot_delete_literal(message: str = "", statement=None):
     if message not in (
         "can't delete literal",  # Python 3.6, 3.7
@@ -695,7 +732,7 @@ def cannot_delete_literal(message: str = "", statement=None):
     return {"cause": cause}
 
 
-@add_python_message
+@add_python_message(message="cannot delete named expression")
 def cannot_delete_named_expression(message: str = "", statement=None):
     if message not in ("cannot delete named expression",):  # Python 3.8 +
         return {}
@@ -713,7 +750,9 @@ def cannot_delete_named_expression(message: str = "", statement=None):
     return {"cause": cause + _can_only_delete(), "suggest": hint}
 
 
-@add_python_message
+@add_python_message(
+    prefix=("can't use starred", "cannot use starred", "cannot delete starred")
+)
 def cannot_use_starred_expression(message: str = "", statement=None):
     if message not in [
         "can't use starred expression here",
@@ -744,7 +783,7 @@ def cannot_use_starred_expression(message: str = "", statement=None):
     return {"cause": cause}
 
 
-@add_python_message
+@add_python_message(message="expected ':'")
 def colon_expected(message: str = "", statement=None):
     if message != "expected ':'":  # new in Python 3.10
         return {}
@@ -780,7 +819,7 @@ def colon_expected(message: str = "", statement=None):
     return {}
 
 
-@add_python_message
+@add_python_message(message="':' expected after dictionary key")
 def colon_missing_after_dict_key(message: str = "", _statement=None):
     if message != "':' expected after dictionary key":
         return {}
@@ -792,7 +831,7 @@ def colon_missing_after_dict_key(message: str = "", _statement=None):
     return {"cause": cause, "suggest": hint}
 
 
-@add_python_message
+@add_python_message(contains="'continue' not properly in loop")
 def continue_outside_loop(message: str = "", _statement=None):
     if "'continue' not properly in loop" in message:
         cause = _(
@@ -803,7 +842,7 @@ def continue_outside_loop(message: str = "", _statement=None):
     return {}
 
 
-@add_python_message
+@add_python_message(contains="duplicate argument")
 def duplicate_argument_in_function_definition(message: str = "", statement=None):
     if "duplicate argument" in message and "function definition" in message:
         name = message.split("'")[1]
@@ -842,7 +881,7 @@ def locate_duplicate_arguments(statement, name):
     statement.location_markers = markers
 
 
-@add_python_message
+@add_python_message(message="expected 'else' after 'if' expression")
 def else_after_if(message: str = "", _statement=None):
     if message != "expected 'else' after 'if' expression":
         return {}
@@ -852,7 +891,12 @@ def else_after_if(message: str = "", _statement=None):
     return {"cause": cause, "suggest": hint}
 
 
-@add_python_message
+@add_python_message(
+    contains=(
+        "EOF while scanning triple-quoted string literal",
+        "unterminated triple-quoted string literal",
+    )
+)
 def eof_unclosed_triple_quoted(message: str = "", _statement=None):
     if not (
         message == "EOF while scanning triple-quoted string literal"
@@ -868,7 +912,9 @@ def eof_unclosed_triple_quoted(message: str = "", _statement=None):
     return {"cause": cause}
 
 
-@add_python_message
+@add_python_message(
+    contains=("EOL while scanning string literal", "unterminated string literal")
+)
 def eol_while_scanning_string_literal(message: str = "", statement=None):
     if not (
         "EOL while scanning string literal" in message
@@ -943,7 +989,7 @@ def eol_while_scanning_string_literal(message: str = "", statement=None):
     return {"cause": cause, "suggest": hint}
 
 
-@add_python_message
+@add_python_message(message="expected '('")
 def expected_paren(message: str = "", statement=None):
     if message != "expected '('":
         return {}
@@ -957,7 +1003,12 @@ def expected_paren(message: str = "", statement=None):
     return {}
 
 
-@add_python_message
+@add_python_message(
+    contains=(
+        "expression cannot contain assignment, perhaps you meant",
+        "keyword can't be an expression",
+    )
+)
 def expression_cannot_contain_assignment(message: str = "", statement=None):
     if (
         "expression cannot contain assignment, perhaps you meant" not in message
@@ -992,7 +1043,7 @@ def expression_cannot_contain_assignment(message: str = "", statement=None):
     return {"cause": cause}
 
 
-@add_python_message
+@add_python_message(message="expression expected after dictionary key and ':'")
 def expression_missing_after_dict_key_and_colon(message: str = "", _statement=None):
     if message != "expression expected after dictionary key and ':'":
         return {}
@@ -1004,7 +1055,7 @@ def expression_missing_after_dict_key_and_colon(message: str = "", _statement=No
     return {"cause": cause, "suggest": hint}
 
 
-@add_python_message
+@add_python_message(message="f-string expression part cannot include a backslash")
 def f_string_backslash(message: str = "", _statement=None):
     if message != "f-string expression part cannot include a backslash":
         return {}
@@ -1022,7 +1073,7 @@ def f_string_backslash(message: str = "", _statement=None):
     return {"cause": cause}
 
 
-@add_python_message
+@add_python_message(message="f-string: single '}' is not allowed")
 def f_string_curly_not_allowed(message: str = "", _statement=None):
     if message != "f-string: single '}' is not allowed":
         return {}
@@ -1034,7 +1085,7 @@ def f_string_curly_not_allowed(message: str = "", _statement=None):
     return {"cause": cause}
 
 
-@add_python_message
+@add_python_message(message="f-string: expecting '}'")
 def f_string_expecting_curly(message: str = "", _statement=None):
     if message != "f-string: expecting '}'":
         return {}
@@ -1046,7 +1097,9 @@ def f_string_expecting_curly(message: str = "", _statement=None):
     return {"cause": cause}
 
 
-@add_python_message
+@add_python_message(
+    message="did you forget parentheses around the comprehension target?"
+)
 def forgot_paren_around_comprehension(message: str = "", _statement=None):
     # Python 3.10+
     if message != "did you forget parentheses around the comprehension target?":
@@ -1066,7 +1119,9 @@ def forgot_paren_around_comprehension(message: str = "", _statement=None):
     return {"cause": cause_tuple, "suggest": hint}
 
 
-@add_python_message
+@add_python_message(
+    message="from __future__ imports must occur at the beginning of the file"
+)
 def from__future__at_begin(message: str = "", _statement=None):
     if message != "from __future__ imports must occur at the beginning of the file":
         return {}
@@ -1079,7 +1134,7 @@ def from__future__at_begin(message: str = "", _statement=None):
     return {"cause": cause}
 
 
-@add_python_message
+@add_python_message(pattern=r"future feature .* is not defined")
 def from__future__not_defined(message: str = "", _statement=None):
     pattern = re.compile(r"future feature (.*) is not defined")
     match = re.search(pattern, message)
@@ -1115,7 +1170,7 @@ def from__future__not_defined(message: str = "", _statement=None):
     return {"cause": cause}
 
 
-@add_python_message
+@add_python_message(message="Function parameters cannot be parenthesized")
 def function_parameters_cannot_be_paren(message: str = "", statement=None):
     if message != "Function parameters cannot be parenthesized":
         return {}
@@ -1129,7 +1184,7 @@ def function_parameters_cannot_be_paren(message: str = "", statement=None):
     return {}
 
 
-@add_python_message
+@add_python_message(contains="Generator expression must be parenthesized")
 def generator_expression_must_be_parenthesized(message: str = "", _statement=None):
     if "Generator expression must be parenthesized" not in message:
         return {}
@@ -1141,7 +1196,7 @@ def generator_expression_must_be_parenthesized(message: str = "", _statement=Non
     return {"cause": cause}
 
 
-@add_python_message
+@add_python_message(message="not a chance")
 def import_braces(message: str = "", _statement=None):
     if message != "not a chance":
         return {}
@@ -1155,7 +1210,7 @@ def import_braces(message: str = "", _statement=None):
     return {"cause": cause}
 
 
-@add_python_message
+@add_python_message(contains="invalid character")
 def invalid_character_in_identifier(message: str = "", statement=None):
     if "invalid character" not in message:
         return {}
@@ -1181,7 +1236,7 @@ def invalid_character_in_identifier(message: str = "", statement=None):
     return {"cause": python_says}
 
 
-@add_python_message
+@add_python_message(message="invalid decimal literal")
 def invalid_decimal_literal(message: str = "", statement=None):
     if message != "invalid decimal literal":  # new in Python 3.10
         return {}
@@ -1228,7 +1283,7 @@ def invalid_decimal_literal(message: str = "", statement=None):
     }
 
 
-@add_python_message
+@add_python_message(message="f-string: cannot use double starred expression here")
 def invalid_double_star_operator(message: str = "", _statement=None):
     # Used to be "invalid syntax" prior to Python version 3.10
     if message == "f-string: cannot use double starred expression here":
@@ -1241,7 +1296,7 @@ def invalid_double_star_operator(message: str = "", _statement=None):
     return {}
 
 
-@add_python_message
+@add_python_message(message="invalid hexadecimal literal")
 def invalid_hexadecimal_literal(message: str = "", statement=None):
     if message != "invalid hexadecimal literal":  # new in Python 3.10
         return {}
@@ -1258,7 +1313,7 @@ def invalid_hexadecimal_literal(message: str = "", statement=None):
     return statement_analyzer.invalid_hexadecimal(statement)
 
 
-@add_python_message
+@add_python_message(message="invalid imaginary literal")
 def invalid_imaginary_literal(message: str = "", statement=None):
     if message != "invalid imaginary literal":  # new in Python 3.10
         return {}
@@ -1275,7 +1330,7 @@ def invalid_imaginary_literal(message: str = "", statement=None):
     return statement_analyzer.invalid_name(statement)
 
 
-@add_python_message
+@add_python_message(contains="in octal literal")
 def invalid_octal(message: str = "", statement=None):
     # Before Python 3.8, we'd only get "invalid syntax"
     if "in octal literal" not in message:
@@ -1284,7 +1339,7 @@ def invalid_octal(message: str = "", statement=None):
     return statement_analyzer.invalid_octal(statement)
 
 
-@add_python_message
+@add_python_message(message="iterable unpacking cannot be used in comprehension")
 def iterable_unpacking_cannot_be_used_in_comprehension(
     message: str = "", statement=None
 ):
@@ -1308,7 +1363,7 @@ def iterable_unpacking_cannot_be_used_in_comprehension(
     return {"cause": cause}
 
 
-@add_python_message
+@add_python_message(message="invalid token")
 def invalid_token(message: str = "", statement=None):
     # Seen this for Python 3.6, 3.7 for would-be decimal number starting with zero.
     if message != "invalid token":
@@ -1319,7 +1374,7 @@ def invalid_token(message: str = "", statement=None):
     return _proper_decimal_or_octal_number(prev_str, bad_str)
 
 
-@add_python_message
+@add_python_message(contains="keyword argument repeated")
 def keyword_argument_repeated(message: str = "", statement=None):
     if "keyword argument repeated" not in message:
         return {}
@@ -1330,7 +1385,7 @@ def keyword_argument_repeated(message: str = "", statement=None):
     return {"cause": cause}
 
 
-@add_python_message
+@add_python_message(message="Lambda expression parameters cannot be parenthesized")
 def lambda_expression_parameters_cannot_be_paren(message: str = "", statement=None):
     if message != "Lambda expression parameters cannot be parenthesized":
         return {}
@@ -1339,7 +1394,9 @@ def lambda_expression_parameters_cannot_be_paren(message: str = "", statement=No
     return cause or {}
 
 
-@add_python_message
+@add_python_message(
+    prefix="leading zeros in decimal integer literals are not permitted"
+)
 def leading_zeros_in_decimal_integers(message: str = "", statement=None):
     # Same as previous case but for Python 3.8+
     if not (
@@ -1358,7 +1415,9 @@ def leading_zeros_in_decimal_integers(message: str = "", statement=None):
     return _proper_decimal_or_octal_number(prev_str, bad_str)
 
 
-@add_python_message
+@add_python_message(
+    pattern=r"closing parenthesis '.*' does not match opening parenthesis '"
+)
 def mismatched_parenthesis(message: str = "", statement=None):
     pattern1 = re.compile(
         r"closing parenthesis '(.*)' does not match opening parenthesis '(.*)' on line (\d+)"
@@ -1399,7 +1458,7 @@ def mismatched_parenthesis(message: str = "", statement=None):
     return {"cause": cause}  # pragma: no cover
 
 
-@add_python_message
+@add_python_message(message="named arguments must follow bare *")
 def named_arguments_must_follow_bare_star(message: str = "", _statement=None):
     # TODO: revise this as it can be greatly improved
     if message != "named arguments must follow bare *":
@@ -1414,7 +1473,7 @@ def named_arguments_must_follow_bare_star(message: str = "", _statement=None):
     return {"cause": cause, "suggest": hint}
 
 
-@add_python_message
+@add_python_message(contains="is assigned to before global declaration")
 def name_assigned_to_prior_global(message: str = "", statement=None):
     # something like: name 'p' is assigned to before global declaration
     if "is assigned to before global declaration" not in message:
@@ -1438,7 +1497,7 @@ def name_assigned_to_prior_global(message: str = "", statement=None):
     return {"cause": cause}
 
 
-@add_python_message
+@add_python_message(contains="is assigned to before nonlocal declaration")
 def name_assigned_to_prior_nonlocal(message: str = "", statement=None):
     # something like: name 'p' is assigned to before global declaration
     if "is assigned to before nonlocal declaration" not in message:
@@ -1464,7 +1523,7 @@ def name_assigned_to_prior_nonlocal(message: str = "", statement=None):
     return {"cause": cause, "suggest": hint}
 
 
-@add_python_message
+@add_python_message(contains="is parameter and global")
 def name_is_parameter_and_global(message: str = "", statement=None):
     # something like: name 'x' is parameter and global
     line = statement.entire_statement
@@ -1488,7 +1547,7 @@ def name_is_parameter_and_global(message: str = "", statement=None):
     return {"cause": cause}
 
 
-@add_python_message
+@add_python_message(contains="is parameter and nonlocal")
 def name_is_parameter_and_nonlocal(message: str = "", _statement=None):
     if "is parameter and nonlocal" not in message:
         return {}
@@ -1502,7 +1561,7 @@ def name_is_parameter_and_nonlocal(message: str = "", _statement=None):
     return {"cause": cause}
 
 
-@add_python_message
+@add_python_message(contains="is used prior to global declaration")
 def name_used_prior_global(message: str = "", statement=None):
     # something like: name 'p' is used prior to global declaration
     if "is used prior to global declaration" not in message:
@@ -1526,7 +1585,7 @@ def name_used_prior_global(message: str = "", statement=None):
     return {"cause": cause}
 
 
-@add_python_message
+@add_python_message(contains="is used prior to nonlocal declaration")
 def name_used_prior_nonlocal(message: str = "", statement=None):
     # something like: name 'q' is used prior to nonlocal declaration
     if "is used prior to nonlocal declaration" not in message:
@@ -1552,7 +1611,7 @@ def name_used_prior_nonlocal(message: str = "", statement=None):
     return {"cause": cause, "suggest": hint}
 
 
-@add_python_message
+@add_python_message(contains="no binding for nonlocal")
 def no_binding_for_nonlocal(message: str = "", _statement=None):
     if "no binding for nonlocal" not in message:
         return {}
@@ -1565,7 +1624,7 @@ def no_binding_for_nonlocal(message: str = "", _statement=None):
     return {"cause": cause}
 
 
-@add_python_message
+@add_python_message(contains="nonlocal declaration not allowed at module level")
 def nonlocal_at_module_level(message: str = "", _statement=None):
     if "nonlocal declaration not allowed at module level" not in message:
         return {}
@@ -1577,7 +1636,7 @@ def nonlocal_at_module_level(message: str = "", _statement=None):
     return {"cause": cause}
 
 
-@add_python_message
+@add_python_message(contains="non-default argument follows default argument")
 def non_default_arg_follows_default_arg(message: str = "", _statement=None):
     if "non-default argument follows default argument" not in message:
         return {}
@@ -1594,7 +1653,7 @@ def non_default_arg_follows_default_arg(message: str = "", _statement=None):
     return {"cause": cause}
 
 
-@add_python_message
+@add_python_message(message="multiple exception types must be parenthesized")
 def parens_around_exceptions(message: str = "", _statement=None):
     # keep in sync with statement_analyzer.parens_around_exceptions
     if message != "multiple exception types must be parenthesized":
@@ -1609,7 +1668,7 @@ def parens_around_exceptions(message: str = "", _statement=None):
     return {"cause": cause + "\n", "suggest": hint}
 
 
-@add_python_message
+@add_python_message(contains="positional argument follows keyword argument")
 def positional_argument_follows_keyword_arg(message: str = "", _statement=None):
     if "positional argument follows keyword argument" not in message:
         return {}
@@ -1626,7 +1685,9 @@ def positional_argument_follows_keyword_arg(message: str = "", _statement=None):
     return {"cause": cause}
 
 
-@add_python_message
+@add_python_message(
+    prefix="Missing parentheses in call to 'print'. Did you mean print("
+)
 def python2_print(message: str = "", statement=None):
     if not message.startswith(
         "Missing parentheses in call to 'print'. Did you mean print("
@@ -1652,7 +1713,7 @@ def python2_print(message: str = "", statement=None):
     return {"cause": cause, "suggest": hint}
 
 
-@add_python_message
+@add_python_message(message="'return' outside function")
 def return_outside_function(message: str = "", _statement=None):
     if message != "'return' outside function":
         return {}
@@ -1661,7 +1722,7 @@ def return_outside_function(message: str = "", _statement=None):
     return {"cause": cause}
 
 
-@add_python_message
+@add_python_message(message="starred assignment target must be in a list or tuple")
 def star_assignment_target_must_be_list(message: str = "", _statement=None):
     if message != "starred assignment target must be in a list or tuple":
         return {}
@@ -1672,7 +1733,7 @@ def star_assignment_target_must_be_list(message: str = "", _statement=None):
     return {"cause": cause}
 
 
-@add_python_message
+@add_python_message(message="cannot use a starred expression in a dictionary value")
 def starred_expression_in_dict_value(message: str = "", statement=None):
     if message != "cannot use a starred expression in a dictionary value":
         return {}
@@ -1692,7 +1753,7 @@ def starred_expression_in_dict_value(message: str = "", statement=None):
     return {"cause": cause}
 
 
-@add_python_message
+@add_python_message(message="too many statically nested blocks")
 def too_many_nested_blocks(message: str = "", _statement=None):
     if message != "too many statically nested blocks":
         return {}
@@ -1705,7 +1766,7 @@ def too_many_nested_blocks(message: str = "", _statement=None):
     return {"cause": cause}
 
 
-@add_python_message
+@add_python_message(message="too many nested parentheses")
 def too_many_nested_parenthesis(message: str = "", _statement=None):
     if message != "too many nested parentheses":  # python 3.89+
         return {}
@@ -1718,7 +1779,9 @@ def too_many_nested_parenthesis(message: str = "", _statement=None):
     return {"cause": cause}
 
 
-@add_python_message
+@add_python_message(
+    message="trailing comma not allowed without surrounding parentheses"
+)
 def trailing_comma_not_allowed(message: str = "", statement=None):
     # As far as I know, this is only in import statement; for example:
     # from math import sin, cos,
@@ -1781,7 +1844,7 @@ def trailing_comma_not_allowed(message: str = "", statement=None):
     return {"cause": cause}
 
 
-@add_python_message
+@add_python_message(contains="unexpected character after line continuation character")
 def unexpected_character_after_continuation(message: str = "", statement=None):
     if "unexpected character after line continuation character" not in message:
         return {}
@@ -1820,7 +1883,7 @@ def unexpected_character_after_continuation(message: str = "", statement=None):
     return {"cause": cause}
 
 
-@add_python_message
+@add_python_message(contains="unexpected EOF while parsing")
 def unexpected_eof_while_parsing(message: str = "", statement=None):
     if "unexpected EOF while parsing" not in message:
         return {}
@@ -1838,7 +1901,7 @@ def unexpected_eof_while_parsing(message: str = "", statement=None):
     return {"cause": cause}
 
 
-@add_python_message
+@add_python_message(contains="truncated \\UXX")
 def unicode_error(message: str = "", _statement=None):
     if "unicode error" not in message or "truncated \\UXX" not in message:
         return {}
@@ -1856,7 +1919,7 @@ def unicode_error(message: str = "", _statement=None):
     return {"cause": cause, "suggest": hint}
 
 
-@add_python_message
+@add_python_message(message=("unmatched ')'", "unmatched ']'", "unmatched '}'"))
 def unmatched_parenthesis(message: str = "", statement=None):
     # Python 3.8
     if message == "unmatched ')'":
@@ -1873,7 +1936,7 @@ def unmatched_parenthesis(message: str = "", statement=None):
     return {"cause": cause}
 
 
-@add_python_message
+@add_python_message(contains="f-string: unterminated string")
 def unterminated_f_string(message: str = "", statement=None):
     if "f-string: unterminated string" not in message:
         return {}
@@ -1903,7 +1966,7 @@ def unterminated_f_string(message: str = "", statement=None):
     return {"cause": cause, "suggest": hint}
 
 
-@add_python_message
+@add_python_message(message="'yield' outside function")
 def yield_outside_function(message: str = "", _statement=None):
     if message != "'yield' outside function":
         return {}
@@ -1912,7 +1975,7 @@ def yield_outside_function(message: str = "", _statement=None):
     return {"cause": cause}
 
 
-@add_python_message
+@add_python_message(message="You found it!")
 def you_found_it(message: str = "", statement=None):  # pragma: no cover
     if message != "You found it!" or statement.bad_token != "__peg_parser__":
         return {}
@@ -1928,12 +1991,12 @@ def you_found_it(message: str = "", statement=None):  # pragma: no cover
 # Generic cases not covered in previous specific ones.
 
 
-@add_python_message
+@add_python_message(prefix="cannot delete")
 def cannot_delete_something_else(message: str = "", _statement=None):
     return {"cause": _can_only_delete()} if message.startswith("cannot delete") else {}
 
 
-@add_python_message
+@add_python_message(prefix="cannot assign to")
 def assign_to_others(message: str = "", _statement=None):
     if not message.startswith("cannot assign to"):
         return {}
@@ -1941,7 +2004,7 @@ def assign_to_others(message: str = "", _statement=None):
     return {"cause": hint, "suggest": hint}
 
 
-@add_python_message
+@add_python_message(contains="arguments cannot follow var-keyword argument")
 def arguments_cannot_follow_var(message: str = "", statement=None):
     # new message for Python 3.11
     if "arguments cannot follow var-keyword argument" not in message:
@@ -1949,7 +2012,7 @@ def arguments_cannot_follow_var(message: str = "", statement=None):
     return error_in_def.analyze_def_statement(statement)
 
 
-@add_python_message
+@add_python_message(contains="/ must be ahead of *")
 def slash_must_be_ahead(message: str = "", statement=None):
     # new message for Python 3.11
     if "/ must be ahead of *" not in message:
@@ -1957,7 +2020,7 @@ def slash_must_be_ahead(message: str = "", statement=None):
     return error_in_def.analyze_def_statement(statement)
 
 
-@add_python_message
+@add_python_message(contains="* argument may appear only once")
 def star_may_appear_only_once(message: str = "", statement=None):
     # new message for Python 3.11
     if "* argument may appear only once" not in message:
@@ -1965,7 +2028,7 @@ def star_may_appear_only_once(message: str = "", statement=None):
     return error_in_def.analyze_def_statement(statement)
 
 
-@add_python_message
+@add_python_message(contains="/ may appear only once")
 def slash_must_appear_only_once(message: str = "", statement=None):
     # new message for Python 3.11
     if "/ may appear only once" not in message:
@@ -1973,7 +2036,7 @@ def slash_must_appear_only_once(message: str = "", statement=None):
     return error_in_def.analyze_def_statement(statement)
 
 
-@add_python_message
+@add_python_message(contains="invalid non-printable character")
 def invalid_non_printable_character(message: str = "", statement=None):
     # new message for Python 3.11
     if "invalid non-printable character" not in message:
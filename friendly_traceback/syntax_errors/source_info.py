@@ -15,6 +15,17 @@ from .syntax_utils import matching_brackets
 # neighbours, the code for the analysis can be greatly simplified as we do
 # not have to verify the existence of these neighbours.
 MEANINGLESS_TOKEN = token_utils.tokenize(" ")[0]
+# Kinds of the bad token and its neighbours in the features of a statement,
+# such as "bad_token:string"; see Statement.get_features().
+TOKEN_KINDS = (
+    ("name", token_utils.Token.is_name),
+    ("identifier", token_utils.Token.is_identifier),
+    ("keyword", token_utils.Token.is_keyword),
+    ("number", token_utils.Token.is_number),
+    ("string", token_utils.Token.is_string),
+    ("operator", token_utils.is_operator),
+    ("error", token_utils.Token.is_error),
+)
 # fmt: off
 LINE_NUMBER        = "       {:%d}| "  # noqa
 MARKED_LINE_NUMBER = "    -->{:%d}| "  # noqa
@@ -100,6 +111,7 @@ class Statement:
 
         self.first_token = None  # meaningful token
         self.last_token = None  # meaningful token
+        self.features = None  # see get_features()
 
         # The following is used to indicate the position of ^ and other
         # symbols when using where()
@@ -208,14 +220,14 @@ class Statement:
                 self.offset = e.offset
                 self.linenumber = 1
         if not source.strip():
-            self.source_lines = cache.get_source_lines(self.filename)
-            if self.source_lines == ["\n"]:
+            self.source_lines = cache.get_source_view(self.filename)
+            if len(self.source_lines) == 1:  # only the EOF "\n" was added
                 self.source_lines = ["...\n"] * (self.linenumber - 1)
                 self.source_lines.append(self.bad_line)
             source = "".join(self.source_lines)
             if not source.strip():
                 source = self.bad_line or "\n"
-        return token_utils.tokenize(source)
+        return token_utils.tokenize(source, use_cache=False)
 
     def assign_individual_token_values(self):
         """Assign values of previous and next to bad token and other
@@ -245,6 +257,41 @@ class Statement:
         else:
             self.next_token = MEANINGLESS_TOKEN
 
+    def get_features(self):
+        """Returns a summary of the statement, as a frozenset of labels,
+        which is computed only once. It is used to skip the statement
+        analyzers which require features that are absent;
+        see statement_analyzer.add_statement_analyzer().
+        """
+        if self.features is None:
+            self.features = frozenset(self.iter_features())
+        return self.features
+
+    def iter_features(self):
+        for tok in self.tokens:
+            yield f"type:{tok.name()}"
+            if tok.is_keyword():
+                yield f"keyword:{tok.string}"
+            if tok.is_operator():
+                yield f"operator:{tok.string}"
+        for bracket in self.begin_brackets:
+            yield "begin_brackets"
+            yield f"begin_bracket:{bracket.string}"
+        if self.end_bracket:
+            yield "end_bracket"
+        if self.fstring_error:
+            yield "fstring_error"
+        if self.first_token is not None:
+            yield f"first_token={self.first_token.string}"
+        for role in ("bad_token", "prev_token", "next_token"):
+            tok = getattr(self, role)
+            if tok is None:
+                continue
+            yield f"{role}={tok.string}"
+            for kind, is_kind in TOKEN_KINDS:
+                if is_kind(tok):
+                    yield f"{role}:{kind}"
+
     def format_statement(self):
         """Format the statement identified as causing the problem and possibly
         a couple of preceding statements, showing the line number and token identified.
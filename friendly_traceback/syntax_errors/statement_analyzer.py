@@ -3,15 +3,18 @@
    analyze a single statement which has been identified
    as containing a syntax error with the message "invalid syntax".
 """
+import functools
 import keyword
 import sys
 
-from .. import debug_helper, token_utils, utils
+from .. import debug_helper, time_budget, token_utils, utils
 from ..ft_gettext import current_lang, internal_error
+from ..instrumentation import instrumentation
 from . import error_in_def, fixers
 from . import syntax_utils as su
 
 STATEMENT_ANALYZERS = []
+REQUIRED_FEATURES = {}  # analyzer -> list of tuples of alternative features
 _ = current_lang.translate
 
 
@@ -46,10 +49,29 @@ def _possibly_inside_dict(statement):
     return False
 
 
-def add_statement_analyzer(func):
+def add_statement_analyzer(func=None, *, requires=()):
     """A simple decorator that adds a function to the list
-    of all functions that analyze a single statement."""
+    of all functions that analyze a single statement.
+
+    ``requires`` lists features of the statement, as given by
+    ``Statement.get_features()``, which must all be present for the function
+    to possibly find the cause of the error; a tuple of features in this
+    list means that at least one of them must be present. For example::
+
+        @add_statement_analyzer(requires=["bad_token=;"])
+        def semi_colon_instead_of_comma(statement):
+            ...
+
+    The function is not called for statements without these features.
+    """
+    if func is None:
+        return functools.partial(add_statement_analyzer, requires=requires)
     STATEMENT_ANALYZERS.append(func)
+    if requires:
+        REQUIRED_FEATURES[func] = [
+            (feature,) if isinstance(feature, str) else tuple(feature)
+            for feature in requires
+        ]
 
     # The following is needed if we wish to call explicitly
     # one of the functions below from another file.
@@ -80,20 +102,38 @@ def analyze_statement(statement):
         if cause:
             return cause
 
-    for analyzer in STATEMENT_ANALYZERS:
-        cause = analyzer(statement)
+    features = statement.get_features()
+    tried = 0
+    for position, analyzer in enumerate(STATEMENT_ANALYZERS, start=1):
+        if not all(
+            any(feature in features for feature in alternatives)
+            for alternatives in REQUIRED_FEATURES.get(analyzer, ())
+        ):
+            continue
+        time_budget.check()
+        tried += 1
+        cause = instrumentation.call("statement_analyzer", analyzer, statement)
         if cause:
+            _count_analyzers(tried, position)
             return cause
+    _count_analyzers(tried, len(STATEMENT_ANALYZERS))
     return {}
 
 
+def _count_analyzers(tried, in_order):
+    """Records the number of analyzers called, and the number which would
+    have been called without taking into account the required features."""
+    instrumentation.count("statement_analyzers:tried", tried)
+    instrumentation.count("statement_analyzers:in_order", in_order)
+
+
 # ==================
 # IMPORTANT: causes are looked at in the same order as they appear below.
 # Changing the order could possibly yield incorrect results
 # ==================
 
 
-@add_statement_analyzer
+@add_statement_analyzer(requires=["bad_token:error"])
 def invalid_non_printable_character(statement=None):
     # new message for Python 3.11
     # invalid non-printable character ...
@@ -111,7 +151,7 @@ def invalid_non_printable_character(statement=None):
     return {}
 
 
-@add_statement_analyzer
+@add_statement_analyzer(requires=["end_bracket"])
 def mismatched_brackets(statement):
     """Detecting code that ends with an unmatched closing bracket"""
     if not (statement.end_bracket and statement.bad_token == statement.last_token):
@@ -173,7 +213,7 @@ def mismatched_brackets(statement):
     return {"cause": cause}
 
 
-@add_statement_analyzer
+@add_statement_analyzer(requires=[("first_token=>>", "first_token=...")])
 def copy_pasted_code(statement):
     """Detecting code that starts with a Python prompt"""
     first_token = statement.first_token
@@ -214,7 +254,7 @@ def copy_pasted_code(statement):
     return {}  # pragma: no cover
 
 
-@add_statement_analyzer
+@add_statement_analyzer(requires=["bad_token=`"])
 def detect_backquote(statement):
     """Detecting if the error is due to using `x` which was allowed
     in Python 2.
@@ -231,7 +271,7 @@ def detect_backquote(statement):
     return {}
 
 
-@add_statement_analyzer
+@add_statement_analyzer(requires=["bad_token=:"])
 def wrong_code_block(statement):
     if not (
         statement.bad_token == ":"
@@ -273,7 +313,7 @@ def wrong_code_block(statement):
     return {"cause": cause, "suggest": hint}
 
 
-@add_statement_analyzer
+@add_statement_analyzer(requires=["prev_token=."])
 def keyword_as_attribute(statement):
     """Will identify something like  obj.True ..."""
     if statement.prev_token != ".":
@@ -291,7 +331,9 @@ def keyword_as_attribute(statement):
     return {"cause": cause, "suggest": hint}
 
 
-@add_statement_analyzer
+@add_statement_analyzer(
+    requires=[("bad_token=elseif", "prev_token=elseif", "bad_token=if")]
+)
 def confused_elif(statement):
     name = None
     # skipcq: PYL-R1714
@@ -319,7 +361,7 @@ def confused_elif(statement):
     return {}
 
 
-@add_statement_analyzer
+@add_statement_analyzer(requires=["bad_token=from", "first_token=import"])
 def import_from(statement):
     if statement.bad_token != "from" or statement.tokens[0] != "import":
         return {}
@@ -341,7 +383,7 @@ def import_from(statement):
     return {"cause": cause, "suggest": hint}
 
 
-@add_statement_analyzer
+@add_statement_analyzer(requires=["prev_token:string"])
 def misplaced_quote(statement):
     """This looks for a single misplaced quote, something like
        info = 'I don't mind.'
@@ -416,7 +458,7 @@ def detect_walrus(statement):
     return {}
 
 
-@add_statement_analyzer
+@add_statement_analyzer(requires=["bad_token:operator"])
 def inverted_operators(statement):
     """Detect if operators might have been inverted"""
     is_op = token_utils.is_operator
@@ -469,7 +511,7 @@ def inverted_operators(statement):
     return {"cause": cause + more_errors(), "suggest": hint}
 
 
-@add_statement_analyzer
+@add_statement_analyzer(requires=["bad_token:operator", "prev_token:operator"])
 def consecutive_operators(statement):
     is_op = token_utils.is_operator
 
@@ -561,7 +603,7 @@ def walrus_instead_of_equal(statement):
     return {}
 
 
-@add_statement_analyzer
+@add_statement_analyzer(requires=[("bad_token==", "next_token==")])
 def assign_instead_of_equal(statement):
     """Checks to see if an assignment sign, '=', has been used instead of
     an equal sign, '==', in an if, elif or while statement."""
@@ -607,7 +649,7 @@ def assign_instead_of_equal(statement):
     return {"cause": cause, "suggest": hint}
 
 
-@add_statement_analyzer
+@add_statement_analyzer(requires=["first_token=print"])
 def print_as_statement(statement):
     # example: print len('hello')
     if not (
@@ -641,7 +683,9 @@ def print_as_statement(statement):
     return {"cause": cause, "suggest": hint}
 
 
-@add_statement_analyzer
+@add_statement_analyzer(
+    requires=[("first_token=pip", "first_token=python", "first_token=python3")]
+)
 def calling_python_or_pip(statement):
     if statement.first_token.string not in ("pip", "python", "python3"):
         return {}
@@ -671,7 +715,7 @@ def calling_python_or_pip(statement):
     return {"cause": cause}
 
 
-@add_statement_analyzer
+@add_statement_analyzer(requires=["prev_token=."])
 def dot_followed_by_bracket(statement):
     if statement.bad_token.string in "()[]{}" and statement.prev_token == ".":
         cause = _("You cannot have a dot `.` followed by `{bracket}`.\n").format(
@@ -689,7 +733,7 @@ def dot_followed_by_bracket(statement):
     return {"cause": cause}
 
 
-@add_statement_analyzer
+@add_statement_analyzer(requires=["first_token=raise"])
 def raise_single_exception(statement):
     if statement.first_token != "raise":
         return {}
@@ -702,7 +746,7 @@ def raise_single_exception(statement):
     return {}
 
 
-@add_statement_analyzer
+@add_statement_analyzer(requires=["bad_token=**"])
 def invalid_double_star_operator(statement):
     if statement.bad_token == "**":
         cause = _(
@@ -769,7 +813,7 @@ def missing_colon(statement):
     return {"cause": cause, "suggest": hint}
 
 
-@add_statement_analyzer
+@add_statement_analyzer(requires=["bad_token=;"])
 def semi_colon_instead_of_comma(statement):
     """Writing a semicolon as a typo"""
     if statement.bad_token != ";":
@@ -791,7 +835,7 @@ def semi_colon_instead_of_comma(statement):
     else:
         new_statement = statement.entire_statement
     while True:
-        tokens = token_utils.tokenize(new_statement)
+        tokens = token_utils.cached_tokenize(new_statement)
         for tok in tokens:
             if tok == ";":
                 break
@@ -806,7 +850,7 @@ def semi_colon_instead_of_comma(statement):
     return {}  # pragma: no cover
 
 
-@add_statement_analyzer
+@add_statement_analyzer(requires=["bad_token=;"])
 def semi_colon_instead_of_colon(statement):
     """Writing a semicolon as a typo"""
     if statement.bad_token != ";":
@@ -953,7 +997,7 @@ def debug_fstring(statement):
     return {}  # pragma: no cover
 
 
-@add_statement_analyzer
+@add_statement_analyzer(requires=["fstring_error"])
 def general_fstring_problem(statement):  # pragma: no cover
     # General f-string problems are outside of our main priorities.
     if not statement.fstring_error:
@@ -966,7 +1010,7 @@ def general_fstring_problem(statement):  # pragma: no cover
     return {"cause": cause}
 
 
-@add_statement_analyzer
+@add_statement_analyzer(requires=[("bad_token==", "bad_token:keyword")])
 def assign_to_a_keyword(statement):
     """Checks to see if line is of the form 'keyword = ...'"""
     hint = _("Python keywords cannot be used as identifiers (variable names).\n")
@@ -987,7 +1031,7 @@ def assign_to_a_keyword(statement):
     return {"cause": cause, "suggest": hint}
 
 
-@add_statement_analyzer
+@add_statement_analyzer(requires=["bad_token=("])
 def lambda_with_paren(statement):
     if statement.bad_token != "(":
         return {}
@@ -1062,7 +1106,9 @@ def wrong_type_declaration(statement):
     return {"cause": cause, "suggest": hint}
 
 
-@add_statement_analyzer
+@add_statement_analyzer(
+    requires=["begin_bracket:{", "bad_token=:", "prev_token:string"]
+)
 def missing_comma_before_string_in_dict(statement):
     """Special case where keys and values in a dict are strings which are
     not separated by commas."""
@@ -1104,7 +1150,7 @@ def missing_comma_before_string_in_dict(statement):
     return {"cause": cause, "suggest": hint}
 
 
-@add_statement_analyzer
+@add_statement_analyzer(requires=["keyword:for"])
 def missing_in_with_for(statement):
     """Whenever we have a 'for' keyword, there should be a corresponding
     'in' keyword. Cases where 'in' have been misspelled are taken care below.
@@ -1141,7 +1187,7 @@ def missing_in_with_for(statement):
     return {}
 
 
-@add_statement_analyzer
+@add_statement_analyzer(requires=["prev_token=range"])
 def missing_parens_for_range(statement):
     if statement.prev_token != "range" or statement.last_token != ":":
         return {}
@@ -1195,7 +1241,7 @@ def misspelled_python_keyword(tokens, bad_token):
     return {"cause": cause, "suggest": hint}
 
 
-@add_statement_analyzer
+@add_statement_analyzer(requires=["begin_brackets"])
 def comprehension_condition_or_tuple(statement):
     if not statement.begin_brackets:
         return {}
@@ -1248,7 +1294,7 @@ def comprehension_condition_or_tuple(statement):
     return {"cause": cause}
 
 
-@add_statement_analyzer
+@add_statement_analyzer(requires=["bad_token=,", "first_token=except"])
 def parens_around_exceptions(statement):
     # keep in sync with message_analyzer.parens_around_exceptions
     if statement.bad_token != "," or statement.first_token != "except":
@@ -1267,14 +1313,14 @@ def parens_around_exceptions(statement):
     return {"cause": cause, "suggest": hint}
 
 
-@add_statement_analyzer
+@add_statement_analyzer(requires=["bad_token:name"])
 def current_is_misspelled_python_keyword(statement):
     if not statement.bad_token.is_name():
         return {}
     return misspelled_python_keyword(statement.tokens, statement.bad_token)
 
 
-@add_statement_analyzer
+@add_statement_analyzer(requires=["prev_token:name"])
 def previous_is_misspelled_python_keyword(statement):
     if not statement.prev_token.is_name():
         return {}
@@ -1317,7 +1363,9 @@ def space_in_variable_name(statement):
     return {}
 
 
-@add_statement_analyzer
+@add_statement_analyzer(
+    requires=["bad_token:string", ("prev_token=bf", "prev_token=fb")]
+)
 def impossible_binary_fstring(statement):
     if (
         statement.bad_token.is_string()
@@ -1488,7 +1536,7 @@ def missing_comma_or_operator(statement):
     return {"cause": cause, "suggest": hint}
 
 
-@add_statement_analyzer
+@add_statement_analyzer(requires=["begin_bracket:{", "bad_token=="])
 def equal_instead_of_colon_in_dict(statement):
     if not (
         statement.begin_brackets
@@ -1506,7 +1554,7 @@ def equal_instead_of_colon_in_dict(statement):
     return {"cause": cause}
 
 
-@add_statement_analyzer
+@add_statement_analyzer(requires=[("bad_token=and", "bad_token=or")])
 def boolean_instead_of_comma(statement):
     # Example: from math import sin and cos
     # Includes cases where boolean added after comma
@@ -1536,7 +1584,7 @@ def boolean_instead_of_comma(statement):
     return {}
 
 
-@add_statement_analyzer
+@add_statement_analyzer(requires=["bad_token=as", "first_token=from"])
 def from_import_as(statement):
     """from module import ... as ..., with 'as' flagged as the bad token"""
     if not (
@@ -1559,7 +1607,7 @@ def from_import_as(statement):
     return {"cause": cause}
 
 
-@add_statement_analyzer
+@add_statement_analyzer(requires=["first_token=del"])
 def delete_names_or_items(statement):
     if statement.first_token != "del":
         return {}
@@ -1608,7 +1656,7 @@ def extra_token(statement):
     return {}
 
 
-@add_statement_analyzer
+@add_statement_analyzer(requires=["begin_bracket:{"])
 def missing_value_in_dict(statement):
     if not _possibly_inside_dict(statement):
         return {}
@@ -1628,7 +1676,7 @@ def missing_value_in_dict(statement):
     return {"cause": cause, "suggest": hint}
 
 
-@add_statement_analyzer
+@add_statement_analyzer(requires=["first_token=else", "bad_token=else"])
 def else_with_no_match(statement):
     if not (
         statement.bad_token == statement.first_token == "else"
@@ -1643,7 +1691,7 @@ def else_with_no_match(statement):
     return {"cause": cause}
 
 
-@add_statement_analyzer
+@add_statement_analyzer(requires=["first_token=elif", "bad_token=elif"])
 def elif_with_no_matching_if(statement):
     if not (
         statement.bad_token == statement.first_token == "elif"
@@ -1701,7 +1749,7 @@ def bracket_instead_of_paren(statement):
 # or the last token on the line.
 # The method I use to identify a statement can get matching
 # brackets from what is another Python statement.
-@add_statement_analyzer
+@add_statement_analyzer(requires=["begin_brackets"])
 def unclosed_bracket(statement):
     if not statement.begin_brackets:
         return {}
@@ -1753,8 +1801,7 @@ def unclosed_bracket(statement):
     if not fixers.check_statement(statement.bad_line):
         return {}
 
-    tokens = token_utils.tokenize(statement.bad_line.strip())
-    tokens = token_utils.remove_meaningless_tokens(tokens)
+    tokens = token_utils.cached_significant_tokens(statement.bad_line.strip())
     if tokens[0].string in ["for", "if"] and tokens[-1] == ":":
         if bracket == "(":
             cause = _(
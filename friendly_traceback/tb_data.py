@@ -4,7 +4,6 @@ import io
 import sys
 import traceback
 import types
-from itertools import dropwhile
 from typing import List, Optional, Tuple, Type
 
 from stack_data import BlankLines, Options
@@ -12,12 +11,15 @@ from stack_data import BlankLines, Options
 from . import debug_helper
 from .frame_info import FrameInfo
 from .ft_gettext import current_lang
-from .path_info import is_excluded_file
+from .instrumentation import instrumentation
+from .path_info import EXCLUDED, INCLUDED, get_exclusion_kind
 from .source_cache import cache
 from .syntax_errors import source_info
 from .typing_info import _E
 
 STR_FAILED = "<exception str() failed>"  # Same as Python
+# Options used by traceback.format_exception()
+TB_EXCEPTION_OPTIONS = {"compact": True} if sys.version_info >= (3, 10) else {}
 _ = current_lang.translate
 
 
@@ -33,7 +35,12 @@ def convert_value_to_message(value: BaseException) -> str:
     return message
 
 
-def retrieve_message(etype: Type[_E], value: _E, tb: types.TracebackType) -> str:
+def retrieve_message(
+    etype: Type[_E],
+    value: _E,
+    tb: types.TracebackType,
+    tb_exception: Optional[traceback.TracebackException] = None,
+) -> str:
     "Safely retrieves the message, including any additional hint from Python."
     message = convert_value_to_message(value)
     if (
@@ -43,11 +50,49 @@ def retrieve_message(etype: Type[_E], value: _E, tb: types.TracebackType) -> str
     ):
         return message
     # 3.10+ hints are not directly accessible from Python.
+    if sys.version_info >= (3, 12):
+        # The hint is computed when a TracebackException is created.
+        if tb_exception is None:
+            tb_exception = traceback.TracebackException(etype, value, tb)
+        lines = "".join(tb_exception.format_exception_only()).split("\n")
+    else:
+        lines = get_lines_with_hint(etype, value, tb)
+    prefix = etype.__name__ + ":"
+    for line in reversed(lines):
+        if line.startswith(prefix):
+            return line.split(":", 1)[1].strip()
+    return message  # pragma: no cover
+
+
+def get_lines_with_hint(
+    etype: Type[_E], value: _E, tb: types.TracebackType
+) -> List[str]:
+    """For Python 3.10 and 3.11, the hint is only computed when
+    the exception is printed by sys.__excepthook__.
+    To avoid formatting the entire traceback, including chained exceptions,
+    a second time, only the last frame, which is the one used by
+    Python to find the hint, is temporarily kept.
+    """
+    last_tb = tb
+    while last_tb is not None and last_tb.tb_next is not None:
+        last_tb = last_tb.tb_next
+    saved_traceback = value.__traceback__
+    saved_cause = value.__cause__
+    saved_context = value.__context__
+    saved_suppress_context = value.__suppress_context__
     err = io.StringIO()
-    with contextlib.redirect_stderr(err):
-        sys.__excepthook__(etype, value, tb)
-    full_message = err.getvalue().split("\n")[-2]
-    return full_message.split(":", 1)[1].strip()
+    try:
+        value.__traceback__ = last_tb
+        value.__cause__ = None
+        value.__context__ = None
+        with contextlib.redirect_stderr(err):
+            sys.__excepthook__(etype, value, last_tb)
+    finally:
+        value.__traceback__ = saved_traceback
+        value.__cause__ = saved_cause
+        value.__context__ = saved_context
+        value.__suppress_context__ = saved_suppress_context
+    return err.getvalue().split("\n")
 
 
 class TracebackData:
@@ -69,10 +114,16 @@ class TracebackData:
         self.exception_name = etype.__name__
         self.value = value
         self.message = str(value)
-        self.full_message = retrieve_message(etype, value, tb)
-        self.formatted_tb = traceback.format_exception(etype, value, tb)
-        self.records = self.get_records(tb)
-        self.python_records = self.get_records(tb, python_excluded=False)
+        # Same as traceback.format_exception(etype, value, tb), but keeping
+        # the TracebackException to retrieve the hint (if any) from it.
+        with instrumentation.timed("tb_data.formatting"):
+            tb_exception = traceback.TracebackException(
+                type(value), value, tb, **TB_EXCEPTION_OPTIONS
+            )
+            self.formatted_tb = list(tb_exception.format())
+            self.full_message = retrieve_message(etype, value, tb, tb_exception)
+        with instrumentation.timed("tb_data.records"):
+            self.records, self.python_records = self.collect_records(tb)
 
         # The following three attributes get their correct values in get_source_info()
         self.bad_line = "\n"
@@ -82,7 +133,8 @@ class TracebackData:
         self.exception_instance = None
         self.program_stopped_frame = None
         self.program_stopped_bad_line = "\n"
-        self.get_source_info()
+        with instrumentation.timed("tb_data.source_info"):
+            self.get_source_info()
 
         # The following attributes get their correct values in self.locate_error()
         self.node = None
@@ -91,9 +143,10 @@ class TracebackData:
         self.program_stopped_node_range = None
 
         if issubclass(etype, SyntaxError):
-            self.statement: Optional[source_info.Statement] = source_info.Statement(
-                self.value, self.bad_line
-            )
+            with instrumentation.timed("tb_data.statement"):
+                self.statement: Optional[source_info.Statement] = source_info.Statement(
+                    self.value, self.bad_line
+                )
             # Removing extra ending spaces for potentially shorter displays later on
 
             def remove_space(text: str) -> str:
@@ -109,7 +162,8 @@ class TracebackData:
             self.statement.bad_line = remove_space(self.statement.bad_line)
         else:
             self.statement = None
-            self.locate_error()
+            with instrumentation.timed("tb_data.locate_error"):
+                self.locate_error()
 
     def get_records(
         self, tb: types.TracebackType, python_excluded: bool = True
@@ -118,6 +172,22 @@ class TracebackData:
         from our own code that are included either at the beginning or
         at the end of the traceback.
         """
+        records, python_records = self.collect_records(tb)
+        return records if python_excluded else python_records
+
+    def collect_records(
+        self, tb: types.TracebackType
+    ) -> Tuple[List[FrameInfo], List[FrameInfo]]:
+        """Get the traceback frame history, with a single walk of the stack,
+        and returns two views of it, excluding those frames originating
+        from our own code that are included either at the beginning or
+        at the end of the traceback:
+
+        1. excluding as well the code from Python's standard library
+           (as seen by users);
+        2. including the code from Python's standard library
+           (used for the simulated Python traceback).
+        """
         try:
             all_records = list(
                 FrameInfo.stack_data(
@@ -126,50 +196,30 @@ class TracebackData:
                     collapse_repeated_frames=False,
                 )
             )
-            records = list(
-                dropwhile(
-                    lambda record: is_excluded_file(
-                        record.filename, python_excluded=python_excluded
-                    ),
-                    all_records,
-                )
-            )
-            records.reverse()
-            records = list(
-                dropwhile(
-                    lambda record: is_excluded_file(
-                        record.filename, python_excluded=python_excluded
-                    ),
-                    records,
-                )
-            )
-            records.reverse()
-            if records or issubclass(self.exception_type, (SyntaxError, MemoryError)):
-                return records
         except AssertionError:  # from stack_data
             # problems may arise when SyntaxErrors are raise
             # from a normal console like the one used in Mu.
             all_records = inspect.getinnerframes(tb, cache.context)
-            records = list(
-                dropwhile(
-                    lambda record: is_excluded_file(
-                        record.filename, python_excluded=python_excluded
-                    ),
-                    all_records,
-                )
-            )
-            records.reverse()
-            records = list(
-                dropwhile(
-                    lambda record: is_excluded_file(
-                        record.filename, python_excluded=python_excluded
-                    ),
-                    records,
-                )
-            )
-            records.reverse()
-            if records or issubclass(self.exception_type, (SyntaxError, MemoryError)):
-                return records
+
+        kinds = [get_exclusion_kind(record.filename) for record in all_records]
+        return (
+            self.trim_records(all_records, [kind != INCLUDED for kind in kinds]),
+            self.trim_records(all_records, [kind == EXCLUDED for kind in kinds]),
+        )
+
+    def trim_records(self, all_records: list, excluded: List[bool]) -> list:
+        """Removes the excluded records found either at the beginning or
+        at the end of the traceback.
+        """
+        start = 0
+        end = len(all_records)
+        while start < end and excluded[start]:
+            start += 1
+        while end > start and excluded[end - 1]:
+            end -= 1
+        records = all_records[start:end]
+        if records or issubclass(self.exception_type, (SyntaxError, MemoryError)):
+            return records
         # If all the records are removed, it likely means that all the error
         # is in our own code - or that of the user who chose to exclude
         # some files. If so, we make sure to have something to analyze
@@ -210,7 +260,7 @@ class TracebackData:
 
             # this can happen with editors_helpers.check_syntax()
             try:
-                self.bad_line = cache.get_source_lines(self.filename)[
+                self.bad_line = cache.get_source_view(self.filename)[
                     self.value.lineno - 1
                 ]
             except Exception:  # noqa
@@ -227,7 +277,7 @@ class TracebackData:
             # protecting against https://github.com/alexmojaki/stack_data/issues/13
             if not self.bad_line:
                 try:
-                    lines = cache.get_source_lines(record.filename)
+                    lines = cache.get_source_view(record.filename)
                     self.bad_line = lines[record.lineno - 1]
                 except Exception:  # noqa
                     debug_helper.log("Could not get bad_line")
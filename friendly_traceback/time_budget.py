@@ -0,0 +1,54 @@
+"""time_budget.py
+
+With some unusual inputs, finding the explanation of an exception can
+take a long time: evaluating expressions to show the values of variables,
+calling ``repr()`` on user objects, or compiling many possible fixes
+for a SyntaxError.
+
+A time budget can be set for the explanation given by the exception hook.
+The code doing the analysis calls ``check()`` regularly; once the budget
+has been used, ``check()`` raises ``TimeBudgetExceeded``, and the parts
+of the explanation which were not computed are left out.
+Outside of a ``limit()`` block, ``check()`` does nothing.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+
+class TimeBudgetExceeded(BaseException):
+    """Raised by check() once the time budget has been used.
+
+    It is derived from BaseException so that it is not silenced by the
+    many ``except Exception`` clauses used in the analysis code.
+    """
+
+
+_state = threading.local()
+
+
+@contextmanager
+def limit(max_ms: Optional[float]) -> Iterator[None]:
+    """Sets a time budget, in milliseconds, for the code run inside
+    a ``with`` block. ``None`` means that there is no time limit.
+    """
+    saved = getattr(_state, "deadline", None)
+    if max_ms is not None:
+        _state.deadline = time.perf_counter() + max_ms / 1000
+    try:
+        yield
+    finally:
+        _state.deadline = saved
+
+
+def expired() -> bool:
+    """Returns True if the current time budget has been used."""
+    deadline = getattr(_state, "deadline", None)
+    return deadline is not None and time.perf_counter() > deadline
+
+
+def check() -> None:
+    """Raises TimeBudgetExceeded if the current time budget has been used."""
+    if expired():
+        raise TimeBudgetExceeded
@@ -8,8 +8,9 @@ import ast
 import keyword
 import sys
 import tokenize as py_tokenize
+from collections import OrderedDict
 from io import StringIO
-from typing import Any, Iterable, List, Sequence, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 from . import debug_helper
 
@@ -23,6 +24,9 @@ UNCLOSED = -9
 assert UNCLOSED not in py_tokenize.tok_name
 py_tokenize.tok_name[UNCLOSED] = "UNCLOSED_STRING"
 
+# Types of tokens whose strings are often repeated, and thus interned.
+_INTERNED_TYPES = frozenset((py_tokenize.NAME, py_tokenize.OP))
+
 
 class Token:
     """Token as generated from Python's tokenize.generate_tokens written here in
@@ -40,23 +44,55 @@ class Token:
     we can change the value of any token's attribute, untokenize the list and
     automatically obtain a transformed source. Almost always, the attribute
     to be transformed will be the string attribute.
+
+    Since many tokens are created, their attributes are stored in slots
+    instead of a per-instance dict, and the strings of names and operators
+    are interned, so that identical ones are stored only once
+    and are usually compared by identity.
     """
 
+    __slots__ = (
+        "type",
+        "string",
+        "start",
+        "start_row",
+        "start_col",
+        "end",
+        "end_row",
+        "end_col",
+        "line",
+    )
+
     def __init__(self, token: _TokenInfo) -> None:
         self.type = token[0]
-        self.string = token[1]
+        if self.type in _INTERNED_TYPES:
+            self.string = sys.intern(token[1])
+        else:
+            self.string = token[1]
         self.start = self.start_row, self.start_col = token[2]
         self.end = self.end_row, self.end_col = token[3]
         self.line = token[4]
 
     def copy(self) -> "Token":
         """Makes a copy of a given token"""
-        return Token((self.type, self.string, self.start, self.end, self.line))
+        new = Token.__new__(Token)
+        new.type = self.type
+        new.string = self.string
+        new.start = self.start
+        new.start_row = self.start_row
+        new.start_col = self.start_col
+        new.end = self.end
+        new.end_row = self.end_row
+        new.end_col = self.end_col
+        new.line = self.line
+        return new
 
     def __eq__(self, other: object) -> bool:
         """Compares a Token with another object; returns true if
         self.string == other.string or if self.string == other.
         """
+        if other.__class__ is str:  # most common case, by far
+            return self.string == other
         return self.string == str(other)
 
     def __repr__(self) -> str:  # pragma: no cover
@@ -243,12 +279,105 @@ def fix_empty_line(source: str, tokens: Sequence[Token]) -> None:
     tokens[-1].string = source[-nb:]
 
 
-def tokenize(source: str) -> List[Token]:
+class TokenCache:
+    """Least recently used cache of the tokens obtained from a given source,
+    and of the significant tokens only, as tuples of Tokens which
+    are shared by all users of the cache and must not be modified.
+
+    Both the number of entries and their total number of tokens are limited;
+    the tokens of a source exceeding the latter limit are not cached.
+    """
+
+    def __init__(self, max_entries: int = 256, max_tokens: int = 20_000) -> None:
+        self.max_entries = max_entries
+        self.max_tokens = max_tokens
+        self.nb_tokens = 0  # total number of tokens in the entries
+        # (kind, source) -> tokens, where kind is "all" or "significant"
+        self.entries: "OrderedDict[Tuple[str, str], Tuple[Token, ...]]" = OrderedDict()
+        self.requests = 0  # number of times the tokens of a source were needed
+        self.tokenizations = 0  # number of times a source was actually tokenized
+
+    def get(self, kind: str, source: str) -> Tuple[Token, ...]:
+        key = (kind, source)
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            return self.entries[key]
+        if kind == "all":
+            self.tokenizations += 1
+            tokens = tuple(_tokenize(source))
+        else:
+            tokens = tuple(remove_meaningless_tokens(self.get("all", source)))
+        if len(tokens) > self.max_tokens:
+            return tokens
+        self.entries[key] = tokens
+        self.nb_tokens += len(tokens)
+        while len(self.entries) > self.max_entries or self.nb_tokens > self.max_tokens:
+            self.nb_tokens -= len(self.entries.popitem(last=False)[1])
+        return tokens
+
+    def get_stats(self) -> Dict[str, int]:
+        """Returns the number of entries, their total number of tokens,
+        the number of requests for the tokens of a source, of actual
+        tokenizations and of those saved by the cache."""
+        return {
+            "entries": len(self.entries),
+            "tokens": self.nb_tokens,
+            "requests": self.requests,
+            "tokenizations": self.tokenizations,
+            "saved": self.requests - self.tokenizations,
+        }
+
+    def clear(self) -> None:
+        """Removes all entries and resets the counters."""
+        self.entries.clear()
+        self.nb_tokens = 0
+        self.requests = 0
+        self.tokenizations = 0
+
+
+token_cache = TokenCache()
+
+
+def cached_tokenize(source: str) -> Tuple[Token, ...]:
+    """Same as tokenize() but returns a tuple of Tokens which may be shared
+    with other callers: neither these Tokens nor their attributes must be
+    modified. Use the copy() method of a Token to obtain a modified version.
+    """
+    token_cache.requests += 1
+    return token_cache.get("all", source)
+
+
+def cached_significant_tokens(source: str) -> Tuple[Token, ...]:
+    """Same as get_significant_tokens() but returns a tuple of Tokens which
+    may be shared with other callers; see cached_tokenize().
+    """
+    token_cache.requests += 1
+    try:
+        return token_cache.get("significant", source)
+    except Exception as e:  # pragma: no cover
+        debug_helper.log("Exception from token_utils.cached_significant_tokens()")
+        debug_helper.log_error(e)
+        return ()
+
+
+def tokenize(source: str, use_cache: bool = True) -> List[Token]:
     """Transforms a source (string) into a list of Tokens.
 
     If an exception is raised by Python's tokenize module, the list of tokens
     accumulated up to that point is returned.
+
+    The list, and the Tokens it contains, can be modified by the caller.
+    If ``use_cache`` is False, the tokens are neither taken from
+    token_cache nor added to it; this is meant for sources, such as
+    entire files, which are tokenized only once.
     """
+    if not use_cache:
+        return _tokenize(source)
+    return [token.copy() for token in cached_tokenize(source)]
+
+
+def _tokenize(source: str) -> List[Token]:
+    """Actual implementation of tokenize(), whose result is cached."""
     tokens = []
     try:
         for tok in py_tokenize.generate_tokens(StringIO(source).readline):
@@ -333,13 +462,7 @@ def get_significant_tokens(source: str) -> List[Token]:
     as well as any token whose string value is either null or
     consists of spaces, newline or tab characters.
     """
-    try:
-        tokens = tokenize(source)
-    except Exception as e:  # pragma: no cover
-        debug_helper.log("Exception from token_utils.get_significant_tokens()")
-        debug_helper.log_error(e)
-        return []
-    return remove_meaningless_tokens(tokens)
+    return [token.copy() for token in cached_significant_tokens(source)]
 
 
 def remove_meaningless_tokens(tokens: Iterable[Token]) -> List[Token]:
@@ -398,8 +521,8 @@ def find_substring_index(main: str, substring: str) -> int:
     as a subsequence of the tokens for main. If so, the index
     of the first token in returned, otherwise -1 is returned.
     """
-    main_tokens = [tok.string for tok in get_significant_tokens(main)]
-    sub_tokens = [tok.string for tok in get_significant_tokens(substring)]
+    main_tokens = [tok.string for tok in cached_significant_tokens(main)]
+    sub_tokens = [tok.string for tok in cached_significant_tokens(substring)]
     for index, token in enumerate(main_tokens):
         if token == sub_tokens[0]:
             for i, tok in enumerate(main_tokens[index : index + len(sub_tokens)]):
@@ -433,7 +556,9 @@ def indent(
     return tokenize(line)
 
 
-def untokenize(tokens: Iterable[Union[str, Token]]) -> str:
+def untokenize(
+    tokens: Iterable[Union[str, Token]], offsets: Optional[List[int]] = None
+) -> str:
     """Return source code based on tokens.
 
     This is similar to Python's own tokenize.untokenize(), except that it
@@ -451,6 +576,12 @@ def untokenize(tokens: Iterable[Union[str, Token]]) -> str:
     Instead of full token object, ``untokenize`` will accept simple
     strings; however, it will only insert them *as is* without taking them
     into account when it comes with figuring out spacing between tokens.
+
+    If ``offsets`` is an empty list, it is filled with the position in the
+    source code of the string of each token (or simple string); since the spacing
+    does not depend on the strings of the tokens, replacing the string of
+    a token by another one in the source code at this position gives the same
+    result as untokenizing the tokens after changing the string of this token.
     """
     # Adapted from https://github.com/myint/untokenize,
     # Copyright (C) 2013-2018 Steven Myint, MIT License (same as this project).
@@ -462,9 +593,13 @@ def untokenize(tokens: Iterable[Union[str, Token]]) -> str:
 
     for token in tokens:
         if isinstance(token, str):  # pragma: no cover
+            if offsets is not None:
+                offsets.append(len(words))
             words.append(token)
             continue
         if token.type == py_tokenize.ENCODING:  # pragma: no cover
+            if offsets is not None:  # one offset per token, although unused
+                offsets.append(len(words))
             continue
 
         # Preserve escaped newlines.
@@ -481,6 +616,8 @@ def untokenize(tokens: Iterable[Union[str, Token]]) -> str:
         if token.start_col > last_column:
             words.append(token.line[last_column : token.start_col])
 
+        if offsets is not None:
+            offsets.append(len(words))
         words.append(token.string)
 
         previous_line = token.line
@@ -489,6 +626,15 @@ def untokenize(tokens: Iterable[Union[str, Token]]) -> str:
         if not token.is_space():
             last_non_whitespace_token_type = token.type
 
+    if offsets is not None:
+        # Convert the indices of the words into positions in the source.
+        positions = []
+        position = 0
+        for word in words:
+            positions.append(position)
+            position += len(word)
+        positions.append(position)  # for a last token adding no word
+        offsets[:] = [positions[index] for index in offsets]
     return "".join(words)
 
 
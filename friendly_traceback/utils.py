@@ -4,12 +4,16 @@ A few useful objects which do not naturally fit anywhere else.
 """
 import ast
 import difflib
+import itertools
+import sys
 import types
 import uuid
-from typing import Any, Dict, Iterable, List, Tuple
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 
 import pure_eval
 
+from . import edit_distance
 from .tb_data import TracebackData  # purely for type checking
 
 
@@ -56,24 +60,32 @@ def get_similar_words(word_with_typo: str, words: Iterable[str]) -> List[str]:
 
     We also do not return any matches for single character variables,
     nor do we consider single character variable potential matches.
+
+    When the same large collection of words is used repeatedly,
+    a SimilarityIndex is used to avoid computing the distance
+    between word_with_typo and every word; for other large collections,
+    the words which cannot be similar are removed in bulk using
+    edit_distance.filter_candidates(). Only the first
+    edit_distance.max_candidates words are considered.
     """
     if len(word_with_typo) == 1:
         return []
-    words = set(words)  # removes duplicates
-    words = sorted(list(words))  # get predictable order for tests
-
-    if 2 <= len(word_with_typo) <= 4:
-        words = [word for word in words if 2 <= len(word) <= 5]
-        max_dist = 1
-    elif 5 <= len(word_with_typo) <= 8:
-        words = [word for word in words if 4 <= len(word) <= 10]
-        max_dist = 2
-    else:
-        words = [word for word in words if len(word) >= 7]
-        max_dist = 3
+    # removes duplicates
+    words = frozenset(itertools.islice(words, edit_distance.max_candidates))
+    max_dist, min_length, max_length = get_length_bucket(word_with_typo)
+
+    index = similarity_indexes.get(words)
+    candidates = None if index is None else index.get_candidates(word_with_typo)
+    if candidates is None:
+        candidates = [word for word in words if min_length <= len(word) <= max_length]
+        if len(candidates) >= edit_distance.min_bulk_size:
+            candidates = edit_distance.filter_candidates(
+                word_with_typo, candidates, max_dist
+            )
+    candidates.sort()  # get predictable order for tests
 
     similar_words: Dict[int, List[str]] = {}
-    for word in words:
+    for word in candidates:
         distance = _leven(word_with_typo, word, max_dist + 1)
         if distance <= max_dist:
             if distance in similar_words:
@@ -86,6 +98,8 @@ def get_similar_words(word_with_typo: str, words: Iterable[str]) -> List[str]:
         if distance in similar_words and similar_words[distance]:
             similar.extend(similar_words[distance])
     if not similar:  # example PI -> pi
+        # Note that these have the same length as word_with_typo,
+        # and are thus in the range of lengths considered.
         if word_with_typo.lower() in words:
             similar.append(word_with_typo.lower())
         elif word_with_typo.upper() in words:
@@ -93,6 +107,166 @@ def get_similar_words(word_with_typo: str, words: Iterable[str]) -> List[str]:
     return similar
 
 
+def get_length_bucket(word_with_typo: str) -> Tuple[int, int, int]:
+    """Returns the maximum distance, as well as the minimum and maximum
+    length of the words considered, for finding words similar to
+    word_with_typo; see get_similar_words()."""
+    if len(word_with_typo) <= 4:
+        return 1, 2, 5
+    if len(word_with_typo) <= 8:
+        return 2, 4, 10
+    return 3, 7, sys.maxsize
+
+
+def get_deletions(word: str, max_dist: int) -> Set[str]:
+    """Returns all the strings obtained by deleting up to max_dist
+    characters from word, including word itself."""
+    result = {word}
+    current = {word}
+    for _ in range(max_dist):
+        current = {
+            variant[:i] + variant[i + 1 :]
+            for variant in current
+            for i in range(len(variant))
+        }
+        result |= current
+    return result
+
+
+def get_nb_deletions(length: int, max_dist: int) -> int:
+    """Returns the maximum number of strings obtained by deleting up to
+    max_dist characters from a word of a given length."""
+    total = combinations = 1
+    for k in range(1, min(max_dist, length) + 1):
+        combinations = combinations * (length - k + 1) // k
+        total += combinations
+    return total
+
+
+class SimilarityIndex:
+    """Deletion index, as used by the SymSpell algorithm, of a collection
+    of words, used to find the candidates for get_similar_words()
+    without computing the distance from every word.
+
+    If the Damerau-Levenshtein distance (optimal string alignment) between
+    two words is at most max_dist, deleting at most max_dist characters
+    from each of them gives the same string. Since the distance computed
+    by _leven() is never less than this distance, all the words found to be
+    similar by comparing with every word are among the candidates,
+    which are then compared in the same way.
+
+    Words with many deletion variants are not indexed; they are always
+    included in the candidates, and so are all words when word_with_typo
+    is too long.
+
+    The number of deletion variants grows quickly with max_dist, and so do
+    the time and memory needed to create the index. Words whose length
+    corresponds to a given max_dist are only indexed if the number of
+    entries required is at most max_index_size; otherwise, no candidates
+    are returned, and the words need to be compared in another way.
+    """
+
+    max_indexed_length = 16
+    max_index_size = 4_000  # about 5 ms and 1 MiB to create
+
+    def __init__(self, words: FrozenSet[str]) -> None:
+        self.words = words
+        # max_dist -> (words of suitable length; deletion variant -> words,
+        #              or None if too many entries are needed; words not indexed)
+        self.buckets: Dict[int, Tuple[List[str], Optional[Dict], List[str]]] = {}
+
+    def get_bucket(
+        self, max_dist: int, min_length: int, max_length: int
+    ) -> Tuple[List[str], Optional[Dict[str, List[str]]], List[str]]:
+        if max_dist not in self.buckets:
+            words = [
+                word for word in self.words if min_length <= len(word) <= max_length
+            ]
+            indexed = [word for word in words if len(word) <= self.max_indexed_length]
+            size = 0
+            for word in indexed:
+                size += get_nb_deletions(len(word), max_dist)
+                if size > self.max_index_size:
+                    break
+            deletions: Optional[Dict[str, List[str]]] = None
+            if size <= self.max_index_size:
+                deletions = {}
+                for word in indexed:
+                    for variant in get_deletions(word, max_dist):
+                        deletions.setdefault(variant, []).append(word)
+            not_indexed = [
+                word for word in words if len(word) > self.max_indexed_length
+            ]
+            self.buckets[max_dist] = words, deletions, not_indexed
+        return self.buckets[max_dist]
+
+    def get_candidates(self, word_with_typo: str) -> Optional[List[str]]:
+        """Returns the words that might be similar to word_with_typo,
+        or None if the words of suitable length are not indexed."""
+        max_dist, min_length, max_length = get_length_bucket(word_with_typo)
+        words, deletions, not_indexed = self.get_bucket(
+            max_dist, min_length, max_length
+        )
+        if deletions is None:
+            return None
+        if len(word_with_typo) > self.max_indexed_length:
+            return list(words)
+        candidates = set(not_indexed)
+        for variant in get_deletions(word_with_typo, max_dist):
+            if variant in deletions:
+                candidates.update(deletions[variant])
+        return list(candidates)
+
+
+class SimilarityIndexes:
+    """Keeps the SimilarityIndex of the large collections of words
+    used more than once, such as ``dir(builtins)`` or the names of the
+    modules of the standard library. An index is only created the second time
+    a collection is seen, since creating it takes more time than comparing
+    every word.
+    """
+
+    min_size = 100  # smaller collections are not indexed
+    max_size = 20_000  # nor are larger ones, to limit the memory used
+    max_entries = 16
+
+    def __init__(self) -> None:
+        self.seen: "OrderedDict[FrozenSet[str], Optional[SimilarityIndex]]" = (
+            OrderedDict()
+        )
+
+    def get(self, words: FrozenSet[str]) -> Optional[SimilarityIndex]:
+        if not self.min_size <= len(words) <= self.max_size:
+            return None
+        if words not in self.seen:
+            self.seen[words] = None
+            index = None
+        else:
+            index = self.seen[words]
+            if index is None:
+                index = self.seen[words] = SimilarityIndex(words)
+            self.seen.move_to_end(words)
+        while len(self.seen) > self.max_entries:
+            self.seen.popitem(last=False)
+        return index
+
+    def preload(self, words: Iterable[str]) -> None:
+        """Creates the complete index of a collection of words right away."""
+        words = frozenset(words)
+        if not self.min_size <= len(words) <= self.max_size:
+            return
+        index = SimilarityIndex(words)
+        for typo_length in (2, 5, 9):  # one for each length bucket
+            index.get_bucket(*get_length_bucket("x" * typo_length))
+        self.seen[words] = index
+        self.seen.move_to_end(words)
+        while len(self.seen) > self.max_entries:
+            self.seen.popitem(last=False)
+
+
+similarity_indexes = SimilarityIndexes()
+
+
 # The following code, including comments, has been adapted from
 # https://gist.github.com/giststhebearbear/4145811
 
@@ -0,0 +1,47 @@
+"""Checks that removing candidates in bulk does not change the
+similar words found."""
+import random
+import string
+
+import pytest
+
+from friendly_traceback import edit_distance, utils
+
+
+def make_words(nb_words, seed):
+    rng = random.Random(seed)
+    parts = ["feature", "flag", "timeout", "cache", "size", "user"]
+    words = ["_".join(rng.sample(parts, 2)) + str(i) for i in range(nb_words // 2)]
+    words.extend(
+        "".join(rng.choice(string.ascii_lowercase + "_") for _ in range(rng.randint(2, 16)))
+        for _ in range(nb_words // 2)
+    )
+    typos = [word[:1] + word[2:] for word in rng.sample(words, 15)]
+    typos += ["user_cahce_size3", "flag_feature12", "zq", "abcdefghijk"]
+    return words, typos
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_filter_candidates(use_numpy):
+    if use_numpy and edit_distance.numpy is None:
+        pytest.skip("NumPy is not installed")
+    words, typos = make_words(1200, seed=use_numpy)
+    saved = edit_distance.use_numpy, edit_distance.min_bulk_size
+    try:
+        edit_distance.use_numpy = use_numpy
+        for typo in typos:
+            edit_distance.min_bulk_size = 10**9
+            expected = utils.get_similar_words(typo, words)
+            edit_distance.min_bulk_size = 1
+            assert utils.get_similar_words(typo, words) == expected, typo
+    finally:
+        edit_distance.use_numpy, edit_distance.min_bulk_size = saved
+
+
+def test_max_candidates():
+    saved = edit_distance.max_candidates
+    try:
+        edit_distance.max_candidates = 2
+        assert utils.get_similar_words("abcd", ["xyz", "abce", "abcf"]) == ["abce"]
+    finally:
+        edit_distance.max_candidates = saved
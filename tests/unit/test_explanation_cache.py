@@ -0,0 +1,43 @@
+"""Tests of the cache of explanations of identical exceptions."""
+
+import friendly_traceback
+from friendly_traceback.config import session
+from friendly_traceback.explanation_cache import explanation_cache
+
+
+def raise_error():
+    return unknown_name  # noqa
+
+
+def explain():
+    try:
+        raise_error()
+    except NameError:
+        friendly_traceback.explain_traceback(redirect="capture")
+    return friendly_traceback.get_output()
+
+
+def test_explanation_cache():
+    explanation_cache.clear()
+    friendly_traceback.set_explanation_cache(10)
+    first = explain()
+    first_fingerprint = session.recorded_tracebacks[-1].fingerprint
+    stats = friendly_traceback.get_explanation_cache_stats()
+    assert stats["hits"] == 0 and stats["misses"] == 2  # generic and cause
+
+    second = explain()
+    assert session.recorded_tracebacks[-1].fingerprint == first_fingerprint
+    stats = friendly_traceback.get_explanation_cache_stats()
+    assert stats["hits"] == 2 and stats["misses"] == 2
+    assert first == second
+    assert "no object with the name `unknown_name` exists" in second
+
+    friendly_traceback.set_explanation_cache(0)
+    explanation_cache.clear()
+
+
+def test_submodule_not_shadowed():
+    import types
+
+    assert isinstance(friendly_traceback.explanation_cache, types.ModuleType)
+    assert friendly_traceback.explanation_cache.explanation_cache is explanation_cache
@@ -0,0 +1,90 @@
+import tokenize as py_tokenize
+import types
+
+import pytest
+
+from friendly_traceback import token_utils
+from friendly_traceback.syntax_errors import analyze_syntax, fixers, source_info
+
+SOURCE = "if x = compute(alpha,  beta) :  # comment"
+
+
+def old_replace(tokens, *replacements):
+    """Replacement done by untokenizing a modified copy of the tokens."""
+    new_tokens = []
+    for tok in tokens:
+        for original, new_string in replacements:
+            if tok is original:
+                tok = tok.copy()
+                tok.string = new_string
+                break
+        new_tokens.append(tok)
+    return token_utils.untokenize(new_tokens).strip()
+
+
+def test_replacements_same_as_untokenize():
+    tokens = token_utils.tokenize(SOURCE)
+    with fixers.new_search():
+        for tok in tokens:
+            if not tok.string.strip():
+                continue
+            for new_string in ("", "==", "longer_name"):
+                expected = old_replace(tokens, (tok, new_string))
+                assert fixers.replace_token(tokens, tok, new_string) == expected
+        first, second = tokens[2], tokens[-2]
+        assert fixers.replace_two_tokens(
+            tokens, first, "==", second, ""
+        ) == old_replace(tokens, (first, "=="), (second, ""))
+
+
+def test_modified_tokens():
+    tokens = token_utils.tokenize(SOURCE)
+    with fixers.new_search():
+        assert fixers.replace_token(tokens, tokens[2], "==").startswith("if x ==")
+        tokens[1].string = "y"
+        assert fixers.replace_token(tokens, tokens[2], "==").startswith("if y ==")
+
+
+def test_candidates_compiled_once():
+    with fixers.new_search() as search:
+        assert fixers.check_statement("if x == 1:")
+        assert fixers.check_statement("if x == 1:")
+        assert not fixers.check_statement("if x = 1:")
+    assert search.nb_checked == 3
+    assert search.nb_compiled == 2
+
+
+def test_max_candidates():
+    with pytest.raises(fixers.TooManyCandidates):
+        with fixers.new_search(max_candidates=2) as search:
+            assert fixers.check_statement("a = 1")
+            assert fixers.check_statement("a = 2")
+            assert fixers.check_statement("a = 1")  # already compiled
+            fixers.check_statement("a = 3")
+    assert len(search.results) == 2
+    assert fixers.current_search is None
+    assert fixers.check_statement("a = 3")
+
+
+def get_cause(source):
+    try:
+        compile(source, "<string>", "exec")
+    except SyntaxError as e:
+        tb_data = types.SimpleNamespace(statement=source_info.Statement(e, source))
+        return analyze_syntax.set_cause_syntax(e, tb_data)["cause"]
+
+
+def test_search_abandoned(monkeypatch):
+    source = "if x = 1:\n    pass\n"
+    assert get_cause(source) != analyze_syntax.unknown_cause()
+    monkeypatch.setattr(fixers, "MAX_CANDIDATES", 0)
+    assert get_cause(source) == analyze_syntax.unknown_cause()
+
+
+def test_offsets_of_last_tokens():
+    tokens = token_utils.tokenize("a = 1")
+    encoding = tokens[0].copy()
+    encoding.type = py_tokenize.ENCODING
+    offsets = []
+    assert token_utils.untokenize(tokens + ["# c", encoding], offsets) == "a = 1# c"
+    assert offsets[-2:] == [5, 8]
@@ -0,0 +1,67 @@
+"""Checks that importing friendly_traceback, and installing its exception
+hook, does not import the modules only needed to explain exceptions."""
+import os
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+DEFERRED_MODULES = [
+    "asttokens",
+    "executing",
+    "pure_eval",
+    "stack_data",
+    "friendly_traceback.about_warnings",
+    "friendly_traceback.core",
+    "friendly_traceback.info_variables",
+    "friendly_traceback.tb_data",
+]
+
+
+def run_python(code):
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        cwd=ROOT,
+    )
+
+
+def get_import_times(stderr):
+    """Returns a dict of the cumulative import time, in microseconds,
+    of each module, from the output of ``python -X importtime``."""
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _self, cumulative, name = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_import_time():
+    result = run_python("import friendly_traceback; friendly_traceback.install()")
+    times = get_import_times(result.stderr)
+    assert "friendly_traceback" in times
+    for module in DEFERRED_MODULES:
+        assert module not in times, module
+
+
+def test_deferred_explanation():
+    result = run_python("import friendly_traceback; friendly_traceback.install(); 1/0")
+    assert "A `ZeroDivisionError` occurs when you are attempting" in result.stderr
+    assert "friendly_traceback.core" in get_import_times(result.stderr)
+
+
+def test_lazy_names():
+    code = (
+        "import friendly_traceback\n"
+        "from friendly_traceback import IGNORE_WARNINGS\n"
+        "assert IGNORE_WARNINGS is friendly_traceback.about_warnings.IGNORE_WARNINGS\n"
+        "assert friendly_traceback.info_variables.get_var_info\n"
+        "assert not hasattr(friendly_traceback, 'not_a_name')\n"
+    )
+    result = run_python(code)
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,65 @@
+"""Tests of the optional time measurements of the analysis of exceptions."""
+
+import friendly_traceback
+from friendly_traceback.console_helpers import why
+
+
+def raise_name_error():
+    return unknown_name  # noqa
+
+
+def test_instrumentation():
+    events = []
+    friendly_traceback.get_instrumentation_stats(reset=True)
+    friendly_traceback.set_instrumentation(
+        callback=lambda name, elapsed_ms, matched: events.append((name, matched))
+    )
+    old_stream = friendly_traceback.get_stream()
+    friendly_traceback.set_stream("capture")
+    try:
+        raise_name_error()
+    except NameError:
+        friendly_traceback.explain_traceback()
+    why()
+    friendly_traceback.get_output()
+    friendly_traceback.set_stream(old_stream)
+    friendly_traceback.set_instrumentation(enabled=False)
+    stats = friendly_traceback.get_instrumentation_stats(reset=True)
+
+    for name in ["tb_data", "tb_data.records", "tb_data.formatting"]:
+        assert stats[name]["calls"] == 1
+    assert stats["tb_data.locate_error"]["calls"] == 1
+    assert stats["assign_tracebacks"]["calls"] == 1
+    assert stats["section:cause"]["calls"] == 1
+    assert stats["info_variables.get_var_info"]["calls"] >= 1
+    parser = "message_parser:runtime_errors.name_error.name_not_defined"
+    assert stats[parser] == {
+        "calls": 1,
+        "total_ms": stats[parser]["total_ms"],
+        "max_ms": stats[parser]["max_ms"],
+        "matches": 1,
+    }
+    assert (parser, True) in events
+    assert ("tb_data", None) in events
+    assert not friendly_traceback.get_instrumentation_stats()
+
+
+def test_call_raising_an_exception():
+    from friendly_traceback.instrumentation import instrumentation
+
+    def failing_parser(message):
+        raise RuntimeError(message)
+
+    instrumentation.reset()
+    instrumentation.configure(enabled=True)
+    try:
+        instrumentation.call("message_parser", failing_parser, "message")
+    except RuntimeError:
+        pass
+    finally:
+        instrumentation.configure(enabled=False)
+    stats = instrumentation.get_stats()
+    instrumentation.reset()
+    (name,) = stats
+    assert name.endswith("failing_parser")
+    assert stats[name]["calls"] == 1 and stats[name]["matches"] == 0
@@ -0,0 +1,54 @@
+import friendly_traceback
+from friendly_traceback import ft_gettext
+from friendly_traceback.config import session
+from friendly_traceback.ft_gettext import current_lang
+
+
+def test_translations_are_loaded_once():
+    lang, translation = ft_gettext.get_translation("fr")
+    assert lang == "fr"
+    assert ft_gettext.get_translation("fr")[1] is translation
+
+
+def test_lang_switch():
+    text = "Internal error for Friendly.\n"
+    try:
+        friendly_traceback.set_lang("fr")
+        french = current_lang.translate(text)
+        friendly_traceback.set_lang("en")
+        assert current_lang.translate(text) == text
+        friendly_traceback.set_lang("fr")
+        assert current_lang.translate(text) == french != text
+    finally:
+        friendly_traceback.set_lang("en")
+
+
+def explain_name_error():
+    try:
+        prinnt("Hello")  # noqa
+    except NameError:
+        friendly_traceback.explain_traceback(redirect="capture")
+    friendly_traceback.get_output()
+    return session.recorded_tracebacks[-1]
+
+
+def test_explanation_rendered_in_new_language():
+    friendly_traceback.set_lang("en")
+    try:
+        english = explain_name_error()
+        english.info.compute_all()
+        friendly_traceback.set_lang("fr")
+        french = explain_name_error().info.copy()
+
+        friendly_traceback.get_instrumentation_stats(reset=True)
+        friendly_traceback.set_instrumentation(enabled=True)
+        english.recompile_info()
+        rendered = english.info.copy()
+        friendly_traceback.set_instrumentation(enabled=False)
+        phases = friendly_traceback.get_instrumentation_stats(reset=True)
+        assert not [name for name in phases if name.startswith("section:")]
+        assert rendered == french
+    finally:
+        friendly_traceback.set_instrumentation(enabled=False)
+        friendly_traceback.set_lang("en")
+        session.recorded_tracebacks.clear()
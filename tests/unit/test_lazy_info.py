@@ -0,0 +1,42 @@
+"""Tests ensuring that the information about an exception is only
+computed when it is needed, while remaining available on demand.
+"""
+
+import friendly_traceback
+from friendly_traceback.config import session
+
+
+def raise_index_error():
+    a = [1, 2]
+    return a[3]
+
+
+def test_lazy_info():
+    old_include = friendly_traceback.get_include()
+    old_stream = friendly_traceback.get_stream()
+    friendly_traceback.set_include("python_tb")
+    friendly_traceback.set_stream("capture")
+    try:
+        raise_index_error()
+    except IndexError:
+        friendly_traceback.explain_traceback()
+    result = friendly_traceback.get_output()
+    assert "IndexError: list index out of range" in result
+
+    info = session.recorded_tracebacks[-1].info
+    assert not dict.__contains__(info, "generic")
+    assert not dict.__contains__(info, "exception_raised_source")
+
+    # Items are computed when they are requested ...
+    assert "generic" in info
+    assert "a[3]" in info["exception_raised_source"]
+    assert not dict.__contains__(info, "detailed_tb")
+    # ... including by changing what is included.
+    friendly_traceback.set_include("why")
+    session.show_traceback_info_again()
+    assert "The valid index" in friendly_traceback.get_output()
+
+    # Iterating gives all the available information
+    assert "detailed_tb" in dict(info)
+    friendly_traceback.set_include(old_include)
+    friendly_traceback.set_stream(old_stream)
@@ -0,0 +1,74 @@
+import friendly_traceback
+from friendly_traceback import message_parser
+from friendly_traceback.syntax_errors import message_analyzer
+
+
+def test_parsers_selected_by_signature():
+    parser = message_parser.RuntimeMessageParser()
+
+    @parser._add(prefix="abc")
+    def starts_with_abc(message, tb_data):
+        return {}
+
+    @parser._add(contains="x.y")
+    def contains_x_y(message, tb_data):
+        return {}
+
+    @parser._add(pattern=r"\d+ items")
+    def counts_items(message, tb_data):
+        return {}
+
+    @parser._add
+    def any_message(message, tb_data):
+        return {}
+
+    @parser.add(contains="abc")
+    def custom(message, tb_data):
+        return {}
+
+    assert parser.get_parsers("abc: 3 items") == [
+        custom,
+        starts_with_abc,
+        counts_items,
+        any_message,
+    ]
+    assert parser.get_parsers("x abc\nx.y") == [custom, contains_x_y, any_message]
+    assert parser.get_parsers("xay") == [any_message]
+
+
+def test_included_parser_signatures():
+    parser = message_parser.get_parser(TypeError)
+    names = [
+        function.__name__
+        for function in parser.get_parsers("'int' object is not callable")
+    ]
+    assert names == ["x_is_not_callable"]
+
+
+def test_exact_messages():
+    parser = message_parser.RuntimeMessageParser()
+
+    @parser._add(message=("a", "b"))
+    def a_or_b(message, tb_data):
+        return {}
+
+    @parser._add(prefix=("a", "c"))
+    def starts_with_a_or_c(message, tb_data):
+        return {}
+
+    assert parser.get_parsers("a") == [a_or_b, starts_with_a_or_c]
+    assert parser.get_parsers("b") == [a_or_b]
+    assert parser.get_parsers("ab") == [starts_with_a_or_c]
+
+
+def test_syntax_error_analyzers():
+    friendly_traceback.get_instrumentation_stats(reset=True)
+    friendly_traceback.set_instrumentation(enabled=True)
+    try:
+        cause = message_analyzer.analyze_message("'return' outside function")
+    finally:
+        friendly_traceback.set_instrumentation(enabled=False)
+    stats = friendly_traceback.get_instrumentation_stats(reset=True)
+    assert "`return`" in cause["cause"]
+    assert stats["message_analyzers:tried"]["total"] == 1
+    assert stats["message_analyzers:in_order"]["total"] > 1
@@ -0,0 +1,49 @@
+import glob
+import os
+
+from friendly_traceback.runtime_errors import modules_attributes
+
+
+def get_indexed_modules(name):
+    """Modules listed for ``name`` in the index file of the Python version
+    used; each version has its own index file."""
+    with open(modules_attributes.get_index_filename(), encoding="utf-8") as f:
+        for line in f:
+            line_name, *modules = line.split()
+            if line_name == name:
+                return modules
+    return []
+
+
+def test_get_modules():
+    for name in ("pi", "Counter"):
+        assert modules_attributes.get_modules(name) == get_indexed_modules(name)
+    assert {"cmath", "math"} <= set(modules_attributes.get_modules("pi"))
+    assert {"collections", "typing"} <= set(modules_attributes.get_modules("Counter"))
+    assert modules_attributes.get_modules("not_a_name_in_the_stdlib") == []
+    assert modules_attributes.get_modules("# Created") == []
+
+
+def test_index_files():
+    pattern = os.path.join(os.path.dirname(modules_attributes.__file__), "*.txt")
+    filenames = glob.glob(pattern)
+    assert filenames
+    for filename in filenames:
+        with open(filename, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        assert lines[0].startswith("# Created with Python")
+        names = [line.split()[0].encode("utf-8") for line in lines[1:]]
+        assert names == sorted(set(names)), filename
+        index = modules_attributes.ModulesAttributes(filename)
+        for line in lines[1::97]:
+            name, *modules = line.split()
+            assert index.get_modules(name) == modules
+
+
+def test_get_index_filename():
+    def version(v):
+        return os.path.basename(modules_attributes.get_index_filename(v))
+
+    assert version((3, 10)) == "modules_attributes_3.10.txt"
+    assert version((3, 6)) == "modules_attributes_3.9.txt"
+    assert version((3, 99)) == "modules_attributes_3.13.txt"
@@ -1,3 +1,4 @@
+import os
 import pathlib
 import pytest
 import friendly_traceback as ft
@@ -16,3 +17,43 @@ class CustomPathLike:
 )
 def test_is_excluded_file_accepts_any_pathlikes(file):
     assert not ft.path_info.is_excluded_file(file)
+
+
+def test_excluded_directories(tmp_path):
+    path_info = ft.path_info
+    excluded = tmp_path / "path"
+    sibling = tmp_path / "path2"
+    for directory in (excluded / "sub", sibling):
+        directory.mkdir(parents=True)
+    inside = str(excluded / "sub" / "name.py")
+    outside = str(sibling / "name.py")
+    assert not path_info.is_excluded_file(inside)
+
+    path_info.exclude_directory_from_traceback(excluded)
+    try:
+        assert path_info.is_excluded_file(inside)
+        assert not path_info.is_excluded_file(outside)
+        assert not path_info.is_excluded_file(str(excluded))
+    finally:
+        path_info.EXCLUDED_DIR_NAMES.discard(str(excluded) + os.path.sep)
+        path_info.exclusions.clear()
+    assert not path_info.is_excluded_file(inside)
+
+
+def test_cached_kinds_are_cleared():
+    path_info = ft.path_info
+    assert not path_info.is_excluded_file(__file__)
+    ft.exclude_file_from_traceback(__file__)
+    assert path_info.is_excluded_file(__file__)
+    path_info.include_file_in_traceback(__file__)
+    assert not path_info.is_excluded_file(__file__)
+
+
+def test_cache_size_is_bounded():
+    exclusions = ft.path_info.Exclusions(max_size=3)
+    for index in range(10):
+        exclusions.get_kind(os.path.abspath(f"file_{index}.py"))
+    assert len(exclusions.kinds) == 3
+    assert os.path.abspath("file_9.py") in exclusions.kinds
+    exclusions.get_kind("relative.py")
+    assert "relative.py" not in exclusions.kinds
@@ -0,0 +1,58 @@
+"""Tests of the limits on the recorded tracebacks and of detaching
+them from frames.
+"""
+import gc
+import weakref
+
+import friendly_traceback
+from friendly_traceback.config import session
+
+
+class BigObject:
+    pass
+
+
+def raise_error(obj):
+    raise ValueError("Some error")
+
+
+def record_exception():
+    obj = BigObject()
+    ref = weakref.ref(obj)
+    try:
+        raise_error(obj)
+    except ValueError:
+        friendly_traceback.explain_traceback(redirect="capture")
+    friendly_traceback.get_output()
+    return ref
+
+
+def test_retention():
+    session.recorded_tracebacks.clear()
+    friendly_traceback.set_retention(max_entries=3, detach=True)
+    try:
+        refs = [record_exception() for _ in range(5)]
+        footprint = friendly_traceback.get_retention_footprint()
+        assert footprint["entries"] == 3
+        assert footprint["attached"] == 0
+        assert footprint["estimated_bytes"] > 0
+        gc.collect()
+        assert all(ref() is None for ref in refs)
+
+        # Information already computed remains available
+        recorded = session.recorded_tracebacks[-1]
+        assert "ValueError: Some error" in recorded.info["message"]
+        assert recorded.summary["frames"][-1][1] == "raise_error"
+
+        # A single item is kept if the size limit is too small
+        friendly_traceback.set_retention(max_bytes=1)
+        footprint = friendly_traceback.get_retention_footprint()
+        assert footprint["entries"] == 1
+        # Limits which are not specified are left unchanged
+        assert footprint["max_entries"] == 3
+        friendly_traceback.set_retention(detach=True)
+        footprint = friendly_traceback.get_retention_footprint()
+        assert (footprint["max_entries"], footprint["max_bytes"]) == (3, 1)
+    finally:
+        friendly_traceback.set_retention(max_entries=None, max_bytes=None, detach=False)
+        session.recorded_tracebacks.clear()
@@ -0,0 +1,81 @@
+"""Tests of the sampling of repeated exceptions by the exception hook."""
+
+import sys
+
+import friendly_traceback
+from friendly_traceback.config import session
+from friendly_traceback.sampling import Sampler
+
+
+def raise_name_error():
+    return unknown_name  # noqa
+
+
+def test_sampling():
+    old_include = friendly_traceback.get_include()
+    old_stream = friendly_traceback.get_stream()
+    friendly_traceback.set_include("explain")
+    friendly_traceback.set_stream("capture")
+    friendly_traceback.set_sampling(max_explained=2)
+    outputs = []
+    for _ in range(4):
+        try:
+            raise_name_error()
+        except NameError:
+            session.exception_hook(*sys.exc_info())
+        outputs.append(friendly_traceback.get_output())
+    friendly_traceback.set_sampling(max_explained=None)
+    friendly_traceback.set_include(old_include)
+    friendly_traceback.set_stream(old_stream)
+
+    for output in outputs:
+        assert "NameError: name 'unknown_name' is not defined" in output
+    assert "A `NameError` exception" in outputs[0]
+    assert "A `NameError` exception" in outputs[1]
+    assert "A `NameError` exception" not in outputs[2]
+    assert "A `NameError` exception" not in outputs[3]
+    assert session.recorded_tracebacks[-1].include == "python_tb"
+
+
+def test_sampler_window():
+    sampler = Sampler()
+    assert sampler.get_include("a", "explain", now=0) == "explain"
+    sampler.configure(max_explained=1, window=10)
+    assert sampler.get_include("a", "explain", now=0) == "explain"
+    assert sampler.get_include("b", "explain", now=1) == "explain"
+    for now in range(1, 6):
+        assert sampler.get_include("a", "explain", now=now) == "python_tb"
+    assert not sampler.summary
+    assert sampler.get_include("a", "explain", now=12) == "explain"
+    assert "5 more times" in sampler.summary
+    assert sampler.get_include("b", "explain", now=12) == "explain"
+    assert not sampler.summary
+
+
+def test_summary_not_shown_once_disabled():
+    old_include = friendly_traceback.get_include()
+    old_stream = friendly_traceback.get_stream()
+    friendly_traceback.set_include("message")  # source lines are not shown
+    friendly_traceback.set_stream("capture")
+    friendly_traceback.set_sampling(max_explained=1, window=60)
+    session.sampler.get_include("a", "explain", now=0)
+    session.sampler.get_include("a", "explain", now=1)
+    session.sampler.get_include("a", "explain", now=100)
+    assert "1 more times" in session.sampler.summary
+    friendly_traceback.set_sampling(max_explained=None)
+    assert not session.sampler.summary
+
+    outputs = []
+    for summary in ("", "Summary not set for this exception.\n"):
+        session.sampler.summary = summary
+        try:
+            raise_name_error()
+        except NameError:
+            session.exception_hook(*sys.exc_info())
+        outputs.append(friendly_traceback.get_output())
+    friendly_traceback.set_include(old_include)
+    friendly_traceback.set_stream(old_stream)
+
+    assert outputs[0] == outputs[1]
+    assert "NameError" in outputs[0]
+    assert "more times" not in outputs[0]
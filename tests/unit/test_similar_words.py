@@ -0,0 +1,81 @@
+"""Checks that using a SimilarityIndex gives the same results as
+comparing word_with_typo with every word."""
+import builtins
+import keyword
+import random
+import string
+
+from friendly_traceback import utils
+
+
+def linear_similar_words(word_with_typo, words):
+    saved = utils.similarity_indexes.min_size
+    utils.similarity_indexes.min_size = 10**9
+    try:
+        return utils.get_similar_words(word_with_typo, words)
+    finally:
+        utils.similarity_indexes.min_size = saved
+
+
+def make_typos(word, rng):
+    letters = string.ascii_lowercase + "_"
+    typos = [word, word.upper(), word[1:], word[:-1], word + rng.choice(letters)]
+    for _ in range(4):
+        chars = list(word)
+        for _ in range(rng.randint(1, 3)):
+            i = rng.randrange(len(chars))
+            operation = rng.randrange(4)
+            if operation == 0:
+                chars[i] = rng.choice(letters)
+            elif operation == 1 and len(chars) > 2:
+                del chars[i]
+            elif operation == 2:
+                chars.insert(i, rng.choice(letters))
+            elif i + 1 < len(chars):
+                chars[i], chars[i + 1] = chars[i + 1], chars[i]
+        typos.append("".join(chars))
+    return typos
+
+
+def check_similar_words(seed):
+    rng = random.Random(seed)
+    words = dir(builtins) + keyword.kwlist + [
+        "".join(rng.choice("abcde_") for _ in range(rng.randint(2, 18)))
+        for _ in range(100)
+    ]
+    words.append("a_very_long_name_which_is_not_indexed")
+    for word in rng.sample(words, 25):
+        for typo in make_typos(word, rng):
+            expected = linear_similar_words(typo, words)
+            utils.get_similar_words(typo, words)  # the index is created
+            assert utils.similarity_indexes.get(frozenset(words)) is not None
+            assert utils.get_similar_words(typo, words) == expected, typo
+
+
+def test_similar_words_with_index():
+    check_similar_words(42)
+
+
+def test_similar_words_with_complete_index(monkeypatch):
+    # All the words are indexed, whatever the size of the index.
+    monkeypatch.setattr(utils.SimilarityIndex, "max_index_size", 10**9)
+    check_similar_words(43)
+
+
+def test_index_size_is_bounded():
+    rng = random.Random(44)
+    words = frozenset(
+        "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(6, 16)))
+        for _ in range(20_000)
+    )
+    index = utils.SimilarityIndex(words)
+    for typo_length in (2, 5, 9):
+        index.get_bucket(*utils.get_length_bucket("x" * typo_length))
+    size = sum(
+        len(variants)
+        for _words, deletions, _not_indexed in index.buckets.values()
+        if deletions is not None
+        for variants in deletions.values()
+    )
+    assert size <= utils.SimilarityIndex.max_index_size
+    assert index.get_candidates("abcdefghij") is None
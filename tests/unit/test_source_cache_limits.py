@@ -0,0 +1,37 @@
+"""Tests of the limits on the sources kept by friendly_traceback's cache."""
+
+import friendly_traceback
+from friendly_traceback.config import session
+from friendly_traceback.source_cache import Cache
+
+
+def test_source_cache_limits():
+    old_stream = friendly_traceback.get_stream()
+    friendly_traceback.set_stream("capture")
+    try:
+        friendly_traceback.friendly_exec("a = 1\nb = c")
+    except NameError:
+        friendly_traceback.explain_traceback()
+    friendly_traceback.get_output()
+    friendly_traceback.set_stream(old_stream)
+    pinned = session.recorded_tracebacks[-1].tb_data.filename
+    assert pinned.startswith("<friendly-exec-")
+
+    cache = Cache()
+    cache.set_limits(max_entries=3)
+    cache.add(pinned, "a = 1\nb = c")
+    filenames = [f"<test-source-cache-{n}>" for n in range(3)]
+    for filename in filenames[:2]:
+        cache.add(filename, "x = 1\n")
+    cache.get_source_lines(filenames[0])  # more recently used than filenames[1]
+    cache.add(filenames[2], "y = 2\n")
+
+    # The source needed by the recorded traceback is kept; the least
+    # recently used source is evicted.
+    assert list(cache.local_cache) == [pinned, filenames[0], filenames[2]]
+    assert list(cache.get_source_lines(filenames[1])) == ["\n"]
+    assert cache.get_stats()["evictions"] == 1
+
+    cache.set_limits(max_bytes=0)
+    assert list(cache.local_cache) == [pinned]
+    assert cache.get_stats()["total_size"] == len("a = 1\nb = c")
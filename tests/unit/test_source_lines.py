@@ -0,0 +1,43 @@
+"""Tests of the lines returned by the monkeypatched linecache.getlines,
+and of the immutable views of these lines used by friendly_traceback."""
+
+import linecache
+
+from friendly_traceback.source_cache import cache
+
+
+def test_source_lines():
+    filename = "<test-source-lines>"
+    cache.add(filename, "a = 1\nb = 2")
+    lines = linecache.getlines(filename)
+    assert isinstance(lines, list)
+    assert lines == ["a = 1\n", "b = 2\n", "\n"]
+    assert linecache.getline(filename, 2) == "b = 2\n"
+    # Like the original linecache.getlines, the same list is returned
+    # for as long as the source is unchanged.
+    assert linecache.getlines(filename) is lines
+    assert linecache.cache[filename][2] == ["a = 1\n", "b = 2\n"]
+
+    # The same immutable view is returned when the source is unchanged ...
+    view = cache.get_source_view(filename)
+    assert cache.get_source_view(filename) is view
+    assert view[1:] == ["b = 2\n", "\n"]
+    assert view + ["c\n"] == ["a = 1\n", "b = 2\n", "\n", "c\n"]
+    # ... and a new one once it has changed.
+    cache.add(filename, "c = 3\n")
+    assert list(cache.get_source_view(filename)) == ["c = 3\n", "\n"]
+    assert linecache.getlines(filename) == ["c = 3\n", "\n"]
+    cache.remove(filename)
+    assert linecache.getlines(filename) == ["\n"]
+
+
+def test_number_of_views_is_bounded():
+    filenames = [f"<test-source-views-{n}>" for n in range(cache.max_views + 5)]
+    for filename in filenames:
+        cache.add(filename, "a = 1\n")
+        cache.get_source_view(filename)
+    assert len(cache.views) == cache.max_views
+    assert filenames[0] not in cache.views
+    assert filenames[-1] in cache.views
+    for filename in filenames:
+        cache.remove(filename)
@@ -0,0 +1,49 @@
+from friendly_traceback.instrumentation import instrumentation
+from friendly_traceback.syntax_errors import source_info, statement_analyzer
+
+
+def get_statement(source):
+    try:
+        compile(source, "<string>", "exec")
+    except SyntaxError as e:
+        return source_info.Statement(e, source)
+    raise AssertionError("No SyntaxError")
+
+
+def test_features():
+    statement = get_statement("a = {'a': 1 'b': 2}\n")
+    features = statement.get_features()
+    assert statement.get_features() is features
+    assert {
+        "type:STRING",
+        "operator:=",
+        "begin_brackets",
+        "begin_bracket:{",
+        "first_token=a",
+    } <= features
+    assert "keyword:for" not in features
+
+
+def test_analyzers_requiring_absent_features_are_skipped():
+    statement = get_statement("a = {'a': 1 'b': 2}\n")
+    instrumentation.reset()
+    instrumentation.configure(enabled=True)
+    try:
+        cause = statement_analyzer.analyze_statement(statement)
+    finally:
+        instrumentation.configure(enabled=False)
+    stats = instrumentation.get_stats()
+    instrumentation.reset()
+
+    prefix = "statement_analyzer:syntax_errors.statement_analyzer."
+    called = [name[len(prefix) :] for name in stats if name.startswith(prefix)]
+    assert cause
+    assert called[-1] == "missing_comma_or_operator"
+    assert "missing_colon" in called  # no required features
+    assert "missing_in_with_for" not in called  # there is no "for"
+    assert "print_as_statement" not in called
+    assert stats["statement_analyzers:tried"]["total"] == len(called)
+    names = [analyzer.__name__ for analyzer in statement_analyzer.STATEMENT_ANALYZERS]
+    position = names.index("missing_comma_or_operator")
+    assert stats["statement_analyzers:in_order"]["total"] == position + 1
+    assert len(called) < position + 1
@@ -0,0 +1,71 @@
+"""Tests of the time budget for the explanation given by the exception hook."""
+
+import sys
+
+import pytest
+
+import friendly_traceback
+from friendly_traceback import time_budget
+from friendly_traceback.console_helpers import why
+from friendly_traceback.config import session
+
+
+def raise_name_error():
+    return unknown_name  # noqa
+
+
+def test_time_budget_exceeded():
+    old_include = friendly_traceback.get_include()
+    old_stream = friendly_traceback.get_stream()
+    friendly_traceback.set_include("explain")
+    friendly_traceback.set_stream("capture")
+    friendly_traceback.set_max_explain_time(0)
+    try:
+        raise_name_error()
+    except NameError:
+        session.exception_hook(*sys.exc_info())
+    result = friendly_traceback.get_output()
+    friendly_traceback.set_max_explain_time(None)
+
+    assert "NameError: name 'unknown_name' is not defined" in result
+    assert "A `NameError` exception" not in result
+    assert "The explanation took more than 0 ms." in result
+    assert "`what()`, `why()`, `where()`" in result
+
+    # The information can still be obtained afterwards.
+    why()
+    assert "unknown_name" in friendly_traceback.get_output()
+    friendly_traceback.set_include(old_include)
+    friendly_traceback.set_stream(old_stream)
+
+
+def test_time_budget_exceeded_detached():
+    old_stream = friendly_traceback.get_stream()
+    friendly_traceback.set_stream("capture")
+    friendly_traceback.set_retention(detach=True)
+    friendly_traceback.set_max_explain_time(0)
+    try:
+        try:
+            raise_name_error()
+        except NameError:
+            session.exception_hook(*sys.exc_info())
+        result = friendly_traceback.get_output()
+    finally:
+        friendly_traceback.set_max_explain_time(None)
+        friendly_traceback.set_retention(detach=False)
+        friendly_traceback.set_stream(old_stream)
+
+    assert session.recorded_tracebacks[-1].detached
+    assert "The explanation took more than 0 ms." in result
+    assert "can no longer be obtained" in result
+    assert "`why()`" not in result
+
+
+def test_time_budget_limit():
+    time_budget.check()  # no time limit outside of a with block
+    with time_budget.limit(None):
+        assert not time_budget.expired()
+    with time_budget.limit(0):
+        with pytest.raises(time_budget.TimeBudgetExceeded):
+            time_budget.check()
+    assert not time_budget.expired()
@@ -133,3 +133,35 @@ def test_unclosed_triple_quoted_string():
         source = f.read()
         assert token_utils.untokenize(token_utils.tokenize(source)) == source
 
+
+def test_token_cache():
+    source = "a = b + c  # comment\n"
+    before = token_utils.token_cache.get_stats()
+    tokens = token_utils.cached_tokenize(source)
+    assert isinstance(tokens, tuple)
+    assert token_utils.cached_tokenize(source) is tokens
+    significant = token_utils.cached_significant_tokens(source)
+    assert [tok.string for tok in significant] == ["a", "=", "b", "+", "c"]
+    # Tokens obtained from tokenize() can be modified without changing
+    # those which are cached.
+    copies = token_utils.tokenize(source)
+    copies[0].string = "x"
+    assert token_utils.untokenize(token_utils.tokenize(source)) == source
+    after = token_utils.token_cache.get_stats()
+    assert after["requests"] - before["requests"] == 5
+    assert after["tokenizations"] - before["tokenizations"] <= 1
+
+
+def test_token_cache_size():
+    cache = token_utils.TokenCache(max_tokens=20)
+    small = "a = b + c\n"  # 7 tokens, including NEWLINE and ENDMARKER
+    large = "x = [" + ", ".join("a" * 20) + "]\n"
+    assert len(cache.get("all", large)) > 20
+    assert cache.get_stats()["entries"] == 0
+    cache.get("all", small)
+    cache.get("all", small + "d\n")
+    cache.get("all", small + "e\n")
+    stats = cache.get_stats()
+    assert stats["tokens"] <= 20
+    assert stats["entries"] == 2
+    assert ("all", small) not in cache.entries
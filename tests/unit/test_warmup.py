@@ -0,0 +1,43 @@
+"""Checks what is loaded by warmup(), in a new process, so that it
+is not already loaded by other tests."""
+import os
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+CODE = """
+import gc, gettext, sys
+import friendly_traceback
+from friendly_traceback.runtime_errors import modules_attributes
+friendly_traceback.warmup(exception_types=[NameError, SyntaxWarning], langs=["fr"],
+                          prefork=True)
+print("friendly_traceback.runtime_errors.name_error" in sys.modules)
+print("friendly_traceback.runtime_errors.key_error" in sys.modules)
+print("friendly_traceback.warning_parsers.syntax_warning" in sys.modules)
+print("friendly_traceback.syntax_errors.message_analyzer" in sys.modules)
+print(any("friendly_tb_fr" in key[1] for key in gettext._translations))
+print(modules_attributes.modules_attributes.data is not None)
+print(not hasattr(gc, "get_freeze_count") or gc.get_freeze_count() > 0)
+print(friendly_traceback.get_lang())
+"""
+
+
+def test_warmup():
+    result = subprocess.run(
+        [sys.executable, "-c", CODE],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        cwd=ROOT,
+    )
+    assert result.stdout.split() == [
+        "True",
+        "False",
+        "True",
+        "True",
+        "True",
+        "True",
+        "True",
+        "en",
+    ], result.stderr